@@ -28,7 +28,89 @@ import numpy as np
 from scipy.ndimage import distance_transform_edt
 
 import geoutils as gu
-from geoutils._typing import NDArrayNum
+from geoutils._typing import NDArrayBool, NDArrayNum
+
+
+def _get_proximity_sampling(
+    raster: gu.Raster, distance_unit: Literal["pixel"] | Literal["georeferenced"] = "georeferenced"
+) -> int | tuple[float | int, float | int]:
+    """
+    Get the sampling of the distance transform for a distance unit.
+
+    :param raster: Raster of the grid.
+    :param distance_unit: Distance unit, either 'georeferenced' or 'pixel'.
+
+    :return: Sampling of the distance transform.
+    """
+    if distance_unit.lower() == "georeferenced":
+        return raster.res
+    elif distance_unit.lower() == "pixel":
+        return 1
+    else:
+        raise ValueError('Distance unit must be either "georeferenced" or "pixel".')
+
+
+def _proximity_targets(raster: gu.Raster, target_values: list[float] | None = None) -> NDArrayBool:
+    """
+    Get the target pixels of a raster to compute the proximity to.
+
+    :param raster: Raster of target values.
+    :param target_values: List of target values to use for the proximity, defaults to all non-zero values.
+
+    :return: Mask of target pixels.
+    """
+    data = raster.get_nanarray()
+    # We mask target pixels
+    if target_values is not None:
+        return np.isin(data, target_values)
+    # Otherwise, all non-zero values are considered targets
+    return data.astype(bool)
+
+
+def _proximity_from_targets(
+    mask_boundary: NDArrayBool,
+    sampling: int | tuple[float | int, float | int],
+    max_distance: float | None = None,
+) -> NDArrayNum:
+    """
+    Compute the proximity distances to target pixels.
+
+    :param mask_boundary: Mask of target pixels.
+    :param sampling: Sampling of the distance transform.
+    :param max_distance: Maximum distance, above which distances are set to NaN.
+
+    :return: Array of proximity distances.
+    """
+    # If not all pixels are targets, then we compute the distance
+    non_targets = np.count_nonzero(mask_boundary)
+    if non_targets > 0:
+        proximity = distance_transform_edt(~mask_boundary, sampling=sampling)
+    # Otherwise, pass an array full of nodata
+    else:
+        proximity = np.ones(np.shape(mask_boundary)) * np.nan
+
+    if max_distance is not None:
+        proximity[proximity > max_distance] = np.nan
+
+    return proximity
+
+
+def _proximity_in_or_out(
+    proximity: NDArrayNum, mask_polygon: NDArrayBool, in_or_out: Literal["in"] | Literal["out"] | Literal["both"]
+) -> None:
+    """
+    Apply the in_or_out argument to optionally mask the proximity inside/outside of polygons, in place.
+
+    :param proximity: Array of proximity distances.
+    :param mask_polygon: Mask of the pixels inside polygons.
+    :param in_or_out: Compute proximity only 'in' or 'out'-side the geometry, or 'both'.
+    """
+    if in_or_out == "in":
+        proximity[~mask_polygon] = 0
+    elif in_or_out == "out":
+        proximity[mask_polygon] = 0
+    elif in_or_out != "both":
+        raise ValueError('The type of proximity must be one of "in", "out" or "both".')
 
 
 def _proximity_from_vector_or_raster(
@@ -38,6 +120,7 @@ def _proximity_from_vector_or_raster(
     geometry_type: str = "boundary",
     in_or_out: Literal["in"] | Literal["out"] | Literal["both"] = "both",
     distance_unit: Literal["pixel"] | Literal["georeferenced"] = "georeferenced",
+    max_distance: float | None = None,
 ) -> NDArrayNum:
     """
     (This function is defined here as mostly raster-based, but used in a class method for both Raster and Vector)
@@ -52,6 +135,7 @@ def _proximity_from_vector_or_raster(
     :param geometry_type: (Only with a Vector) Type of geometry to use for the proximity, defaults to 'boundary'.
     :param in_or_out: (Only with a Vector) Compute proximity only 'in' or 'out'-side the geometry, or 'both'.
     :param distance_unit: Distance unit, either 'georeferenced' or 'pixel'.
+    :param max_distance: Maximum distance (in distance unit), above which distances are set to nodata.
     """
 
     # 1/ First, if there is a vector input, we rasterize the geometry type
@@ -67,40 +151,19 @@ def _proximity_from_vector_or_raster(
         mask_boundary = gu.Vector(boundary_shp).create_mask(raster, as_array=True)
 
     else:
-        # We mask target pixels
-        if target_values is not None:
-            mask_boundary = np.logical_or.reduce([raster.get_nanarray() == target_val for target_val in target_values])
-        # Otherwise, all non-zero values are considered targets
-        else:
-            mask_boundary = raster.get_nanarray().astype(bool)
+        mask_boundary = _proximity_targets(raster, target_values)
 
     # 2/ Now, we compute the distance matrix relative to the masked geometry type
-    if distance_unit.lower() == "georeferenced":
-        sampling: int | tuple[float | int, float | int] = raster.res
-    elif distance_unit.lower() == "pixel":
-        sampling = 1
-    else:
-        raise ValueError('Distance unit must be either "georeferenced" or "pixel".')
-
-    # If not all pixels are targets, then we compute the distance
-    non_targets = np.count_nonzero(mask_boundary)
-    if non_targets > 0:
-        proximity = distance_transform_edt(~mask_boundary, sampling=sampling)
-    # Otherwise, pass an array full of nodata
-    else:
-        proximity = np.ones(np.shape(mask_boundary)) * np.nan
+    sampling = _get_proximity_sampling(raster, distance_unit)
+    proximity = _proximity_from_targets(mask_boundary, sampling, max_distance=max_distance)
 
     # 3/ If there was a vector input, apply the in_and_out argument to optionally mask inside/outside
-    if vector is not None:
-        if in_or_out == "both":
-            pass
-        elif in_or_out in ["in", "out"]:
-            mask_polygon = gu.Vector(vector.ds).create_mask(raster, as_array=True)
-            if in_or_out == "in":
-                proximity[~mask_polygon] = 0
-            else:
-                proximity[mask_polygon] = 0
+    if vector is not None and in_or_out != "both":
+        # The polygons are already rasterized if the full geometry is used
+        if geometry_type == "geometry":
+            mask_polygon = mask_boundary
         else:
-            raise ValueError('The type of proximity must be one of "in", "out" or "both".')
+            mask_polygon = gu.Vector(vector.ds).create_mask(raster, as_array=True)
+        _proximity_in_or_out(proximity, mask_polygon, in_or_out)
 
     return proximity
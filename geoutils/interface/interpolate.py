@@ -50,6 +50,128 @@ def _get_dist_nodata_spread(order: int, dist_nodata_spread: Literal["half_order_
     return dist_nodata_spread
 
 
+# Methods fitting a spline on the full grid, for which the value at a point depends (very weakly) on distant pixels
+_GLOBAL_SPLINE_METHODS = ["cubic", "quintic", "splinef2d"]
+# Additional halo of pixels for those methods, for which the influence of further pixels is below the tolerance of the
+# spline fit
+_GLOBAL_SPLINE_HALO = 32
+
+
+def _get_interp_halo(
+    method: Literal["nearest", "linear", "cubic", "quintic", "slinear", "pchip", "splinef2d"],
+    dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int,
+) -> int:
+    """
+    Get the halo of pixels around points needed to interpolate them from a window of the array only.
+
+    The halo covers the support of the interpolation method and the spreading distance of nodata.
+
+    :param method: Interpolation method.
+    :param dist_nodata_spread: Spreading distance of nodata, either half-order rounded up, rounded down, or fixed
+        integer.
+
+    :return: Halo in pixels.
+    """
+    order = method_to_order[method]
+    halo = order + _get_dist_nodata_spread(order=order, dist_nodata_spread=dist_nodata_spread) + 1
+    if method in _GLOBAL_SPLINE_METHODS:
+        halo += _GLOBAL_SPLINE_HALO
+    return halo
+
+
+def _dilate_nodata_mask(values: NDArrayNum, dist_nodata_spread: int) -> NDArrayNum:
+    """
+    Compute the nodata mask of an array dilated to a spreading distance.
+
+    :param values: Array with NaNs as nodata.
+    :param dist_nodata_spread: Spreading distance of nodata.
+
+    :return: Dilated nodata mask as uint8.
+    """
+    mask_nan = ~np.isfinite(values)
+    if dist_nodata_spread != 0:
+        return binary_dilation(mask_nan, iterations=dist_nodata_spread).astype("uint8")
+    # Zero iterations has a different behaviour in binary_dilation than doing nothing, we want the original array
+    else:
+        return mask_nan.astype("uint8")
+
+
+def _fill_nodata_nearest(values: NDArrayNum) -> NDArrayNum:
+    """
+    Replace nodata values of an array by their nearest valid neighbour.
+
+    Most interpolation methods (cubic, quintic, etc) do not support NaNs and require an array full of valid values, and
+    nearest neighbours give surrounding values of the same order of magnitude to minimize interpolation errors near
+    NaNs (errors of 10e-2/e-5 relative to the values).
+    Elegant solution from: https://stackoverflow.com/questions/5551286/filling-gaps-in-a-numpy-array for a fast
+    nearest neighbour fill.
+
+    :param values: Array with NaNs as nodata.
+
+    :return: Filled array.
+    """
+    mask_nan = ~np.isfinite(values)
+    if not np.any(mask_nan):
+        return values
+    indices = distance_transform_edt(mask_nan, return_distances=False, return_indices=True)
+    return values[tuple(indices)]
+
+
+class _InterpolationContext:
+    """
+    Interpolation state of an array, re-used when interpolating the same array at new points.
+
+    Holds the array with nodata filled by nearest neighbours, the nodata masks dilated for each spreading distance, and
+    the prepared interpolators (including spline coefficients) for each method and options. All are computed on first
+    use only.
+    """
+
+    def __init__(self, array: NDArrayNum):
+        """
+        Initialize the interpolation context.
+
+        :param array: Array with NaNs as nodata.
+        """
+        # If array is not a floating dtype (to support NaNs), convert dtype
+        if not np.issubdtype(array.dtype, np.floating):
+            array = array.astype(np.float32)
+        self.array = array
+        self._filled: NDArrayNum | None = None
+        self._dilated_masks: dict[int, NDArrayNum] = {}
+        self._interpolators: dict[tuple[Any, ...], Callable[[tuple[NDArrayNum, NDArrayNum]], NDArrayNum]] = {}
+
+    def get_nodata_state(self, dist_nodata_spread: int) -> tuple[NDArrayNum, NDArrayNum]:
+        """
+        Get the array with nodata filled by nearest neighbours, and the nodata mask dilated to a spreading distance.
+
+        :param dist_nodata_spread: Spreading distance of nodata.
+
+        :return: Filled array, dilated nodata mask.
+        """
+        if self._filled is None:
+            self._filled = _fill_nodata_nearest(self.array)
+        if dist_nodata_spread not in self._dilated_masks:
+            self._dilated_masks[dist_nodata_spread] = _dilate_nodata_mask(self.array, dist_nodata_spread)
+        return self._filled, self._dilated_masks[dist_nodata_spread]
+
+    def get_interpolator(
+        self,
+        key: tuple[Any, ...],
+        create_interpolator: Callable[[], Callable[[tuple[NDArrayNum, NDArrayNum]], NDArrayNum]],
+    ) -> Callable[[tuple[NDArrayNum, NDArrayNum]], NDArrayNum]:
+        """
+        Get a prepared interpolator, creating it on first use.
+
+        :param key: Key of the interpolator, describing its method and options.
+        :param create_interpolator: Function to create the interpolator.
+
+        :return: Interpolator.
+        """
+        if key not in self._interpolators:
+            self._interpolators[key] = create_interpolator()
+        return self._interpolators[key]
+
+
 def _interpn_interpolator(
     points: tuple[NDArrayNum, NDArrayNum],
     values: NDArrayNum,
@@ -57,6 +179,7 @@ def _interpn_interpolator(
     bounds_error: bool = False,
     dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int = "half_order_up",
     method: Literal["nearest", "linear", "cubic", "quintic", "slinear", "pchip", "splinef2d"] = "linear",
+    nodata_state: tuple[NDArrayNum, NDArrayNum] | None = None,
 ) -> Callable[[tuple[NDArrayNum, NDArrayNum]], NDArrayNum]:
     """
     Create SciPy interpolator with nodata spreading. Default is spreading at distance of half the method order
@@ -69,6 +192,8 @@ def _interpn_interpolator(
 
     For input arguments, see scipy.interpolate.RegularGridInterpolator.
     For additional argument "dist_nodata_spread", see description of Raster.interp_points.
+    For additional argument "nodata_state", the array with nodata filled and the dilated nodata mask can be passed if
+    already computed, see _InterpolationContext.
 
     Adapted from:
     https://github.com/scipy/scipy/blob/44e4ebaac992fde33f04638b99629d23973cb9b2/scipy/interpolate/_rgi.py#L743.
@@ -78,25 +203,14 @@ def _interpn_interpolator(
     order = method_to_order[method]
     d = _get_dist_nodata_spread(order=order, dist_nodata_spread=dist_nodata_spread)
 
-    # We compute the nodata mask and dilate it to the distance to spread nodatas
-    mask_nan = ~np.isfinite(values)
-    if d != 0:
-        new_mask = binary_dilation(mask_nan, iterations=d).astype("uint8")
-    # Zero iterations has a different behaviour in binary_dilation than doing nothing, we want the original array
-    else:
-        new_mask = mask_nan.astype("uint8")
+    # We fill nodata values by nearest neighbours, and compute the nodata mask dilated to the distance to spread nodatas
+    if nodata_state is None:
+        nodata_state = _fill_nodata_nearest(values), _dilate_nodata_mask(values, d)
+    values, new_mask = nodata_state
 
     # We create an interpolator for the nodata mask using nearest
     interp_mask = RegularGridInterpolator(points, new_mask, method="nearest", bounds_error=bounds_error, fill_value=1)
 
-    # Most methods (cubic, quintic, etc) do not support NaNs and require an array full of valid values
-    # We replace thus replace all NaN values by nearest neighbours to give surrounding values of the same order of
-    # magnitude and minimize interpolation errors near NaNs (errors of 10e-2/e-5 relative to the values)
-    # Elegant solution from: https://stackoverflow.com/questions/5551286/filling-gaps-in-a-numpy-array for a fast
-    # nearest neighbour fill
-    indices = distance_transform_edt(mask_nan, return_distances=False, return_indices=True)
-    values = values[tuple(indices)]
-
     # For the RegularGridInterpolator
     if method in RegularGridInterpolator._ALL_METHODS:
 
@@ -162,6 +276,7 @@ def _map_coordinates_nodata_propag(
     indices: tuple[NDArrayNum, NDArrayNum],
     order: int,
     dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int = "half_order_up",
+    nodata_state: tuple[NDArrayNum, NDArrayNum] | None = None,
     **kwargs: Any,
 ) -> NDArrayNum:
     """
@@ -172,23 +287,18 @@ def _map_coordinates_nodata_propag(
 
     For input arguments, see scipy.ndimage.map_coordinates.
     For additional argument "dist_nodata_spread", see description of Raster.interp_points.
+    For additional argument "nodata_state", the array with nodata filled and the dilated nodata mask can be passed if
+    already computed, see _InterpolationContext.
     """
 
     # Derive distance of nodata spreading
     d = _get_dist_nodata_spread(order=order, dist_nodata_spread=dist_nodata_spread)
 
-    # We compute the mask and dilate it to the distance to spread nodatas
-    mask_nan = ~np.isfinite(values)
-    if d != 0:
-        new_mask = binary_dilation(mask_nan, iterations=d).astype("uint8")
-    # Zero iterations has a different behaviour in binary_dilation than doing nothing, here we want the original array
-    else:
-        new_mask = mask_nan.astype("uint8")
-
-    # We replace all NaN values by nearest neighbours to minimize interpolation errors near NaNs
-    # Elegant solution from: https://stackoverflow.com/questions/5551286/filling-gaps-in-a-numpy-array
-    ind = distance_transform_edt(mask_nan, return_distances=False, return_indices=True)
-    values = values[tuple(ind)]
+    # We replace all NaN values by nearest neighbours to minimize interpolation errors near NaNs, and compute the mask
+    # dilated to the distance to spread nodatas
+    if nodata_state is None:
+        nodata_state = _fill_nodata_nearest(values), _dilate_nodata_mask(values, d)
+    values, new_mask = nodata_state
 
     # We interpolate the dilated array at the coordinates with nearest, and transform it back to a boolean to mask NaNs
     rmask = map_coordinates(new_mask, indices, order=0, cval=1, prefilter=False)
@@ -212,6 +322,7 @@ def _interp_points(
     dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int = "half_order_up",
     shift_area_or_point: bool | None = None,
     force_scipy_function: Literal["map_coordinates", "interpn"] | None = None,
+    context: _InterpolationContext | None = None,
     *,
     return_interpolator: Literal[False] = False,
     **kwargs: Any,
@@ -228,6 +339,7 @@ def _interp_points(
     dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int = "half_order_up",
     shift_area_or_point: bool | None = None,
     force_scipy_function: Literal["map_coordinates", "interpn"] | None = None,
+    context: _InterpolationContext | None = None,
     *,
     return_interpolator: Literal[True],
     **kwargs: Any,
@@ -244,6 +356,7 @@ def _interp_points(
     dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int = "half_order_up",
     shift_area_or_point: bool | None = None,
     force_scipy_function: Literal["map_coordinates", "interpn"] | None = None,
+    context: _InterpolationContext | None = None,
     *,
     return_interpolator: bool = False,
     **kwargs: Any,
@@ -259,11 +372,24 @@ def _interp_points(
     dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int = "half_order_up",
     shift_area_or_point: bool | None = None,
     force_scipy_function: Literal["map_coordinates", "interpn"] | None = None,
+    context: _InterpolationContext | None = None,
     return_interpolator: bool = False,
+    indices: tuple[NDArrayNum, NDArrayNum] | None = None,
     **kwargs: Any,
 ) -> NDArrayNum | Callable[[tuple[NDArrayNum, NDArrayNum]], NDArrayNum]:
-    """See description of Raster.interp_points."""
+    """
+    See description of Raster.interp_points.
+
+    If an interpolation context of the array is passed, its nodata-filled array, dilated nodata masks and prepared
+    interpolators are re-used, and only the evaluation at the points is computed.
+
+    If the row/column indexes of the points in the array are passed, they are used instead of converting the
+    coordinates of the points, for instance to interpolate a window with the indexes rounded on the full array.
+    """
 
+    # Re-use the array of the interpolation context
+    if context is not None:
+        array = context.array
     # If array is not a floating dtype (to support NaNs), convert dtype
     if not np.issubdtype(array.dtype, np.floating):
         array = array.astype(np.float32)
@@ -274,13 +400,14 @@ def _interp_points(
         if points is None:
             raise ValueError("Input 'points' cannot be None if 'return_interpolator' is False.")
         x, y = points
-        i, j = _xy2ij(x, y, transform=transform, area_or_point=area_or_point, shift_area_or_point=shift_area_or_point)
-
-        ind_invalid = np.vectorize(
-            lambda k1, k2: _outside_image(
-                k1, k2, transform=transform, area_or_point=area_or_point, shape=shape, index=True
+        if indices is None:
+            i, j = _xy2ij(
+                x, y, transform=transform, area_or_point=area_or_point, shift_area_or_point=shift_area_or_point
             )
-        )(j, i)
+        else:
+            i, j = indices
+
+        ind_invalid = _outside_image(j, i, transform=transform, area_or_point=area_or_point, shape=shape, index=True)
 
     # If the raster is on an equal grid, use scipy.ndimage.map_coordinates
     force_map_coords = force_scipy_function is not None and force_scipy_function == "map_coordinates"
@@ -304,8 +431,14 @@ def _interp_points(
             kwargs.update({"cval": np.nan})
 
         # Use map coordinates with nodata propagation
+        d = _get_dist_nodata_spread(order=order, dist_nodata_spread=dist_nodata_spread)
         rpoints = _map_coordinates_nodata_propag(
-            values=array, indices=(i, j), order=order, dist_nodata_spread=dist_nodata_spread, **kwargs
+            values=array,
+            indices=(i, j),
+            order=order,
+            dist_nodata_spread=d,
+            nodata_state=context.get_nodata_state(d) if context is not None else None,
+            **kwargs,
         )
 
     # Otherwise, use scipy.interpolate.interpn
@@ -327,14 +460,26 @@ def _interp_points(
             kwargs.update({"fill_value": np.nan})
 
         # Using direct coordinates, Y is the first axis, and we need to flip it
-        interpolator = _interpn_interpolator(
-            points=(np.flip(xycoords[1], axis=0), xycoords[0]),
-            values=array,
-            method=method,
-            dist_nodata_spread=dist_nodata_spread,
-            bounds_error=kwargs["bounds_error"],
-            fill_value=kwargs["fill_value"],
-        )
+        d = _get_dist_nodata_spread(order=method_to_order[method], dist_nodata_spread=dist_nodata_spread)
+
+        def create_interpolator() -> Callable[[tuple[NDArrayNum, NDArrayNum]], NDArrayNum]:
+            return _interpn_interpolator(
+                points=(np.flip(xycoords[1], axis=0), xycoords[0]),
+                values=array,
+                method=method,
+                dist_nodata_spread=d,
+                bounds_error=kwargs["bounds_error"],
+                fill_value=kwargs["fill_value"],
+                nodata_state=context.get_nodata_state(d) if context is not None else None,
+            )
+
+        # The prepared interpolator is re-used if it was already created with the same grid, method and options
+        if context is not None:
+            grid = (transform, xycoords[0][0], xycoords[1][0])
+            key = (method, d, kwargs["bounds_error"], str(kwargs["fill_value"]), *grid)
+            interpolator = context.get_interpolator(key, create_interpolator)
+        else:
+            interpolator = create_interpolator()
         if return_interpolator:
             return interpolator
         else:
@@ -20,7 +20,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Literal
+from typing import Callable, Iterable, Literal
 
 import affine
 import geopandas as gpd
@@ -259,3 +259,127 @@ def _raster_to_pointcloud(
         # This has the downside of converting all the data to the same data type
         points_arr = np.vstack((x_coords_2.reshape(1, -1), y_coords_2.reshape(1, -1), pixel_data)).T
         return points_arr
+
+
+# Reducers supporting an axis argument, applied to all windows at once instead of window by window
+_AXIS_REDUCERS = [
+    np.ma.mean,
+    np.ma.median,
+    np.ma.min,
+    np.ma.max,
+    np.ma.std,
+    np.ma.sum,
+    np.mean,
+    np.median,
+    np.min,
+    np.max,
+    np.std,
+    np.sum,
+    np.nanmean,
+    np.nanmedian,
+    np.nanmin,
+    np.nanmax,
+    np.nanstd,
+    np.nansum,
+]
+
+
+def _get_windows(array: NDArrayNum, rows: NDArrayNum, cols: NDArrayNum, size: int) -> NDArrayNum:
+    """
+    Gather square windows of a 2D array at once.
+
+    :param array: Array (possibly masked).
+    :param rows: Row of the upper-left pixel of each window, with the window inside the array.
+    :param cols: Column of the upper-left pixel of each window, with the window inside the array.
+    :param size: Size of the windows.
+
+    :return: Windows of shape (number of windows, size, size), masked if the array is masked.
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(np.ma.getdata(array), (size, size))[rows, cols]
+    if not np.ma.isMaskedArray(array):
+        return windows
+    mask = np.ma.getmask(array)
+    if mask is np.ma.nomask:
+        return np.ma.masked_array(windows)
+    return np.ma.masked_array(windows, mask=np.lib.stride_tricks.sliding_window_view(mask, (size, size))[rows, cols])
+
+
+def _read_windows(
+    filename: str,
+    rows: NDArrayNum,
+    cols: NDArrayNum,
+    size: int,
+    band: int,
+    nodata: int | float | None,
+    masked: bool,
+    boundless: bool,
+) -> tuple[NDArrayNum, NDArrayNum]:
+    """
+    Read square windows of a raster file, reading each block touched by the windows only once.
+
+    Windows are grouped by the block of the file containing their upper-left pixel, and a single window covering all
+    windows of a group is read. If reads are not boundless, windows extending beyond the file are skipped.
+
+    :param filename: Path to the raster file.
+    :param rows: Row of the upper-left pixel of each window in the file.
+    :param cols: Column of the upper-left pixel of each window in the file.
+    :param size: Size of the windows.
+    :param band: Band number to read (from 1 to the band count).
+    :param nodata: Value to fill windows beyond the file extent.
+    :param masked: Whether to read masked arrays.
+    :param boundless: Whether to allow windows that extend beyond the file extent.
+
+    :return: Indexes of windows read, windows of shape (number of windows read, size, size).
+    """
+    with rio.open(filename) as ds:
+        ind = np.arange(len(rows))
+        if not boundless:
+            ind = ind[(rows >= 0) & (cols >= 0) & (rows + size <= ds.height) & (cols + size <= ds.width)]
+        block_shape = ds.block_shapes[band - 1]
+
+        if len(ind) == 0:
+            return ind, np.zeros((0, size, size), dtype=ds.dtypes[band - 1])
+
+        # Group windows by block
+        cells = np.stack((rows[ind] // block_shape[0], cols[ind] // block_shape[1]))
+        _, groups = np.unique(cells, axis=1, return_inverse=True)
+        groups = groups.ravel()
+
+        list_ind, list_windows = [], []
+        for group in np.unique(groups):
+            ind_group = ind[groups == group]
+            rowmin, colmin = rows[ind_group].min(), cols[ind_group].min()
+            rowmax, colmax = rows[ind_group].max() + size, cols[ind_group].max() + size
+            data = ds.read(
+                window=rio.windows.Window(colmin, rowmin, colmax - colmin, rowmax - rowmin),
+                fill_value=nodata,
+                boundless=boundless,
+                masked=masked,
+                indexes=band,
+            )
+            list_ind.append(ind_group)
+            list_windows.append(_get_windows(data, rows[ind_group] - rowmin, cols[ind_group] - colmin, size))
+
+    # Restore the original order of windows
+    ind = np.concatenate(list_ind)
+    order = np.argsort(ind)
+    concatenate = np.ma.concatenate if masked else np.concatenate
+    return ind[order], concatenate(list_windows)[order]
+
+
+def _reduce_windows(windows: NDArrayNum, reducer_function: Callable[[NDArrayNum], float]) -> NDArrayNum:
+    """
+    Reduce the values in each window.
+
+    :param windows: Windows of shape (number of windows, size, size).
+    :param reducer_function: Reducer function to apply to the values of each window.
+
+    :return: Reduced value of each window.
+    """
+    flat = windows.reshape(windows.shape[0], windows.shape[1] * windows.shape[2])
+    # Use a full mask, as the output dtype of masked reducers depends on whether the mask is set
+    if np.ma.isMaskedArray(flat):
+        flat = np.ma.masked_array(flat, mask=np.ma.getmaskarray(flat))
+    if reducer_function in _AXIS_REDUCERS:
+        return reducer_function(flat, axis=1)
+    return np.array([reducer_function(w) for w in flat])
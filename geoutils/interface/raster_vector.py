@@ -27,63 +27,120 @@ import affine
 import geopandas as gpd
 import numpy as np
 import rasterio as rio
+import shapely
 from rasterio import features, warp
 from rasterio.crs import CRS
 from rasterio.features import shapes
+from shapely.geometry import box
 
 import geoutils as gu
-from geoutils._typing import NDArrayBool, NDArrayNum, Number
-
-
-def _polygonize(
-    source_raster: gu.Raster,
+from geoutils._typing import DTypeLike, NDArrayBool, NDArrayNum, Number
+from geoutils.raster.distributed_computing.multiproc import (
+    MultiprocConfig,
+    _multiproc_polygonize,
+    _multiproc_rasterize,
+)
+from geoutils.raster.tiling import compute_tiling
+from geoutils.stats import (
+    _ORDER_STATISTICS,
+    _get_grouped_stats_dict,
+    _grouped_moments,
+    _grouped_order_statistics,
+)
+
+
+def _polygonize_selection(
+    data: NDArrayNum,
     target_values: Number | tuple[Number, Number] | list[Number] | NDArrayNum | Literal["all"],
-    data_column_name: str,
-) -> gu.Vector:
-    """Polygonize a raster. See Raster.polygonize() for details."""
+) -> NDArrayBool:
+    """
+    Select the pixels to polygonize, comparing the data to the target values only once.
+
+    :param data: Masked array of the raster.
+    :param target_values: Value or range of values of the raster from which to create geometries.
 
+    :returns: Selected pixels, as a masked array except for a sequence of values or all valid values.
+    """
     # Mask a unique value set by a number
     if isinstance(target_values, (int, float, np.integer, np.floating)):
-        if np.sum(source_raster.data == target_values) == 0:
-            raise ValueError(f"no pixel with in_value {target_values}")
-
-        bool_msk = np.array(source_raster.data == target_values).astype(np.uint8)
+        return data == target_values
 
     # Mask values within boundaries set by a tuple
     elif isinstance(target_values, tuple):
-        if np.sum((source_raster.data > target_values[0]) & (source_raster.data < target_values[1])) == 0:
-            raise ValueError(f"no pixel with in_value between {target_values[0]} and {target_values[1]}")
-
-        bool_msk = ((source_raster.data > target_values[0]) & (source_raster.data < target_values[1])).astype(np.uint8)
+        return (data > target_values[0]) & (data < target_values[1])
 
     # Mask specific values set by a sequence
     elif isinstance(target_values, list) or isinstance(target_values, np.ndarray):
-        if np.sum(np.isin(source_raster.data, np.array(target_values))) == 0:
-            raise ValueError("no pixel with in_value " + ", ".join(map("{}".format, target_values)))
-
-        bool_msk = np.isin(source_raster.data, np.array(target_values)).astype("uint8")
+        return np.isin(data, np.array(target_values))
 
     # Mask all valid values
-    elif target_values == "all":
+    elif isinstance(target_values, str) and target_values == "all":
         # Using getmaskarray is necessary in case .data.mask is nomask (False)
-        bool_msk = (~np.ma.getmaskarray(source_raster.data)).astype("uint8")
+        return ~np.ma.getmaskarray(data)
 
     else:
         raise ValueError("in_value must be a number, a tuple or a sequence")
 
-    # GeoPandas.from_features() only supports certain dtypes, we find the best common dtype to optimize memory usage
+
+def _polygonize_count(selection: NDArrayBool) -> int:
+    """Count the valid pixels selected to polygonize."""
+
+    count = np.sum(selection)
+    return 0 if count is np.ma.masked else int(count)
+
+
+def _polygonize_no_pixel_message(
+    target_values: Number | tuple[Number, Number] | list[Number] | NDArrayNum | Literal["all"],
+) -> str:
+    """Get the error message when no pixel is found for the target values."""
+
+    if isinstance(target_values, tuple):
+        return f"no pixel with in_value between {target_values[0]} and {target_values[1]}"
+    elif isinstance(target_values, list) or isinstance(target_values, np.ndarray):
+        return "no pixel with in_value " + ", ".join(map("{}".format, target_values))
+    return f"no pixel with in_value {target_values}"
+
+
+def _polygonize_dtype(dtype: DTypeLike) -> str:
+    """
+    Get the best data type to polygonize a raster, as GeoPandas.from_features() only supports certain data types.
+
+    :param dtype: Data type of the raster.
+
+    :returns: Smallest supported data type in which the raster data type can be promoted.
+    """
     # TODO: this should be a function independent of polygonize, reused in several places
     gpd_dtypes = ["uint8", "uint16", "int16", "int32", "float32"]
     list_common_dtype_index = []
     for gpd_type in gpd_dtypes:
-        polygonize_dtype = np.promote_types(gpd_type, source_raster.dtype)
+        polygonize_dtype = np.promote_types(gpd_type, dtype)
         if str(polygonize_dtype) in gpd_dtypes:
             list_common_dtype_index.append(gpd_dtypes.index(gpd_type))
     if len(list_common_dtype_index) == 0:
-        final_dtype = "float32"
-    else:
-        final_dtype_index = min(list_common_dtype_index)
-        final_dtype = gpd_dtypes[final_dtype_index]
+        return "float32"
+    return gpd_dtypes[min(list_common_dtype_index)]
+
+
+def _polygonize(
+    source_raster: gu.Raster,
+    target_values: Number | tuple[Number, Number] | list[Number] | NDArrayNum | Literal["all"],
+    data_column_name: str,
+    multiproc_config: MultiprocConfig | None = None,
+) -> gu.Vector:
+    """Polygonize a raster. See Raster.polygonize() for details."""
+
+    # Polygonize tile by tile, writing features to a file
+    if multiproc_config is not None:
+        return _multiproc_polygonize(source_raster, target_values, data_column_name, multiproc_config)
+
+    # Compare the data to the target values only once
+    selection = _polygonize_selection(source_raster.data, target_values)
+    if not isinstance(target_values, str) and _polygonize_count(selection) == 0:
+        raise ValueError(_polygonize_no_pixel_message(target_values))
+    bool_msk = np.array(selection).astype("uint8")
+
+    # GeoPandas.from_features() only supports certain dtypes, we find the best common dtype to optimize memory usage
+    final_dtype = _polygonize_dtype(source_raster.dtype)
 
     results = (
         {"properties": {"raster_value": v}, "geometry": s}
@@ -100,6 +157,118 @@ def _polygonize(
     return gu.Vector(gdf)
 
 
+# Size of the output grid (in pixels, along each dimension) above which features are burned tile by tile
+_RASTERIZE_TILE_SIZE = 4096
+
+
+def _select_features(
+    gdf: gpd.GeoDataFrame, bounds: tuple[float, float, float, float], crs: CRS | None
+) -> NDArrayNum | None:
+    """
+    Select the features that may intersect bounds, using the spatial index of the features.
+
+    The bounds are transformed into the CRS of the features, to avoid reprojecting features outside of them.
+
+    :param gdf: Features to select from.
+    :param bounds: Bounds (left, bottom, right, top) in the CRS "crs".
+    :param crs: CRS of the bounds.
+
+    :returns: Sorted indexes of the selected features, or None if all features have to be kept.
+    """
+    if len(gdf) == 0 or gdf.crs is None or crs is None:
+        return None
+    left, bottom, right, top = warp.transform_bounds(crs, gdf.crs, *bounds)
+    # Bounds crossing the antimeridian in the CRS of the features are not supported by the spatial index
+    if not np.all(np.isfinite([left, bottom, right, top])) or left > right or bottom > top:
+        return None
+    return np.sort(gdf.sindex.query(box(left, bottom, right, top)))
+
+
+def _burn_features_window(
+    geoms: gpd.GeoSeries,
+    values: NDArrayNum | Number,
+    window: rio.windows.Window,
+    transform: affine.Affine,
+    fill: Number,
+    dtype: DTypeLike,
+) -> NDArrayNum:
+    """
+    Burn features in a window of a grid, with only the features intersecting the window.
+
+    :param geoms: Geometries of the features, in the CRS of the grid.
+    :param values: Value to burn for each feature, or a single value for all features.
+    :param window: Window of the grid.
+    :param transform: Geotransform of the grid.
+    :param fill: Value outside the features.
+    :param dtype: Data type of the output.
+
+    :returns: Array of the window.
+    """
+    out_shape = (int(window.height), int(window.width))
+    ind = geoms.sindex.query(box(*rio.windows.bounds(window, transform)))
+    if len(ind) == 0:
+        return np.full(out_shape, fill, dtype=dtype)
+    ind = np.sort(ind)
+    if isinstance(values, np.ndarray):
+        out_geoms: Iterable[Any] = zip(geoms.values[ind], values[ind])
+        default_value: Number = 1
+    else:
+        out_geoms, default_value = geoms.values[ind], values
+    return features.rasterize(
+        shapes=out_geoms,
+        fill=fill,
+        out_shape=out_shape,
+        transform=rio.windows.transform(window, transform),
+        default_value=default_value,
+        dtype=dtype,
+    )
+
+
+def _burn_features(
+    geoms: gpd.GeoSeries,
+    values: NDArrayNum | Number,
+    out_shape: tuple[int, int],
+    transform: affine.Affine,
+    fill: Number,
+    dtype: DTypeLike | None = None,
+) -> NDArrayNum:
+    """
+    Burn features on a grid. For large grids, features are burned tile by tile with only the features intersecting
+    each tile.
+
+    :param geoms: Geometries of the features, in the CRS of the grid.
+    :param values: Value to burn for each feature, or a single value for all features.
+    :param out_shape: Shape of the grid.
+    :param transform: Geotransform of the grid.
+    :param fill: Value outside the features.
+    :param dtype: Data type of the output, defaults to that derived by Rasterio from the values.
+
+    :returns: Array of the grid.
+    """
+    if max(out_shape) <= _RASTERIZE_TILE_SIZE:
+        if isinstance(values, np.ndarray):
+            return features.rasterize(
+                shapes=zip(geoms.values, values), fill=fill, out_shape=out_shape, transform=transform, dtype=dtype
+            )
+        return features.rasterize(
+            shapes=geoms.values,
+            fill=fill,
+            out_shape=out_shape,
+            transform=transform,
+            default_value=values,
+            dtype=dtype,
+        )
+
+    # For tiles, the data type has to be the same for all, so we use that of the values
+    if dtype is None:
+        dtype = np.asarray(values).dtype
+    out = np.empty(out_shape, dtype=dtype)
+    for rowmin, rowmax, colmin, colmax in compute_tiling(_RASTERIZE_TILE_SIZE, out_shape, out_shape).reshape(-1, 4):
+        window = rio.windows.Window(col_off=colmin, row_off=rowmin, width=colmax - colmin, height=rowmax - rowmin)
+        out[rowmin:rowmax, colmin:colmax] = _burn_features_window(geoms, values, window, transform, fill, dtype)
+    return out
+
+
 def _rasterize(
     gdf: gpd.GeoDataFrame,
     raster: gu.Raster | None = None,
@@ -109,6 +278,7 @@ def _rasterize(
     bounds: tuple[float, float, float, float] | None = None,
     in_value: int | float | Iterable[int | float] | None = None,
     out_value: int | float = 0,
+    multiproc_config: MultiprocConfig | None = None,
 ) -> gu.Raster:
     if (raster is not None) and (crs is not None):
         raise ValueError("Only one of raster or crs can be provided.")
@@ -121,6 +291,37 @@ def _rasterize(
     if raster is not None:
         crs = raster.crs  # type: ignore
 
+    # Set default burn value, index from 1 to len(self.ds)
+    if in_value is None:
+        in_value = gdf.index + 1
+
+    # Check burn values
+    if isinstance(in_value, Iterable):
+        if len(in_value) != len(gdf.geometry):  # type: ignore
+            raise ValueError(
+                "in_value must have same length as self.ds.geometry, currently {} != {}".format(
+                    len(in_value), len(gdf.geometry)  # type: ignore
+                )
+            )
+        values: NDArrayNum | Number = np.asarray(in_value)
+    elif isinstance(in_value, int | float | np.floating | np.integer):
+        values = in_value
+    else:
+        raise ValueError("in_value must be a single number or an iterable with same length as self.ds.geometry")
+
+    # If the output bounds are known, reproject only the features that may intersect them
+    out_bounds = raster.bounds if raster is not None else bounds
+    dtype = None
+    if out_bounds is not None:
+        ind = _select_features(gdf, out_bounds, crs)
+        if ind is not None:
+            # Without any feature left, keep the data type derived from the values of all features
+            if len(ind) == 0 and len(gdf) > 0:
+                dtype = np.asarray(values).dtype
+            gdf = gdf.iloc[ind]
+            if isinstance(values, np.ndarray):
+                values = values[ind]
+
     vect = gdf.to_crs(crs)
 
     # If no raster given, now use provided dimensions
@@ -155,32 +356,21 @@ def _rasterize(
         out_shape = raster.shape  # type: ignore
         transform = raster.transform  # type: ignore
 
-    # Set default burn value, index from 1 to len(self.ds)
-    if in_value is None:
-        in_value = gdf.index + 1
+    # We return a mask if there is a single value to burn and this value is 1
+    is_mask = isinstance(in_value, (int, np.integer, float, np.floating)) and in_value == 1
+
+    # Burn geometries tile by tile directly into a file, without loading the output
+    if multiproc_config is not None:
+        if dtype is None:
+            dtype = np.dtype("uint8") if is_mask else np.asarray(values).dtype
+        return _multiproc_rasterize(
+            vect.geometry, values, out_shape, transform, crs, fill=out_value, dtype=dtype, config=multiproc_config
+        )
 
     # Rasterize geometry
-    if isinstance(in_value, Iterable):
-        if len(in_value) != len(vect.geometry):  # type: ignore
-            raise ValueError(
-                "in_value must have same length as self.ds.geometry, currently {} != {}".format(
-                    len(in_value), len(vect.geometry)  # type: ignore
-                )
-            )
-
-        out_geom = ((geom, value) for geom, value in zip(vect.geometry, in_value))
+    mask = _burn_features(vect.geometry, values, out_shape=out_shape, transform=transform, fill=out_value, dtype=dtype)
 
-        mask = features.rasterize(shapes=out_geom, fill=out_value, out_shape=out_shape, transform=transform)
-
-    elif isinstance(in_value, int | float | np.floating | np.integer):
-        mask = features.rasterize(
-            shapes=vect.geometry, fill=out_value, out_shape=out_shape, transform=transform, default_value=in_value
-        )
-    else:
-        raise ValueError("in_value must be a single number or an iterable with same length as self.ds.geometry")
-
-    # We return a mask if there is a single value to burn and this value is 1
-    if isinstance(in_value, (int, np.integer, float, np.floating)) and in_value == 1:
+    if is_mask:
         output = gu.Mask.from_array(data=mask, transform=transform, crs=crs, nodata=None)
 
     # Otherwise we return a Raster if there are several values to burn
@@ -199,7 +389,8 @@ def _create_mask(
     bounds: tuple[float, float, float, float] | None = None,
     buffer: int | float | np.integer[Any] | np.floating[Any] = 0,
     as_array: bool = False,
-) -> tuple[NDArrayBool, affine.Affine, CRS]:
+    multiproc_config: MultiprocConfig | None = None,
+) -> tuple[NDArrayBool | gu.Raster, affine.Affine, CRS]:
 
     # If no raster given, use provided dimensions
     if raster is None:
@@ -244,32 +435,147 @@ def _create_mask(
     else:
         raise TypeError("Raster must be a geoutils.Raster or None.")
 
-    # Copying GeoPandas dataframe before applying changes
-    gdf = gdf.copy()
+    if not isinstance(buffer, (int, float, np.number)):
+        raise TypeError(f"Buffer must be a number, currently set to {type(buffer).__name__}.")
 
-    # Crop vector geometries to avoid issues when reprojecting
+    # Select only features intersecting the bounds (extended by the buffer) to avoid issues when reprojecting, using
+    # the spatial index of the features
     left, bottom, right, top = bounds  # type: ignore
-    x1, y1, x2, y2 = warp.transform_bounds(crs, gdf.crs, left, bottom, right, top)
-    gdf = gdf.cx[x1:x2, y1:y2]
+    extend = max(buffer, 0)
+    ind = _select_features(gdf, (left - extend, bottom - extend, right + extend, top + extend), crs)
+    if ind is not None:
+        gdf = gdf.iloc[ind]
 
     # Reproject vector into raster CRS
-    gdf = gdf.to_crs(crs)
+    geoms = gdf.geometry.to_crs(crs)
 
-    # Create a buffer around the features
-    if not isinstance(buffer, (int, float, np.number)):
-        raise TypeError(f"Buffer must be a number, currently set to {type(buffer).__name__}.")
+    # Create a buffer around the features, for all geometries at once (with the same resolution as GeoPandas)
     if buffer != 0:
-        gdf.geometry = [geom.buffer(buffer) for geom in gdf.geometry]
-    elif buffer == 0:
-        pass
+        geoms = gpd.GeoSeries(
+            shapely.buffer(np.asarray(geoms.values), buffer, quad_segs=16), index=geoms.index, crs=geoms.crs
+        )
+
+    # Burn geometries tile by tile directly into a file, without loading the output
+    if multiproc_config is not None:
+        mask_raster = _multiproc_rasterize(
+            geoms, 1, out_shape, transform, crs, fill=0, dtype="uint8", config=multiproc_config
+        )
+        return mask_raster, transform, crs
 
     # Rasterize geometry
-    mask = features.rasterize(
-        shapes=gdf.geometry, fill=0, out_shape=out_shape, transform=transform, default_value=1, dtype="uint8"
-    ).astype("bool")
+    mask = _burn_features(geoms, 1, out_shape=out_shape, transform=transform, fill=0, dtype="uint8").astype("bool")
 
     # Force output mask to be of same dimension as input raster
     if raster is not None:
         mask = mask.reshape((raster.count, raster.height, raster.width))  # type: ignore
 
     return mask, transform, crs
+
+
+def _zonal_layers(gdf: gpd.GeoDataFrame) -> NDArrayNum:
+    """
+    Assign features to layers in which no features overlap, so that overlapping features can be rasterized separately.
+
+    Features touching only by their boundaries are not considered overlapping.
+
+    :param gdf: Features to assign.
+
+    :returns: Layer of each feature, starting from 0.
+    """
+    layers = np.zeros(len(gdf), dtype=np.int64)
+    geoms = np.asarray(gdf.geometry.values)
+
+    # Pairs of features whose interiors intersect
+    ind1, ind2 = gdf.sindex.query(geoms, predicate="intersects")
+    valid = ind1 < ind2
+    ind1, ind2 = ind1[valid], ind2[valid]
+    overlap = shapely.relate_pattern(geoms[ind1], geoms[ind2], "T********")
+    ind1, ind2 = ind1[overlap], ind2[overlap]
+    if len(ind1) == 0:
+        return layers
+
+    # Greedy coloring of the features that overlap a previous feature, in order
+    order = np.argsort(ind2, kind="stable")
+    ind1, ind2 = ind1[order], ind2[order]
+    unique_ind2, starts = np.unique(ind2, return_index=True)
+    for k, previous in zip(unique_ind2, np.split(ind1, starts[1:])):
+        used = set(layers[previous].tolist())
+        layers[k] = next(layer for layer in range(len(used) + 1) if layer not in used)
+
+    return layers
+
+
+def _zonal_labels(gdf: gpd.GeoDataFrame, raster: gu.Raster, labels: NDArrayNum | None = None) -> NDArrayNum:
+    """
+    Rasterize features on the grid of a raster into arrays of integer labels, 0 being outside any feature.
+
+    Overlapping features are rasterized in different layers, so that each feature is attributed all pixels whose center
+    it covers.
+
+    :param gdf: Features to rasterize.
+    :param raster: Raster of the grid to rasterize on.
+    :param labels: Label of each feature, defaults to 1 to the number of features.
+
+    :returns: Array of labels of shape (number of layers, height, width).
+    """
+    if labels is None:
+        labels = np.arange(1, len(gdf) + 1)
+    if len(gdf) == 0:
+        return np.zeros((1, *raster.shape), dtype=np.int64)
+    labels = np.asarray(labels)
+    layers = _zonal_layers(gdf)
+    list_labels = []
+    for layer in range(layers.max() + 1):
+        in_layer = layers == layer
+        labels_raster = _rasterize(gdf[in_layer], raster=raster, in_value=labels[in_layer], out_value=0)
+        list_labels.append(np.asarray(np.ma.getdata(labels_raster.data), dtype=np.int64).reshape(raster.shape))
+    return np.stack(list_labels)
+
+
+def _zonal_block(
+    data: NDArrayNum, labels: NDArrayNum, nb_labels: int, values_per_label: bool = False
+) -> tuple[dict[str, NDArrayNum], NDArrayNum, tuple[NDArrayNum, NDArrayNum] | None]:
+    """
+    Compute the moments and counts per label of a block of data, and optionally extract its valid values per label.
+
+    :param data: Masked array of the block.
+    :param labels: Arrays of labels of the block for each layer of features, 0 being outside any feature.
+    :param nb_labels: Number of labels.
+    :param values_per_label: Whether to return the valid values and their labels, for order statistics.
+
+    :returns: Moments per label, total count per label, and valid values and their labels (if requested).
+    """
+    data = data.squeeze()
+    labels = labels.reshape(-1, *data.shape)
+    total_count = np.bincount(labels.ravel(), minlength=nb_labels + 1)
+    in_zone = np.logical_and(~np.ma.getmaskarray(data), labels > 0)
+    values = np.broadcast_to(np.ma.getdata(data), labels.shape)[in_zone].astype(np.float64)
+    labels_values = labels[in_zone]
+    moments = _grouped_moments(values, labels_values, nb_labels + 1)
+
+    return moments, total_count, (values, labels_values) if values_per_label else None
+
+
+def _zonal_stats(
+    source_raster: gu.Raster,
+    vector: gu.Vector | gpd.GeoDataFrame,
+    stats_names: list[str] | None = None,
+    band: int = 1,
+) -> dict[str, NDArrayNum]:
+    """Compute statistics of a raster in each feature of a vector. See Raster.zonal_stats() for details."""
+
+    gdf = vector.ds if isinstance(vector, gu.Vector) else vector
+    nb_labels = len(gdf)
+
+    # Rasterize all features at once into labels, and compute all statistics per label in a single pass
+    labels = _zonal_labels(gdf, source_raster)
+    data = source_raster._get_band_data(band)
+    order_names = [n for n in _ORDER_STATISTICS if stats_names is None or n in stats_names]
+    moments, total_count, values_labels = _zonal_block(data, labels, nb_labels, values_per_label=len(order_names) > 0)
+    order_stats = (
+        _grouped_order_statistics(*values_labels, nb_labels + 1, order_names) if values_labels is not None else {}
+    )
+
+    # Remove the label 0 outside features
+    stats_dict = _get_grouped_stats_dict(moments, order_stats, total_count)
+    return {name: stat[1:] for name, stat in stats_dict.items()}
@@ -24,12 +24,13 @@ from __future__ import annotations
 
 import warnings
 from math import ceil, floor
-from typing import Iterable, Literal
+from typing import Iterable, Literal, overload
 
 import geopandas as gpd
 import numpy as np
 import pyproj
 import rasterio as rio
+import shapely
 import shapely.geometry
 import shapely.ops
 from rasterio.crs import CRS
@@ -130,51 +131,114 @@ def _get_utm_ups_crs(df: gpd.GeoDataFrame, method: Literal["centroid"] | Literal
     return crs
 
 
+def _bounds_to_array(
+    bounds_list: (
+        Iterable[list[float] | tuple[float] | rio.coords.BoundingBox | rio.io.DatasetReader | gpd.GeoDataFrame]
+        | NDArrayNum
+    ),
+) -> NDArrayNum:
+    """
+    Convert a list of geometries with bounds into an array of bounds.
+
+    :param bounds_list: Array of bounds of shape (N, 4), or list of geometries with bounds, i.e. list of coordinates
+        (xmin, ymin, xmax, ymax), rasterio bounds, a rasterio Dataset (or Raster), a geopandas object (or Vector).
+
+    :returns: Array of bounds (xmin, ymin, xmax, ymax) of shape (N, 4).
+    """
+    if isinstance(bounds_list, np.ndarray):
+        return bounds_list.reshape(-1, 4).astype(np.float64, copy=False)
+
+    bounds_array = []
+    for bounds in bounds_list:
+        # If a GeoPandas or Vector object (warning, has both total_bounds and bounds attributes)
+        if hasattr(bounds, "total_bounds"):
+            bounds_array.append(bounds.total_bounds)
+        # If a rasterio or Raster object
+        elif hasattr(bounds, "bounds"):
+            bounds_array.append(bounds.bounds)
+        # If a list of coordinates
+        elif isinstance(bounds, (list, tuple, np.ndarray)):
+            bounds_array.append(bounds)
+        else:
+            raise ValueError(
+                "bounds_list must be a list of lists/tuples of coordinates or an object with attributes bounds "
+                "or total_bounds."
+            )
+
+    return np.array(bounds_array, dtype=np.float64).reshape(-1, 4)
+
+
+@overload
 def bounds2poly(
     bounds_geom: list[float] | rio.io.DatasetReader,
     in_crs: CRS | None = None,
     out_crs: CRS | None = None,
-) -> Polygon:
+) -> Polygon: ...
+
+
+@overload
+def bounds2poly(
+    bounds_geom: NDArrayNum,
+    in_crs: CRS | None = None,
+    out_crs: CRS | None = None,
+) -> Polygon | NDArrayNum: ...
+
+
+def bounds2poly(
+    bounds_geom: list[float] | rio.io.DatasetReader | NDArrayNum,
+    in_crs: CRS | None = None,
+    out_crs: CRS | None = None,
+) -> Polygon | NDArrayNum:
     """
     Converts self's bounds into a shapely Polygon. Optionally, returns it into a different CRS.
 
+    For an array of bounds of shape (N, 4), the polygons are created and reprojected at once, and returned as an
+    array of shapely geometries.
+
     :param bounds_geom: A geometry with bounds. Can be either a list of coordinates (xmin, ymin, xmax, ymax),\
-            a rasterio/Raster object, a geoPandas/Vector object
+            a rasterio/Raster object, a geoPandas/Vector object, or an array of bounds of shape (N, 4)
     :param in_crs: Input CRS
     :param out_crs: Output CRS
 
-    :returns: Output polygon
+    :returns: Output polygon, or array of polygons for an array of bounds of shape (N, 4)
     """
     # If boundsGeom is a GeoPandas or Vector object (warning, has both total_bounds and bounds attributes)
     if hasattr(bounds_geom, "total_bounds"):
-        xmin, ymin, xmax, ymax = bounds_geom.total_bounds  # type: ignore
+        bounds = np.array(bounds_geom.total_bounds, dtype=np.float64)  # type: ignore
         in_crs = bounds_geom.crs  # type: ignore
     # If boundsGeom is a rasterio or Raster object
     elif hasattr(bounds_geom, "bounds"):
-        xmin, ymin, xmax, ymax = bounds_geom.bounds  # type: ignore
+        bounds = np.array(bounds_geom.bounds, dtype=np.float64)  # type: ignore
         in_crs = bounds_geom.crs  # type: ignore
-    # if a list of coordinates
-    elif isinstance(bounds_geom, (list, tuple)):
-        xmin, ymin, xmax, ymax = bounds_geom
+    # If a list of coordinates, or an array of bounds
+    elif isinstance(bounds_geom, (list, tuple, np.ndarray)):
+        bounds = np.array(bounds_geom, dtype=np.float64)
     else:
         raise ValueError(
             "boundsGeom must a list/tuple of coordinates or an object with attributes bounds or total_bounds."
         )
 
-    corners = np.array([(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)])
+    # Corners of each bounds, of shape (N, 4, 2)
+    xmin, ymin, xmax, ymax = bounds.reshape(-1, 4).T
+    corners = np.stack([np.stack([xmin, xmax, xmax, xmin], axis=-1), np.stack([ymin, ymin, ymax, ymax], axis=-1)], -1)
 
     if (in_crs is not None) & (out_crs is not None):
-        corners = np.transpose(reproject_points(np.transpose(corners), in_crs, out_crs))
+        xout, yout = reproject_points([corners[..., 0].ravel(), corners[..., 1].ravel()], in_crs, out_crs)
+        corners = np.stack([np.reshape(xout, corners.shape[:2]), np.reshape(yout, corners.shape[:2])], axis=-1)
 
-    bbox = Polygon(corners)
+    polys = shapely.polygons(corners)
 
-    return bbox
+    # Return a single polygon, except for an array of bounds
+    if bounds.ndim == 2:
+        return polys
+    return polys[0]
 
 
 def merge_bounds(
-    bounds_list: Iterable[
-        list[float] | tuple[float] | rio.coords.BoundingBox | rio.io.DatasetReader | gpd.GeoDataFrame
-    ],
+    bounds_list: (
+        Iterable[list[float] | tuple[float] | rio.coords.BoundingBox | rio.io.DatasetReader | gpd.GeoDataFrame]
+        | NDArrayNum
+    ),
     resolution: float | None = None,
     merging_algorithm: str = "union",
     return_rio_bbox: bool = False,
@@ -182,8 +246,12 @@ def merge_bounds(
     """
     Merge a list of bounds into single bounds, using either the union or intersection.
 
+    The union and intersection of bounds are the minimum and maximum of their coordinates, computed at once on the
+    array of all bounds. An intersection that is void returns NaN bounds.
+
     :param bounds_list: List of geometries with bounds, i.e. list of coordinates (xmin, ymin, xmax, ymax),
-        rasterio bounds, a rasterio Dataset (or Raster), a geopandas object (or Vector).
+        rasterio bounds, a rasterio Dataset (or Raster), a geopandas object (or Vector), or array of bounds of shape
+        (N, 4).
     :param resolution: (For Rasters) Resolution, to make sure extent is a multiple of it.
     :param merging_algorithm: Algorithm to use for merging, either "union" or "intersection".
     :param return_rio_bbox: Whether to return a rio.coords.BoundingBox object instead of a tuple.
@@ -191,30 +259,23 @@ def merge_bounds(
     :returns: Output bounds (xmin, ymin, xmax, ymax) or empty tuple
     """
     # Check that bounds_list is a list of bounds objects
-    assert isinstance(bounds_list, (list, tuple)), "bounds_list must be a list/tuple"
-
-    for bounds in bounds_list:
-        assert hasattr(bounds, "bounds") or hasattr(bounds, "total_bounds") or isinstance(bounds, (list, tuple)), (
-            "bounds_list must be a list of lists/tuples of coordinates or an object with attributes bounds "
-            "or total_bounds"
-        )
+    assert isinstance(bounds_list, (list, tuple, np.ndarray)), "bounds_list must be a list/tuple or an array"
 
-    output_poly = bounds2poly(bounds_geom=bounds_list[0])
+    bounds = _bounds_to_array(bounds_list)
 
     # Compute the merging
-    for boundsGeom in bounds_list[1:]:
-        new_poly = bounds2poly(boundsGeom)
-
-        if merging_algorithm == "union":
-            output_poly = output_poly.union(new_poly)
-        elif merging_algorithm == "intersection":
-            output_poly = output_poly.intersection(new_poly)
-        else:
-            raise ValueError("merging_algorithm must be 'union' or 'intersection'")
+    if merging_algorithm == "union":
+        new_bounds = np.concatenate([bounds[:, :2].min(axis=0), bounds[:, 2:].max(axis=0)])
+    elif merging_algorithm == "intersection":
+        new_bounds = np.concatenate([bounds[:, :2].max(axis=0), bounds[:, 2:].min(axis=0)])
+        # A void intersection has NaN bounds, as an empty geometry
+        if np.any(new_bounds[:2] > new_bounds[2:]):
+            new_bounds[:] = np.nan
+    else:
+        raise ValueError("merging_algorithm must be 'union' or 'intersection'")
 
-    # Get merged bounds, write as dict to manipulate with resolution in the next step
-    new_bounds = output_poly.bounds
-    rio_bounds = {"left": new_bounds[0], "bottom": new_bounds[1], "right": new_bounds[2], "top": new_bounds[3]}
+    # Write as dict to manipulate with resolution in the next step
+    rio_bounds = dict(zip(("left", "bottom", "right", "top"), new_bounds.tolist()))
 
     # Make sure that extent is a multiple of resolution
     if resolution is not None:
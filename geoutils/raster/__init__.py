@@ -18,6 +18,7 @@
 
 from geoutils.raster.raster import Raster, RasterType, Mask, handled_array_funcs  # noqa isort:skip
 from geoutils.raster.array import *  # noqa
+from geoutils.raster.collection import RasterCollection  # noqa
 from geoutils.raster.distributed_computing import *  # noqa
 from geoutils.raster.georeferencing import *  # noqa
 from geoutils.raster.geotransformations import *  # noqa
@@ -0,0 +1,305 @@
+# Copyright (c) 2025 GeoUtils developers
+#
+# This file is part of the GeoUtils project:
+# https://github.com/glaciohack/geoutils
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collection of raster files with a spatial index of their footprints."""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Iterable
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import rasterio as rio
+import shapely
+from pyproj import CRS
+from shapely.geometry.base import BaseGeometry
+
+import geoutils as gu
+from geoutils._typing import NDArrayNum
+
+# Columns of the affine transform of each raster in the catalog
+_TRANSFORM_COLUMNS = ["transform_a", "transform_b", "transform_c", "transform_d", "transform_e", "transform_f"]
+
+
+def _read_raster_metadata(path: str) -> dict[str, Any]:
+    """
+    Read the metadata of a raster file, without reading its data.
+
+    :param path: Path to the raster file.
+
+    :return: Metadata of the raster, as a row of the catalog of a collection (without footprint).
+    """
+    with rio.open(path) as ds:
+        metadata = {
+            "path": str(path),
+            "crs": ds.crs.to_wkt() if ds.crs is not None else None,
+            "width": ds.width,
+            "height": ds.height,
+            "count": ds.count,
+            "dtype": ds.dtypes[0],
+            "has_nodata": ds.nodata is not None,
+            "nodata": ds.nodata if ds.nodata is not None else np.nan,
+            "area_or_point": ds.tags().get("AREA_OR_POINT", None),
+        }
+        metadata.update(dict(zip(_TRANSFORM_COLUMNS, tuple(ds.transform)[:6])))
+    return metadata
+
+
+def _get_footprints_projected(
+    bounds: NDArrayNum, crs: Iterable[str], out_crs: CRS, densify_points: int = 100
+) -> NDArrayNum:
+    """
+    Get footprints of many bounds projected in a common CRS, reprojecting all bounds of the same CRS at once.
+
+    :param bounds: Array of bounds (left, bottom, right, top) of shape (N, 4).
+    :param crs: CRS of each bounds, as WKT strings.
+    :param out_crs: CRS of the footprints.
+    :param densify_points: Number of points added on each side of the footprints to account for nonlinear edges.
+
+    :return: Array of footprint polygons.
+    """
+    boxes = shapely.box(*bounds.T)
+    max_lengths = np.maximum(bounds[:, 2] - bounds[:, 0], bounds[:, 3] - bounds[:, 1]) / densify_points
+    boxes = shapely.segmentize(boxes, max_lengths)
+
+    footprints = np.empty(len(boxes), dtype=object)
+    crs = np.asarray(list(crs), dtype=object)
+    for crs_wkt in np.unique(crs):
+        ind = np.flatnonzero(crs == crs_wkt)
+        footprints[ind] = gpd.GeoSeries(boxes[ind], crs=crs_wkt).to_crs(out_crs).values
+    return footprints
+
+
+class RasterCollection:
+    """
+    Collection of raster files, with their metadata cached in a catalog and a spatial index of their footprints in a
+    common CRS.
+
+    Queries of the rasters intersecting bounds or geometries only use the spatial index, and the metadata of rasters
+    is read from the catalog, without opening any file. The catalog can be saved to a vector file, for instance a
+    GeoParquet, to build it only once for a large number of files.
+    """
+
+    def __init__(self, catalog: gpd.GeoDataFrame) -> None:
+        """
+        Instantiate a collection from its catalog.
+
+        Use RasterCollection.from_paths() to create a collection from raster files, or RasterCollection.from_file()
+        to read a saved catalog.
+
+        :param catalog: Catalog of the rasters, with one row per raster containing its path, metadata, and footprint
+            in the CRS of the catalog as geometry.
+        """
+        self._catalog = catalog.reset_index(drop=True)
+
+    @classmethod
+    def from_paths(
+        cls,
+        paths: Iterable[str],
+        crs: CRS | int | str | None = None,
+        densify_points: int = 100,
+        workers: int | None = None,
+    ) -> RasterCollection:
+        """
+        Create a collection from raster files, reading only their metadata.
+
+        :param paths: Paths to the raster files.
+        :param crs: Common CRS of the footprints. Defaults to the CRS of the first raster.
+        :param densify_points: Number of points added on each side of the footprints to account for nonlinear edges
+            when reprojecting them.
+        :param workers: Number of threads reading the metadata of files concurrently (see Raster.open_many()).
+
+        :return: Collection of the rasters.
+        """
+        catalog = gu.Raster.open_many(paths, workers=workers, metadata_only=True)
+        if len(catalog) == 0:
+            raise ValueError("At least one raster path must be provided.")
+        if catalog["crs"].isna().any():
+            raise ValueError("All rasters of a collection must have a CRS.")
+
+        crs = CRS.from_user_input(crs) if crs is not None else CRS.from_wkt(catalog["crs"].iloc[0])
+        bounds = cls._bounds_from_catalog(catalog)
+        footprints = _get_footprints_projected(bounds, catalog["crs"], crs, densify_points=densify_points)
+
+        return cls(gpd.GeoDataFrame(catalog, geometry=footprints, crs=crs))
+
+    @classmethod
+    def from_file(cls, filename: str | os.PathLike) -> RasterCollection:  # type: ignore
+        """
+        Read a collection from a saved catalog.
+
+        :param filename: Path to the catalog, as a GeoParquet (extension ".parquet") or any vector file.
+
+        :return: Collection of the rasters.
+        """
+        if str(filename).endswith(".parquet"):
+            catalog = gpd.read_parquet(filename)
+        else:
+            catalog = gpd.read_file(filename)
+        return cls(catalog)
+
+    def save(self, filename: str | os.PathLike) -> None:  # type: ignore
+        """
+        Save the catalog of the collection. The spatial index is rebuilt from the footprints when reading it.
+
+        :param filename: Path to the catalog, as a GeoParquet (extension ".parquet", requires pyarrow) or any vector
+            file supported by GeoPandas.
+        """
+        if str(filename).endswith(".parquet"):
+            self._catalog.to_parquet(filename)
+        else:
+            self._catalog.to_file(filename)
+
+    def __len__(self) -> int:
+        """Number of rasters in the collection."""
+        return len(self._catalog)
+
+    def __getitem__(self, index: int) -> gu.Raster:
+        """Get a raster of the collection, not loaded, from its metadata in the catalog without opening the file."""
+        metadata = self.get_metadata(index)
+        return gu.Raster._from_disk_metadata(metadata.pop("path"), **metadata)
+
+    def __repr__(self) -> str:
+        """Representation of the collection."""
+        return f"RasterCollection(count={len(self)}, crs={self.crs.to_string()}, bounds={self.bounds})"
+
+    @property
+    def catalog(self) -> gpd.GeoDataFrame:
+        """Catalog of the rasters, with their path, metadata, and footprint in the CRS of the collection."""
+        return self._catalog
+
+    @property
+    def crs(self) -> CRS:
+        """Common CRS of the footprints of the collection."""
+        return self._catalog.crs
+
+    @property
+    def paths(self) -> list[str]:
+        """Paths of the rasters of the collection."""
+        return list(self._catalog["path"])
+
+    @property
+    def footprints(self) -> gpd.GeoSeries:
+        """Footprints of the rasters, in the CRS of the collection."""
+        return self._catalog.geometry
+
+    @property
+    def bounds(self) -> rio.coords.BoundingBox:
+        """Bounds of all footprints, in the CRS of the collection."""
+        return rio.coords.BoundingBox(*self._catalog.total_bounds)
+
+    @staticmethod
+    def _bounds_from_catalog(catalog: pd.DataFrame) -> NDArrayNum:
+        """Get the bounds of the rasters in their own CRS from their transform and shape."""
+        a, b, c, d, e, f = (catalog[col].to_numpy(dtype=np.float64) for col in _TRANSFORM_COLUMNS)
+        width, height = catalog["width"].to_numpy(), catalog["height"].to_numpy()
+        x = np.stack([c, c + a * width, c + b * height, c + a * width + b * height])
+        y = np.stack([f, f + d * width, f + e * height, f + d * width + e * height])
+        return np.stack([x.min(axis=0), y.min(axis=0), x.max(axis=0), y.max(axis=0)], axis=1)
+
+    def get_metadata(self, index: int) -> dict[str, Any]:
+        """
+        Get the metadata of a raster of the collection, from the catalog.
+
+        :param index: Index of the raster.
+
+        :return: Dictionary of the path, CRS, transform, shape, count, data type, nodata and pixel interpretation of
+            the raster.
+        """
+        row = self._catalog.iloc[index]
+        # Catalogs saved before the pixel interpretation was added do not have it
+        area_or_point = row.get("area_or_point", None)
+        return {
+            "path": row["path"],
+            "crs": CRS.from_wkt(row["crs"]),
+            "transform": rio.Affine(*(row[col] for col in _TRANSFORM_COLUMNS)),
+            "shape": (int(row["height"]), int(row["width"])),
+            "count": int(row["count"]),
+            "dtype": row["dtype"],
+            "nodata": row["nodata"] if row["has_nodata"] else None,
+            "area_or_point": area_or_point if isinstance(area_or_point, str) else None,
+        }
+
+    def get_bounds(self) -> NDArrayNum:
+        """
+        Get the bounds of each raster in its own CRS, from the catalog.
+
+        :return: Array of bounds (left, bottom, right, top) of shape (N, 4).
+        """
+        return self._bounds_from_catalog(self._catalog)
+
+    def get_bounds_projected(self, out_crs: CRS, densify_points: int = 5000) -> NDArrayNum:
+        """
+        Get the bounds of each raster projected in a CRS, from the catalog, as Raster.get_bounds_projected().
+
+        :param out_crs: Output CRS.
+        :param densify_points: Maximum points to be added between image corners to account for non linear edges.
+
+        :return: Array of bounds (left, bottom, right, top) of shape (N, 4).
+        """
+        out_crs = CRS.from_user_input(out_crs)
+        bounds = self.get_bounds()
+        shape_max = np.maximum(self._catalog["width"].to_numpy(), self._catalog["height"].to_numpy())
+        crs = self._catalog["crs"].to_numpy()
+        for crs_wkt in np.unique(crs):
+            if CRS.from_wkt(crs_wkt) == out_crs:
+                continue
+            for i in np.flatnonzero(crs == crs_wkt):
+                bounds[i] = rio.warp.transform_bounds(
+                    CRS.from_wkt(crs_wkt), out_crs, *bounds[i], densify_pts=min(shape_max[i], densify_points)
+                )
+        return bounds
+
+    def query(
+        self,
+        geometry: (
+            BaseGeometry | gu.Vector | gpd.GeoDataFrame | gpd.GeoSeries | rio.coords.BoundingBox | Iterable[float]
+        ),
+        crs: CRS | int | str | None = None,
+        predicate: str = "intersects",
+    ) -> RasterCollection:
+        """
+        Get the rasters of the collection whose footprint intersects a geometry, using the spatial index.
+
+        :param geometry: Bounds (left, bottom, right, top), geometry, or vector to query.
+        :param crs: CRS of the bounds or geometry, defaults to the CRS of the collection. Not used for a vector.
+        :param predicate: Spatial predicate of the query (see geopandas.sindex.query), defaults to "intersects".
+
+        :return: Collection of the rasters matching the query, in their order in this collection.
+        """
+        if isinstance(geometry, gu.Vector):
+            geometry = geometry.ds
+        if isinstance(geometry, (gpd.GeoDataFrame, gpd.GeoSeries)):
+            geoms = geometry.to_crs(self.crs).geometry.values
+        else:
+            if not isinstance(geometry, BaseGeometry):
+                geometry = shapely.box(*geometry)
+            geoms = gpd.GeoSeries([geometry], crs=crs if crs is not None else self.crs).to_crs(self.crs).values
+
+        ind = np.unique(self._catalog.sindex.query(geoms, predicate=predicate)[1])
+        return RasterCollection(self._catalog.iloc[ind])
+
+    def to_rasters(self) -> list[gu.Raster]:
+        """
+        Get the rasters of the collection, not loaded, from their metadata in the catalog without opening any file.
+
+        :return: List of rasters.
+        """
+        return [self[i] for i in range(len(self))]
@@ -18,32 +18,63 @@
 
 """This module defines the cluster configurations."""
 
+import concurrent.futures
 import multiprocessing
+import threading
+import weakref
 from multiprocessing.pool import Pool
 from typing import Any, Callable, Dict, List, Optional
 
 
+def warm_worker() -> None:
+    """
+    Worker initializer that imports GeoUtils and its dependencies, and registers GDAL drivers once per worker.
+
+    This avoids paying this cost on the first task of each worker, especially for workers started with a "spawn" or
+    "forkserver" context.
+    """
+    import rasterio as rio
+
+    import geoutils  # noqa: F401
+
+    # GDAL drivers are registered when entering an environment
+    with rio.Env():
+        pass
+
+
 class ClusterGenerator:
-    def __new__(cls, name: str, nb_workers: int = 2) -> "AbstractCluster":  # type: ignore
+    def __new__(cls, name: str, nb_workers: int = 2, **kwargs: Any) -> "AbstractCluster":  # type: ignore
         """
         Factory method to create different types of clusters based on the name argument.
         - If 'basic' is provided, a BasicCluster is instantiated.
+        - If 'futures' is provided, a FuturesCluster (concurrent.futures process pool) is created with the given number
+          of workers.
+        - If 'threads' is provided, a ThreadCluster (concurrent.futures thread pool) is created with the given number
+          of workers.
         - Otherwise, an MpCluster (multiprocessing) is created with the given number of workers.
+
+        Additional keyword arguments are passed to the configuration of the cluster (e.g., "context", "initializer",
+        "maxtasksperchild").
         """
         if name == "basic":
             cluster: AbstractCluster = BasicCluster()
+        elif name == "futures":
+            cluster = FuturesCluster(conf={"nb_workers": nb_workers, **kwargs})
+        elif name == "threads":
+            cluster = ThreadCluster(conf={"nb_workers": nb_workers, **kwargs})
         else:
-            cluster = MpCluster(conf={"nb_workers": nb_workers})
+            cluster = MpCluster(conf={"nb_workers": nb_workers, **kwargs})
         return cluster
 
 
 class AbstractCluster:
     def __init__(self) -> None:
         """
-        Base class for clusters. Initializes the pool attribute.
+        Base class for clusters. Initializes the pool attribute and number of workers.
         Meant to be subclassed and extended.
         """
         self.pool: Optional[Pool] = None
+        self.nb_workers = 1
 
     def __enter__(self) -> "AbstractCluster":
         """Context manager entry point, returning the cluster instance."""
@@ -75,6 +106,22 @@ class AbstractCluster:
         """
         return future
 
+    def is_ready(self, future: Any) -> bool:
+        """
+        Check if a launched task is completed, without blocking. Meant to be subclassed.
+        :param future: The future object representing the result of an asynchronous task.
+        """
+        return True
+
+    def wait_any(self, futures: List[Any]) -> List[Any]:
+        """
+        Block until at least one of the launched tasks is completed. Meant to be subclassed.
+        :param futures: The future objects representing the results of asynchronous tasks.
+
+        :return: The future objects of completed tasks, in the same order.
+        """
+        return list(futures)
+
     def return_wrapper(self) -> None:
         """Wrapper for returned values, should be customized in subclasses if needed."""
         raise NotImplementedError("This method should be implemented by subclasses.")
@@ -102,16 +149,26 @@ class MpCluster(AbstractCluster):
     def __init__(self, conf: Optional[Dict[str, Any]] = None) -> None:
         """
         Initializes a multiprocessing cluster.
-        :param conf: Configuration dictionary, which may contain the number of workers.
+        :param conf: Configuration dictionary, which may contain the number of workers ("nb_workers"), the start
+            method context ("context", defaults to "fork"), a worker initializer and its arguments ("initializer",
+            "initargs") and the number of tasks after which workers are recycled ("maxtasksperchild", defaults to
+            None for persistent workers).
         """
         super().__init__()
-        nb_workers = 1
-        if conf is not None:
-            nb_workers = conf.get("nb_workers", 1)
-        # Using the 'forkserver' context for more controlled process handling
-        ctx_in_main = multiprocessing.get_context("fork")
-        # Create a pool of workers with max 10 tasks per child process
-        self.pool = ctx_in_main.Pool(processes=nb_workers, maxtasksperchild=10)
+        if conf is None:
+            conf = {}
+        self.nb_workers = conf.get("nb_workers", 1)
+        ctx_in_main = multiprocessing.get_context(conf.get("context", "fork"))
+        # Create a pool of workers, persistent by default to avoid re-importing dependencies in new processes
+        self.pool = ctx_in_main.Pool(
+            processes=self.nb_workers,
+            initializer=conf.get("initializer"),
+            initargs=conf.get("initargs", ()),
+            maxtasksperchild=conf.get("maxtasksperchild"),
+        )
+        # Completion events of launched tasks, set by result callbacks to wait on tasks without polling
+        self._done_events: weakref.WeakKeyDictionary[Any, threading.Event] = weakref.WeakKeyDictionary()
+        self._done_condition = threading.Condition()
 
     def close(self) -> None:
         """Closes the multiprocessing pool by terminating and joining workers."""
@@ -135,10 +192,137 @@ class MpCluster(AbstractCluster):
         if kwargs is None:
             kwargs = {}
         if self.pool is not None:
-            return self.pool.apply_async(fun, args=args, kwds=kwargs)
+            done = threading.Event()
+            future = self.pool.apply_async(
+                fun,
+                args=args,
+                kwds=kwargs,
+                callback=lambda _: self._set_done(done),
+                error_callback=lambda _: self._set_done(done),
+            )
+            self._done_events[future] = done
+            return future
+
+    def _set_done(self, done: threading.Event) -> None:
+        """Mark a task as completed and wake up threads waiting on tasks, called from the result handler thread."""
+        with self._done_condition:
+            done.set()
+            self._done_condition.notify_all()
 
     def get_res(self, future: Any) -> Any:
         """
         Retrieves the result of a completed asynchronous task.
         """
         return future.get(timeout=5000)
+
+    def is_ready(self, future: Any) -> bool:
+        """
+        Checks if an asynchronous task is completed.
+        """
+        return bool(future.ready())
+
+    def wait_any(self, futures: List[Any]) -> List[Any]:
+        """
+        Block until at least one of the asynchronous tasks is completed.
+
+        :return: The future objects of completed tasks, in the same order.
+        """
+        with self._done_condition:
+            while True:
+                ready = [f for f in futures if f not in self._done_events or self._done_events[f].is_set()]
+                if len(ready) > 0:
+                    return ready
+                self._done_condition.wait()
+
+
+class FuturesCluster(AbstractCluster):
+    def __init__(self, conf: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initializes a cluster based on a process pool of concurrent.futures.
+        :param conf: Configuration dictionary, which may contain the number of workers ("nb_workers"), the start
+            method context ("context", defaults to "spawn" to be safe alongside GDAL threads), a worker initializer
+            and its arguments ("initializer", "initargs", defaults to warming up workers with warm_worker()) and the
+            number of tasks after which workers are recycled ("maxtasksperchild", defaults to None for persistent
+            workers, not supported with "fork").
+        """
+        super().__init__()
+        if conf is None:
+            conf = {}
+        self.nb_workers = conf.get("nb_workers", 1)
+        executor_kwargs: Dict[str, Any] = {}
+        if conf.get("maxtasksperchild") is not None:
+            executor_kwargs["max_tasks_per_child"] = conf["maxtasksperchild"]
+        self.executor: Optional[concurrent.futures.Executor] = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.nb_workers,
+            mp_context=multiprocessing.get_context(conf.get("context", "spawn")),
+            initializer=conf.get("initializer", warm_worker),
+            initargs=conf.get("initargs", ()),
+            **executor_kwargs,
+        )
+
+    def close(self) -> None:
+        """Shuts down the pool, cancelling pending tasks."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def launch_task(
+        self, fun: Callable[..., Any], args: Optional[List[Any]] = None, kwargs: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Launches a task asynchronously in the pool.
+        :param fun: The function to execute in parallel.
+        :param args: The positional arguments for the function.
+        :param kwargs: The keyword arguments for the function.
+
+        :return: an asynchronous result (future object).
+        """
+        if args is None:
+            args = []
+        if kwargs is None:
+            kwargs = {}
+        if self.executor is not None:
+            return self.executor.submit(fun, *args, **kwargs)
+
+    def get_res(self, future: Any) -> Any:
+        """
+        Retrieves the result of a completed asynchronous task.
+        """
+        return future.result(timeout=5000)
+
+    def is_ready(self, future: Any) -> bool:
+        """
+        Checks if an asynchronous task is completed.
+        """
+        return bool(future.done())
+
+    def wait_any(self, futures: List[Any]) -> List[Any]:
+        """
+        Block until at least one of the asynchronous tasks is completed.
+
+        :return: The future objects of completed tasks, in the same order.
+        """
+        done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+        return [f for f in futures if f in done]
+
+
+class ThreadCluster(FuturesCluster):
+    def __init__(self, conf: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initializes a cluster based on a thread pool of concurrent.futures.
+
+        Threads share memory with no communication cost, and run in parallel for tasks releasing the GIL, such as
+        most of rasterio reading, writing and reprojection, or SciPy filters and interpolation. Each thread keeps its
+        own cache of opened rasterio datasets.
+
+        :param conf: Configuration dictionary, which may contain the number of workers ("nb_workers") and a worker
+            initializer and its arguments ("initializer", "initargs").
+        """
+        AbstractCluster.__init__(self)
+        if conf is None:
+            conf = {}
+        self.nb_workers = conf.get("nb_workers", 1)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.nb_workers,
+            initializer=conf.get("initializer"),
+            initargs=conf.get("initargs", ()),
+        )
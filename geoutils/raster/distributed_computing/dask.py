@@ -22,6 +22,8 @@ Module for dask-delayed functions for out-of-memory raster operations.
 
 from __future__ import annotations
 
+import os
+import threading
 import warnings
 from typing import Any, Literal
 
@@ -29,10 +31,11 @@ import dask.array as da
 import dask.delayed
 import numpy as np
 import rasterio as rio
+from dask.base import tokenize
 from dask.utils import cached_cumsum
 from scipy.interpolate import interpn
 
-from geoutils._typing import NDArrayBool, NDArrayNum
+from geoutils._typing import DTypeLike, MArrayNum, NDArrayBool, NDArrayNum
 from geoutils.raster.distributed_computing.chunked import (
     _build_geotiling_and_meta,
     _reproject_per_block,
@@ -522,3 +525,99 @@ def delayed_reproject(
     concat_all = da.concatenate(concat_columns, axis=0)
 
     return concat_all
+
+
+# 4/ READ AND WRITE
+# Raster files are read lazily by windows for each chunk, and written by windows for each computed chunk
+
+
+class _RasterioWindowReader:
+    """Array-like object reading windows of a raster file, to build a dask array with dask.array.from_array."""
+
+    def __init__(self, filename: str, bands: tuple[int, ...], shape: tuple[int, ...], dtype: DTypeLike):
+        """
+        :param filename: Path to the raster file.
+        :param bands: Band indexes to read.
+        :param shape: Shape of the array, 2D for single band or 3D for multi-band.
+        :param dtype: Data type of the raster file.
+        """
+        self.filename = filename
+        self.bands = bands
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self.ndim = len(shape)
+
+    def __getitem__(self, key: tuple[slice, ...]) -> MArrayNum:
+        """Read the window of the array corresponding to the slices as a masked array."""
+        # Import here to avoid circular import with the multiprocessing module
+        from geoutils.raster.distributed_computing.multiproc import _open_dataset_cached
+
+        *band_key, row_key, col_key = key
+        window = rio.windows.Window.from_slices(row_key, col_key, height=self.shape[-2], width=self.shape[-1])
+        indexes = list(self.bands[band_key[0]]) if band_key else self.bands[0]
+
+        return _open_dataset_cached(self.filename).read(indexes=indexes, window=window, masked=True)
+
+
+def delayed_read(
+    filename: str,
+    chunks: tuple[int, int],
+    bands: tuple[int, ...] | None = None,
+) -> da.Array:
+    """
+    Read a raster file lazily into a masked dask array, with a windowed read of the file for each chunk.
+
+    Values equal to the nodata value of the file are masked.
+
+    :param filename: Path to the raster file.
+    :param chunks: Chunk sizes (rows, columns). All bands are read in the same chunk.
+    :param bands: Band indexes to read. Defaults to all bands.
+
+    :return: Masked dask array of the raster, 2D for single band or 3D for multi-band.
+    """
+    with rio.open(filename) as ds:
+        if bands is None:
+            bands = ds.indexes
+        dtype = ds.dtypes[bands[0] - 1]
+        shape: tuple[int, ...] = (ds.height, ds.width) if len(bands) == 1 else (len(bands), ds.height, ds.width)
+        mtime = os.path.getmtime(filename)
+
+    chunks_all = chunks if len(shape) == 2 else (len(bands), *chunks)
+    reader = _RasterioWindowReader(filename, bands=tuple(bands), shape=shape, dtype=dtype)
+
+    # The name identifies the chunks of the file for Dask, without hashing the reader object
+    name = "read-raster-" + tokenize(filename, mtime, bands, chunks_all)
+    meta = np.ma.masked_array(np.empty((0,) * len(shape), dtype=dtype))
+
+    return da.from_array(reader, chunks=chunks_all, name=name, asarray=False, fancy=False, meta=meta)
+
+
+class _RasterioWindowWriter:
+    """Array-like target writing windows to a raster file, to store a dask array with dask.array.store."""
+
+    def __init__(self, dataset: rio.io.DatasetWriter):
+        """
+        :param dataset: Dataset opened for writing.
+        """
+        self.dataset = dataset
+
+    def __setitem__(self, key: tuple[slice, ...], value: NDArrayNum) -> None:
+        """Write the array to the window of the file corresponding to the slices."""
+        *band_key, row_key, col_key = key
+        window = rio.windows.Window.from_slices(row_key, col_key)
+        indexes = list(self.dataset.indexes[band_key[0]]) if band_key else 1
+
+        self.dataset.write(value, indexes=indexes, window=window)
+
+
+def delayed_write(darr: da.Array, dataset: rio.io.DatasetWriter) -> None:
+    """
+    Compute and write a dask array to a raster file, chunk by chunk.
+
+    Only the chunks being computed are held in memory, and writes are serialized with a lock as a dataset cannot be
+    written concurrently.
+
+    :param darr: Dask array to write, 2D for single band or 3D for multi-band (with masked values already filled).
+    :param dataset: Dataset opened for writing, with the same shape as the array.
+    """
+    da.store(darr, _RasterioWindowWriter(dataset), lock=threading.Lock())
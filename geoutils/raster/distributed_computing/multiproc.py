@@ -17,18 +17,31 @@
 # limitations under the License.
 
 """Process out-of-memory calculations"""
+
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 import tempfile
-from typing import Any, Callable, Literal, overload
+import threading
+import warnings
+from typing import Any, Callable, Iterable, Iterator, Literal, overload
 
+import geopandas as gpd
 import numpy as np
 import rasterio as rio
+import shapely
 from rasterio._io import Resampling
+from rasterio.features import shapes
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from shapely.geometry import box
+from tqdm import tqdm
 
 import geoutils as gu
-from geoutils._typing import DTypeLike, NDArrayNum
+from geoutils._typing import DTypeLike, NDArrayNum, Number
+from geoutils.interface.interpolate import _get_interp_halo, _interp_points
 from geoutils.raster.distributed_computing.chunked import (
     _build_geotiling_and_meta,
     _chunks2d_from_chunksizes_shape,
@@ -38,7 +51,28 @@ from geoutils.raster.distributed_computing.cluster import (
     AbstractCluster,
     ClusterGenerator,
 )
-from geoutils.raster.tiling import compute_tiling
+from geoutils.raster.georeferencing import _outside_image, _xy2ij
+from geoutils.raster.tiling import (
+    _get_block_offset,
+    _get_block_shape,
+    compute_tile_shape,
+    compute_tiling,
+)
+from geoutils.stats import (
+    _ORDER_STATISTICS,
+    _get_grouped_stats_dict,
+    _get_histogram,
+    _get_stats_dict,
+    _get_values_in_bins,
+    _grouped_order_statistics,
+    _interpolate_percentile,
+    _locate_ranks,
+    _merge_grouped_moments,
+    _merge_values_in_bins,
+    _percentile_ranks,
+    _select_ranks,
+    _StatsAccumulator,
+)
 
 
 class MultiprocConfig:
@@ -51,15 +85,29 @@ class MultiprocConfig:
     """
 
     def __init__(
-        self, chunk_size: int, outfile: str | None = None, driver: str = "GTiff", cluster: AbstractCluster | None = None
+        self,
+        chunk_size: int | Literal["auto"],
+        outfile: str | None = None,
+        driver: str = "GTiff",
+        cluster: AbstractCluster | None = None,
+        max_in_flight: int | None = None,
+        batch_size: int = 1,
+        memory_budget: int = 2**27,
     ):
         """
         Initialize the MultiprocConfig instance with multiprocessing settings.
 
-        :param chunk_size: The size of the chunks for splitting raster data.
+        :param chunk_size: The size of the chunks for splitting raster data. If "auto", the chunk shape is adapted to
+            the memory budget, data type, band count and overlap depth, and aligned with the internal block layout of
+            the raster file.
         :param outfile: The file path where the output will be written.
         :param driver: Driver to write file with.
         :param cluster: A cluster object for distributed computing, or None for sequential processing.
+        :param max_in_flight: Maximum number of tasks launched on the cluster and not yet retrieved, which bounds the
+            memory usage to about this number of tiles. Defaults to twice the number of workers of the cluster.
+        :param batch_size: Number of tiles grouped in a single task of the cluster, to reduce the overhead of
+            launching tasks for many small tiles. Tasks in flight are counted in batches.
+        :param memory_budget: Memory budget per chunk (in bytes) if the chunk size is "auto", defaults to 128 MiB.
         """
         self.chunk_size = chunk_size
         if outfile is None:
@@ -73,19 +121,205 @@ class MultiprocConfig:
             cluster = ClusterGenerator("basic")  # type: ignore
         assert isinstance(cluster, AbstractCluster)  # for mypy
         self.cluster = cluster
+        if max_in_flight is None:
+            max_in_flight = 2 * cluster.nb_workers
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self.memory_budget = memory_budget
 
     def copy(self) -> MultiprocConfig:
-        return MultiprocConfig(chunk_size=self.chunk_size, outfile=self.outfile, cluster=self.cluster)
+        return MultiprocConfig(
+            chunk_size=self.chunk_size,
+            outfile=self.outfile,
+            driver=self.driver,
+            cluster=self.cluster,
+            max_in_flight=self.max_in_flight,
+            batch_size=self.batch_size,
+            memory_budget=self.memory_budget,
+        )
+
 
+class _RasterTile:
+    """
+    Lightweight and picklable description of a raster tile, to send to workers instead of the full raster.
 
-def _load_raster_tile(raster_unload: gu.Raster, tile: NDArrayNum) -> gu.Raster:
+    If the raster is not loaded, the tile only describes the window to read on disk, which each worker reads itself.
+    Otherwise, the tile carries only the subset of the array in memory.
+    """
+
+    def __init__(
+        self,
+        transform: rio.Affine,
+        crs: rio.CRS,
+        nodata: int | float | None,
+        area_or_point: Literal["Area", "Point"] | None,
+        raster_shape: tuple[int, int],
+        filename: str | None = None,
+        bands: list[int] | None = None,
+        window: rio.windows.Window | None = None,
+        data: NDArrayNum | None = None,
+    ):
+        """
+        Initialize the raster tile description.
+
+        :param transform: Geotransform of the tile.
+        :param crs: Coordinate reference system of the raster.
+        :param nodata: Nodata value of the raster.
+        :param area_or_point: Pixel interpretation of the raster.
+        :param raster_shape: Shape (height, width) of the full raster the tile is extracted from.
+        :param filename: Path of the raster file on disk to read the tile from (if data is not passed).
+        :param bands: Band indexes to read on disk.
+        :param window: Window of the tile on disk.
+        :param data: Array of the tile (if not read from disk).
+        """
+        self.transform = transform
+        self.crs = crs
+        self.nodata = nodata
+        self.area_or_point = area_or_point
+        self.raster_shape = raster_shape
+        self.filename = filename
+        self.bands = bands
+        self.window = window
+        self.data = data
+
+    def load(self) -> gu.Raster:
+        """Load the tile as a raster, reading only its window on disk if data is not in memory."""
+
+        if self.data is not None:
+            data = self.data
+        else:
+            assert self.filename is not None  # For mypy
+            dataset = _open_dataset_cached(self.filename)
+            data = dataset.read(indexes=self.bands, window=self.window, masked=True)
+
+        return gu.Raster.from_array(
+            data=data, transform=self.transform, crs=self.crs, nodata=self.nodata, area_or_point=self.area_or_point
+        )
+
+    def subset(self, rowmin: int, rowmax: int, colmin: int, colmax: int) -> _RasterTile:
+        """
+        Describe a subset of the tile, to read only a smaller window on disk.
+
+        :param rowmin: First row of the subset, relative to the tile.
+        :param rowmax: Last row (excluded) of the subset, relative to the tile.
+        :param colmin: First column of the subset, relative to the tile.
+        :param colmax: Last column (excluded) of the subset, relative to the tile.
+
+        :return: The description of the subset of the tile.
+        """
+        window = rio.windows.Window(col_off=colmin, row_off=rowmin, width=colmax - colmin, height=rowmax - rowmin)
+        transform = rio.windows.transform(window, self.transform)
+        data = self.data[..., rowmin:rowmax, colmin:colmax] if self.data is not None else None
+        if self.window is not None:
+            window = rio.windows.Window(
+                col_off=colmin + self.window.col_off,
+                row_off=rowmin + self.window.row_off,
+                width=window.width,
+                height=window.height,
+            )
+        return _RasterTile(
+            transform=transform,
+            crs=self.crs,
+            nodata=self.nodata,
+            area_or_point=self.area_or_point,
+            raster_shape=self.raster_shape,
+            filename=self.filename,
+            bands=self.bands,
+            window=window if data is None else None,
+            data=data,
+        )
+
+
+# Cache of datasets opened by the current worker thread (or process), to avoid re-opening a file for each tile
+# Rasterio datasets cannot be shared safely between threads, so the cache is thread-local
+_DATASET_CACHE = threading.local()
+_DATASET_CACHE_MAXSIZE = 16
+
+
+def _open_dataset_cached(filename: str) -> rio.io.DatasetReader:
+    """
+    Open a dataset for reading, re-using the dataset handle of the current thread if the file is unchanged.
+
+    :param filename: Path to the raster file.
+
+    :return: Dataset opened with rasterio.
+    """
+    if not hasattr(_DATASET_CACHE, "datasets"):
+        _DATASET_CACHE.datasets = {}
+    datasets: dict[str, tuple[tuple[int, int], rio.io.DatasetReader]] = _DATASET_CACHE.datasets
+
+    # The modification time and size ensure we never read from a stale handle if the file was re-written
+    stat = os.stat(filename)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    if filename in datasets:
+        cached_key, dataset = datasets[filename]
+        if cached_key == key and not dataset.closed:
+            return dataset
+        dataset.close()
+        del datasets[filename]
+
+    # Close the oldest handle if the cache is full
+    if len(datasets) >= _DATASET_CACHE_MAXSIZE:
+        oldest = next(iter(datasets))
+        datasets.pop(oldest)[1].close()
+
+    dataset = rio.open(filename)
+    datasets[filename] = (key, dataset)
+
+    return dataset
+
+
+def _get_raster_tile(raster: gu.Raster, tile: NDArrayNum) -> _RasterTile:
+    """
+    Describe a specific tile of the raster, to be sent to a worker and loaded there.
+
+    For a raster not loaded, only the window on disk is described (accounting for a lazy crop of the raster). For a
+    loaded raster, only the subset of the array in memory is passed.
+
+    :param raster: The input raster from which the tile is to be extracted.
+    :param tile: The bounding box of the tile as [rowmin, rowmax, colmin, colmax].
+
+    :return: The raster tile description.
+    """
+    rowmin, rowmax, colmin, colmax = (int(t) for t in tile)
+    window = rio.windows.Window(col_off=colmin, row_off=rowmin, width=colmax - colmin, height=rowmax - rowmin)
+    tile_kwargs = {
+        "transform": rio.windows.transform(window, raster.transform),
+        "crs": raster.crs,
+        "nodata": raster.nodata,
+        "area_or_point": raster.area_or_point,
+        "raster_shape": raster.shape,
+    }
+
+    # If the raster is on disk and not loaded (and not downsampled), the worker can read the window directly
+    if not raster.is_loaded and raster.filename is not None and raster._downsample == 1:
+        # Shift the window by that of a lazily cropped raster
+        if raster._window is not None:
+            window = rio.windows.Window(
+                col_off=colmin + raster._window.col_off,
+                row_off=rowmin + raster._window.row_off,
+                width=window.width,
+                height=window.height,
+            )
+        return _RasterTile(filename=raster.filename, bands=list(raster.bands), window=window, **tile_kwargs)
+
+    # Otherwise, we pass only the array subset of the tile
+    return _RasterTile(data=raster.data[..., rowmin:rowmax, colmin:colmax], **tile_kwargs)
+
+
+def _load_raster_tile(raster_unload: gu.Raster | _RasterTile, tile: NDArrayNum) -> gu.Raster:
     """
     Extracts a specific tile (spatial subset) from the raster based on the provided tile coordinates.
 
-    :param raster_unload: The input raster from which the tile is to be extracted.
+    :param raster_unload: The input raster from which the tile is to be extracted, or the description of the tile.
     :param tile: The bounding box of the tile as [xmin, xmax, ymin, ymax].
     :return: The extracted raster tile.
     """
+    # If a tile description was passed, load it directly
+    if isinstance(raster_unload, _RasterTile):
+        return raster_unload.load()
+
     rowmin, rowmax, colmin, colmax = tile
     # Crop the raster to extract the tile based on the bounding box coordinates
     raster_tile = raster_unload.icrop(bbox=(colmin, rowmin, colmax, rowmax))
@@ -124,7 +358,7 @@ def _remove_tile_padding(raster_shape: tuple[int, int], raster_tile: gu.Raster,
 
 def _apply_func_block(
     func: Callable[..., Any],
-    raster: Any,
+    raster: gu.Raster | _RasterTile,
     tile: NDArrayNum,
     depth: int,
     *args: Any,
@@ -134,7 +368,7 @@ def _apply_func_block(
     Apply a function to a specific tile of a raster, handling loading and padding.
 
     :param func: The function to apply to each tile.
-    :param raster: The input raster.
+    :param raster: The input raster, or the description of the tile.
     :param tile: The bounding box of the tile as [xmin, xmax, ymin, ymax].
     :param depth: The padding size used to overlap tiles.
     :param args: Additional arguments to pass to the function being applied.
@@ -143,15 +377,16 @@ def _apply_func_block(
     """
     # Load raster tile
     raster_tile = _load_raster_tile(raster, tile)
+    raster_shape = raster.raster_shape if isinstance(raster, _RasterTile) else raster.shape
 
     # Apply user-defined function to the tile
     result_tile = func(raster_tile, *args, **kwargs)
 
     # Remove padding
     if isinstance(result_tile, gu.Raster):
-        _remove_tile_padding((raster.height, raster.width), result_tile, tile, depth)
+        _remove_tile_padding(raster_shape, result_tile, tile, depth)
     elif isinstance(result_tile, tuple) and isinstance(result_tile[0], gu.Raster):
-        _remove_tile_padding((raster.height, raster.width), result_tile[0], tile, depth)
+        _remove_tile_padding(raster_shape, result_tile[0], tile, depth)
 
     # If the raster is a mask, convert to uint8 before saving and force nodata to 255
     if isinstance(result_tile, gu.Mask):
@@ -161,6 +396,108 @@ def _apply_func_block(
     return result_tile, tile
 
 
+def _launch_tasks_unordered(
+    config: MultiprocConfig,
+    fun: Callable[..., Any],
+    list_args: Iterable[list[Any]],
+    kwargs: dict[str, Any] | None = None,
+) -> Iterator[tuple[int, Any]]:
+    """
+    Launch tasks on the cluster and yield their results as they complete, with a limited number of tasks in flight.
+
+    New tasks are only launched when results are retrieved (backpressure), so that the memory usage is bounded by
+    about config.max_in_flight results, whatever the total number of tasks.
+
+    If config.batch_size is larger than one, several tasks are grouped and run sequentially in a single task of the
+    cluster, to reduce the overhead of launching tasks.
+
+    :param config: Configuration object containing the cluster, the maximum number of tasks in flight and batch size.
+    :param fun: The function to run for each task.
+    :param list_args: Positional arguments for each task, can be a generator to build them only when launched.
+    :param kwargs: Keyword arguments for all tasks.
+
+    :return: Iterator of task indexes (in order of list_args) and task results, in order of completion.
+    """
+    # Group tasks in batches
+    batch_size = max(1, config.batch_size)
+    args_iter = iter(list_args)
+    batches = iter(lambda: list(itertools.islice(args_iter, batch_size)), [])
+
+    pending: dict[int, Any] = {}
+    max_in_flight = max(1, config.max_in_flight)
+    i = 0
+
+    while True:
+        # Launch new batches of tasks until the window of tasks in flight is full
+        while len(pending) < max_in_flight:
+            batch = next(batches, None)
+            if batch is None:
+                break
+            pending[i] = config.cluster.launch_task(fun=_run_task_batch, args=[fun, batch, kwargs])
+            i += batch_size
+
+        if len(pending) == 0:
+            return
+
+        # Retrieve completed batches, blocking until at least one is completed
+        done = {id(future) for future in config.cluster.wait_any(list(pending.values()))}
+        for i0 in [i0 for i0, future in pending.items() if id(future) in done]:
+            for j, res in enumerate(config.cluster.get_res(pending.pop(i0))):
+                yield i0 + j, res
+
+
+def _run_task_batch(fun: Callable[..., Any], list_args: list[list[Any]], kwargs: dict[str, Any] | None) -> list[Any]:
+    """
+    Run a batch of tasks sequentially.
+
+    :param fun: The function to run for each task.
+    :param list_args: Positional arguments for each task.
+    :param kwargs: Keyword arguments for all tasks.
+
+    :return: List of task results.
+    """
+    if kwargs is None:
+        kwargs = {}
+    return [fun(*args, **kwargs) for args in list_args]
+
+
+def _get_block_size(chunk_size: int) -> int | None:
+    """
+    Get the largest GeoTIFF block size that is aligned with the chunk size (i.e. divides it), or None if no block
+    size is valid (multiple of 16 and at most 1024 for GDAL).
+
+    :param chunk_size: The size of the chunks for splitting raster data.
+
+    :return: Block size aligned with the chunk size.
+    """
+    for block_size in range(min(chunk_size, 1024) // 16 * 16, 0, -16):
+        if chunk_size % block_size == 0:
+            return block_size
+    return None
+
+
+def _get_chunk_shape(config: MultiprocConfig, raster: gu.Raster, depth: int = 0) -> tuple[int, int]:
+    """
+    Get the chunk shape of a raster from the multiprocessing configuration.
+
+    :param config: Configuration object containing chunk size and memory budget.
+    :param raster: Raster to split in chunks.
+    :param depth: The overlap size between tiles.
+
+    :return: Chunk shape as (rows, columns).
+    """
+    if config.chunk_size == "auto":
+        return compute_tile_shape(
+            config.memory_budget,
+            dtype=raster.dtype,
+            count=raster.count,
+            overlap=depth,
+            block_shape=_get_block_shape(raster),
+            raster_shape=raster.shape,
+        )
+    return config.chunk_size, config.chunk_size
+
+
 def map_overlap_multiproc_save(
     func: Callable[..., gu.Raster],
     raster_path: str | gu.Raster,
@@ -196,45 +533,70 @@ def map_overlap_multiproc_save(
         raster = raster_path
 
     # Generate tiling grid
-    tiling_grid = compute_tiling(config.chunk_size, raster.shape, raster.shape, overlap=depth)
-
-    # Create tasks for multiprocessing
-    tasks = []
-    for row in range(tiling_grid.shape[0]):
-        for col in range(tiling_grid.shape[1]):
-            tile = tiling_grid[row, col]
-            # Launch the task on the cluster to process each tile
-            tasks.append(
-                config.cluster.launch_task(fun=_apply_func_block, args=[func, raster, tile, depth, *args], **kwargs)
-            )
+    chunk_shape = _get_chunk_shape(config, raster, depth)
+    tiling_grid = compute_tiling(
+        chunk_shape, raster.shape, raster.shape, overlap=depth, offset=_get_block_offset(raster)
+    )
+
+    # Create tasks for multiprocessing, sending only the tile description to process each tile
+    list_args = ([func, _get_raster_tile(raster, tile), tile, depth, *args] for tile in tiling_grid.reshape(-1, 4))
+    results = _launch_tasks_unordered(config, fun=_apply_func_block, list_args=list_args, kwargs=kwargs)
 
-    # get first tile to retrieve dtype and nodata
-    result_tile0, _ = config.cluster.get_res(tasks[0])
+    # The dtype and nodata are retrieved from the first tile completed
     file_metadata = {
         "width": raster.width,
         "height": raster.height,
         "count": raster.count,
         "crs": raster.crs,
         "transform": raster.transform,
-        "dtype": result_tile0.dtype,
-        "nodata": result_tile0.nodata,
     }
 
-    return _write_multiproc_result(tasks, config, file_metadata)
+    return _write_multiproc_result(results, config, file_metadata, chunk_shape)
 
 
 def _write_multiproc_result(
-    tasks: list[Any],
+    results: Iterator[tuple[int, Any]],
     config: MultiprocConfig,
     file_metadata: dict[str, Any],
+    chunk_shape: tuple[int, int],
 ) -> gu.Raster:
+    """
+    Write the results of tasks to a raster file as they complete.
+
+    For a GeoTIFF, the file is tiled with blocks aligned with the chunk size, and compressed if they are aligned (so
+    that each block is only written once).
+
+    :param results: Iterator of task indexes and results as tuples of tile and its destination bounding box.
+    :param config: Configuration object containing output file path and driver.
+    :param file_metadata: Metadata of the file to write. If dtype and nodata are missing, they are retrieved from the
+        first result.
+    :param chunk_shape: Shape of the chunks written, as (rows, columns).
+
+    :return: Raster of the written file.
+    """
+
+    # For a GeoTIFF, write tiled blocks aligned with the chunk size
+    creation_options: dict[str, Any] = {}
+    if config.driver == "GTiff":
+        block_ysize = _get_block_size(chunk_shape[0])
+        block_xsize = _get_block_size(chunk_shape[1])
+        creation_options.update({"tiled": True})
+        if block_ysize is not None and block_xsize is not None:
+            creation_options.update({"blockxsize": block_xsize, "blockysize": block_ysize, "compress": "deflate"})
+
+    # Retrieve the first result to get the dtype and nodata, if not provided
+    try:
+        first_result = next(results)
+    except StopIteration:
+        raise ValueError("No tiles to write from multiprocessing tasks.")
+    if "dtype" not in file_metadata:
+        file_metadata.update({"dtype": first_result[1][0].dtype, "nodata": first_result[1][0].nodata})
 
     # Create a new raster file to save the processed results
-    with rio.open(config.outfile, "w", driver=config.driver, **file_metadata) as dst:
+    with rio.open(config.outfile, "w", driver=config.driver, **file_metadata, **creation_options) as dst:
         try:
-            # Iterate over the tasks and retrieve the processed tiles
-            for results in tasks:
-                result_tile, dst_tile = config.cluster.get_res(results)
+            # Iterate over the results of tasks as they complete, and write the processed tiles
+            for _, (result_tile, dst_tile) in itertools.chain([first_result], results):
                 is_mask = isinstance(result_tile, gu.Mask)
 
                 # Define the window in the output file where the tile should be written
@@ -327,38 +689,33 @@ def map_multiproc_collect(
         raster = raster_path
 
     # Generate tiling grid
-    tiling_grid = compute_tiling(config.chunk_size, raster.shape, raster.shape, overlap=depth)
-
-    # Create tasks for multiprocessing
-    tasks = []
-    for row in range(tiling_grid.shape[0]):
-        for col in range(tiling_grid.shape[1]):
-            tile = tiling_grid[row, col]
-            # Launch the task on the cluster to process each tile
-            tasks.append(
-                config.cluster.launch_task(fun=_apply_func_block, args=[func, raster, tile, depth, *args], **kwargs)
-            )
+    chunk_shape = _get_chunk_shape(config, raster, depth)
+    tiling_grid = compute_tiling(
+        chunk_shape, raster.shape, raster.shape, overlap=depth, offset=_get_block_offset(raster)
+    )
+
+    # Create tasks for multiprocessing, sending only the tile description to process each tile
+    list_args = ([func, _get_raster_tile(raster, tile), tile, depth, *args] for tile in tiling_grid.reshape(-1, 4))
 
     try:
-        list_results = []
-        # Iterate over the tasks and retrieve the processed tiles
-        for results in tasks:
-            result, dst_tile = config.cluster.get_res(results)
+        # Retrieve the processed tiles as they complete, and sort them back in tile order
+        dict_results = {}
+        for i, (result, dst_tile) in _launch_tasks_unordered(
+            config, fun=_apply_func_block, list_args=list_args, kwargs=kwargs
+        ):
             if return_tile:
-                list_results.append((result, dst_tile))
+                dict_results[i] = (result, dst_tile)
             else:
-                list_results.append(result)
-        return list_results
+                dict_results[i] = result
+        return [dict_results[i] for i in sorted(dict_results)]
 
     except Exception as e:
         raise RuntimeError(f"Error retrieving terrain attribute from multiprocessing tasks: {e}")
 
 
 def _wrapper_multiproc_reproject_per_block(
-    rst: gu.Raster,
-    src_block_ids: list[dict[str, int]],
+    src_tiles: list[_RasterTile],
     dst_block_id: dict[str, int],
-    idx_d2s: list[int],
     block_ids: list[dict[str, int]],
     combined_meta: dict[str, Any],
     **kwargs: Any,
@@ -367,8 +724,7 @@ def _wrapper_multiproc_reproject_per_block(
     (also rebuilds a square array combined from intersecting source blocks)."""
 
     # Get source array block for each destination block
-    s = src_block_ids
-    src_arrs = (rst.icrop(bbox=(s[idx]["xs"], s[idx]["ys"], s[idx]["xe"], s[idx]["ye"])).data for idx in idx_d2s)
+    src_arrs = (src_tile.load().data for src_tile in src_tiles)
 
     # Call reproject per block
     dst_block_arr = _reproject_per_block(*src_arrs, block_ids=block_ids, combined_meta=combined_meta, **kwargs)
@@ -395,7 +751,8 @@ def _multiproc_reproject(
     """
 
     # Prepare geotiling and reprojection metadata for source and destination grids
-    src_chunks = _chunks2d_from_chunksizes_shape(chunksizes=(config.chunk_size, config.chunk_size), shape=rst.shape)
+    chunk_shape = _get_chunk_shape(config, rst)
+    src_chunks = _chunks2d_from_chunksizes_shape(chunksizes=chunk_shape, shape=rst.shape)
     src_geotiling, dst_geotiling, dst_chunks, dest2source, src_block_ids, meta_params, dst_block_geogrids = (
         _build_geotiling_and_meta(
             src_shape=rst.shape,
@@ -405,7 +762,7 @@ def _multiproc_reproject(
             dst_transform=dst_transform,
             dst_crs=dst_crs,
             src_chunks=src_chunks,
-            dst_chunksizes=(config.chunk_size, config.chunk_size),
+            dst_chunksizes=chunk_shape,
         )
     )
 
@@ -422,23 +779,24 @@ def _multiproc_reproject(
     # Get location of destination blocks to write file
     dst_block_ids = np.array(dst_geotiling.get_block_locations())
 
-    # Create tasks for multiprocessing
-    tasks = []
-    for i in range(len(dest2source)):
-        tasks.append(
-            config.cluster.launch_task(
-                fun=_wrapper_multiproc_reproject_per_block,
-                args=[
-                    rst,
-                    src_block_ids,
-                    dst_block_ids[i],
-                    dest2source[i],
-                    meta_params[i][1],
-                    meta_params[i][0],
-                ],
-                kwargs=kwargs,
-            )
-        )
+    # Create tasks for multiprocessing, sending only the description of the source blocks intersecting each
+    # destination block
+    s = src_block_ids
+    list_args = (
+        [
+            [
+                _get_raster_tile(rst, np.array([s[idx]["ys"], s[idx]["ye"], s[idx]["xs"], s[idx]["xe"]]))
+                for idx in dest2source[i]
+            ],
+            dst_block_ids[i],
+            meta_params[i][1],
+            meta_params[i][0],
+        ]
+        for i in range(len(dest2source))
+    )
+    results = _launch_tasks_unordered(
+        config, fun=_wrapper_multiproc_reproject_per_block, list_args=list_args, kwargs=kwargs
+    )
 
     # Retrieve metadata for saving file
     file_metadata = {
@@ -452,4 +810,1106 @@ def _multiproc_reproject(
     }
 
     # Create a new raster file to save the processed results
-    _write_multiproc_result(tasks, config, file_metadata)
+    _write_multiproc_result(results, config, file_metadata, chunk_shape)
+
+
+# Number of bins of the histograms used to compute exact order statistics out-of-memory
+_STATS_NB_BINS = 2**16
+
+
+def _get_raster_band_tile(raster: gu.Raster, tile: NDArrayNum, band: int) -> _RasterTile:
+    """
+    Describe a specific tile of a single band of the raster.
+
+    :param raster: The input raster from which the tile is to be extracted.
+    :param tile: The bounding box of the tile as [rowmin, rowmax, colmin, colmax].
+    :param band: The index of the band.
+
+    :return: The raster tile description.
+    """
+    raster_tile = _get_raster_tile(raster, tile)
+    if raster.count > 1:
+        if raster_tile.data is not None:
+            raster_tile.data = raster_tile.data[band - 1]
+        else:
+            raster_tile.bands = [raster_tile.bands[band - 1]]  # type: ignore
+    return raster_tile
+
+
+def _statistics_block(
+    raster_tile: _RasterTile,
+    tile: NDArrayNum,
+    inlier_tile: NDArrayNum | None,
+    step: Literal["moments", "histogram", "values"],
+    params: dict[str, Any],
+) -> Any:
+    """
+    Compute a step of the statistics of a raster on a specific tile.
+
+    :param raster_tile: The description of the tile (of a single band).
+    :param tile: The bounding box of the tile as [rowmin, rowmax, colmin, colmax].
+    :param inlier_tile: Tile of the boolean mask of values to exclude, if any.
+    :param step: Step of the statistics, either "moments" for the accumulator and counts, "histogram" for the
+        histogram of values, or "values" for the distinct values in some bins of the histogram.
+    :param params: Parameters of the histogram (center subtracted to get absolute deviations, minimum, maximum,
+        number of bins and bins to collect for the "values" step).
+
+    :return: Result of the step for the tile.
+    """
+    data = _load_raster_tile(raster_tile, tile).data
+    mask = np.ma.getmaskarray(data)
+    valid_count = np.count_nonzero(~mask)
+    if inlier_tile is not None:
+        mask = np.logical_or(mask, inlier_tile)
+    values = np.ma.getdata(data)[~mask]
+
+    if step == "moments":
+        inlier_count = np.count_nonzero(~inlier_tile) if inlier_tile is not None else 0
+        return _StatsAccumulator.from_values(values), valid_count, inlier_count, data.size
+
+    values = values.astype(np.float64)
+    if params["center"] is not None:
+        values = np.abs(values - params["center"])
+    if step == "histogram":
+        return _get_histogram(values, params["vmin"], params["vmax"], params["nb_bins"])
+    return _get_values_in_bins(values, params["vmin"], params["vmax"], params["nb_bins"], params["bins"])
+
+
+def _multiproc_statistics(
+    raster: gu.Raster,
+    config: MultiprocConfig,
+    band: int = 1,
+    inlier_mask: gu.Mask | NDArrayNum | None = None,
+    stats_names: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Compute statistics of a raster tile by tile, in multiprocessing and without loading the full raster in memory.
+
+    Moment statistics (mean, standard deviation, sum, sum of squares, min, max, RMSE) are merged exactly over tiles
+    in one pass. Order statistics (median, 90th percentile, LE90) are exact using two more passes: one for the
+    histogram of values and one to collect values in the histogram bins of interest. The NMAD requires two more
+    passes on absolute deviations to the median. Passes are only run for the requested statistics.
+
+    See Raster.get_stats() for details.
+
+    :param raster: Raster to compute statistics from.
+    :param config: Configuration object containing chunk size and an optional cluster.
+    :param band: The index of the band for which to compute statistics.
+    :param inlier_mask: A boolean mask of values to exclude from statistics.
+    :param stats_names: Names of the statistics to compute. Defaults to all.
+
+    :return: Dictionary of statistics.
+    """
+    stats_names = set(stats_names) if stats_names is not None else None
+    tiling_grid = compute_tiling(
+        _get_chunk_shape(config, raster), raster.shape, raster.shape, offset=_get_block_offset(raster)
+    ).reshape(-1, 4)
+
+    if inlier_mask is not None:
+        inlier_mask = raster._get_inlier_array(inlier_mask, band)
+
+    def run_step(step: Literal["moments", "histogram", "values"], params: dict[str, Any]) -> Iterator[Any]:
+        """Run a step of the statistics on all tiles, yielding results as they complete."""
+        list_args = (
+            [
+                _get_raster_band_tile(raster, tile, band),
+                tile,
+                inlier_mask[tile[0] : tile[1], tile[2] : tile[3]] if inlier_mask is not None else None,
+                step,
+                params,
+            ]
+            for tile in tiling_grid
+        )
+        for _, result in _launch_tasks_unordered(config, fun=_statistics_block, list_args=list_args):
+            yield result
+
+    # 1/ Moments and counts, merged over all tiles
+    acc = _StatsAccumulator()
+    valid_count, inlier_count, total_count = 0, 0, 0
+    for acc_tile, valid_tile, inlier_tile, total_tile in run_step("moments", {}):
+        acc = acc.merge(acc_tile)
+        valid_count += valid_tile
+        inlier_count += inlier_tile
+        total_count += total_tile
+
+    def select_ranks(ranks: list[int], center: float | None, vmax: float) -> NDArrayNum:
+        """Select values at ranks exactly, from the histogram of values and the values in the bins of the ranks."""
+        params: dict[str, Any] = {"center": center, "vmin": 0 if center is not None else acc.min, "vmax": vmax}
+        params["nb_bins"] = _STATS_NB_BINS
+        histogram = sum(run_step("histogram", params))
+        bins, ranks_in_bins = _locate_ranks(histogram, np.array(ranks))
+        params["bins"] = bins
+        values_in_bins: dict[int, tuple[NDArrayNum, NDArrayNum]] = {}
+        for values_tile in run_step("values", params):
+            values_in_bins = _merge_values_in_bins(values_in_bins, values_tile)
+        return _select_ranks(values_in_bins, bins, ranks_in_bins)
+
+    # 2/ Order statistics, only if requested
+    names = [n for n in _ORDER_STATISTICS if stats_names is None or n in stats_names]
+    order_stats: dict[str, float] = {}
+    if acc.count > 0 and len(names) > 0:
+        percentiles = {p for n in names for p in _ORDER_STATISTICS[n]}
+        ranks = sorted({r for p in percentiles for r in _percentile_ranks(acc.count, p)[:2]})
+        values_at_ranks = dict(zip(ranks, select_ranks(ranks, center=None, vmax=acc.max)))
+        for name in names:
+            if name == "LE90":
+                order_stats[name] = _interpolate_percentile(values_at_ranks, acc.count, 95) - _interpolate_percentile(
+                    values_at_ranks, acc.count, 5
+                )
+            # The NMAD is the median of absolute deviations to the median
+            elif name == "NMAD":
+                median = _interpolate_percentile(values_at_ranks, acc.count, 50)
+                ranks_deviations = sorted(set(_percentile_ranks(acc.count, 50)[:2]))
+                vmax = max(acc.max - median, median - acc.min)
+                deviations = select_ranks(ranks_deviations, center=median, vmax=vmax)
+                deviations_at_ranks = dict(zip(ranks_deviations, deviations))
+                order_stats[name] = 1.4826 * _interpolate_percentile(deviations_at_ranks, acc.count, 50)
+            else:
+                order_stats[name] = _interpolate_percentile(values_at_ranks, acc.count, _ORDER_STATISTICS[name][0])
+
+    return _get_stats_dict(
+        acc, order_stats, valid_count, total_count, total_inlier_count=inlier_count if inlier_mask is not None else None
+    )
+
+
+def _zonal_stats_block(
+    raster_tile: _RasterTile,
+    tile: NDArrayNum,
+    gdf_tile: gpd.GeoDataFrame,
+    labels_tile: NDArrayNum,
+    nb_labels: int,
+    values_per_label: bool,
+) -> tuple[dict[str, NDArrayNum], NDArrayNum, tuple[NDArrayNum, NDArrayNum] | None]:
+    """
+    Compute the zonal moments and counts per label on a specific tile.
+
+    :param raster_tile: The description of the tile (of a single band).
+    :param tile: The bounding box of the tile as [rowmin, rowmax, colmin, colmax].
+    :param gdf_tile: Features intersecting the tile, in the raster CRS.
+    :param labels_tile: Label of each feature intersecting the tile.
+    :param nb_labels: Total number of labels.
+    :param values_per_label: Whether to return the valid values and their labels, for order statistics.
+
+    :return: Moments per label, total count per label, and valid values and their labels (if requested).
+    """
+    from geoutils.interface.raster_vector import _zonal_block, _zonal_labels
+
+    raster = _load_raster_tile(raster_tile, tile)
+    labels = _zonal_labels(gdf_tile, raster, labels=labels_tile)
+    return _zonal_block(raster.data, labels, nb_labels, values_per_label=values_per_label)
+
+
+def _multiproc_zonal_stats(
+    raster: gu.Raster,
+    vector: gu.Vector | gpd.GeoDataFrame,
+    config: MultiprocConfig,
+    stats_names: list[str] | None = None,
+    band: int = 1,
+) -> dict[str, NDArrayNum]:
+    """
+    Compute statistics of a raster in each feature of a vector tile by tile, in multiprocessing and without loading
+    the full raster in memory.
+
+    Each tile rasterizes only the features intersecting it. Moments per feature are merged exactly over tiles, while
+    order statistics require the valid values inside features to be gathered, which needs to fit in memory.
+
+    See Raster.zonal_stats() for details.
+
+    :param raster: Raster to compute statistics from.
+    :param vector: Vector of features.
+    :param config: Configuration object containing chunk size and an optional cluster.
+    :param stats_names: Names of the statistics to compute. Defaults to all.
+    :param band: The index of the band for which to compute statistics.
+
+    :return: Dictionary of statistics per feature.
+    """
+    gdf = vector.ds if isinstance(vector, gu.Vector) else vector
+    gdf = gdf.to_crs(raster.crs)
+    nb_labels = len(gdf)
+    order_names = [n for n in _ORDER_STATISTICS if stats_names is None or n in stats_names]
+    tiling_grid = compute_tiling(
+        _get_chunk_shape(config, raster), raster.shape, raster.shape, offset=_get_block_offset(raster)
+    ).reshape(-1, 4)
+
+    def tile_args(tile: NDArrayNum) -> list[Any]:
+        """Get the arguments of a tile, with only the features intersecting it."""
+        rowmin, rowmax, colmin, colmax = tile
+        window = rio.windows.Window(col_off=colmin, row_off=rowmin, width=colmax - colmin, height=rowmax - rowmin)
+        ind_features = gdf.sindex.query(box(*rio.windows.bounds(window, raster.transform)))
+        ind_features = np.sort(ind_features)
+        return [
+            _get_raster_band_tile(raster, tile, band),
+            tile,
+            gdf.iloc[ind_features],
+            ind_features + 1,
+            nb_labels,
+            len(order_names) > 0,
+        ]
+
+    moments: dict[str, NDArrayNum] | None = None
+    total_count = np.zeros(nb_labels + 1, dtype=np.int64)
+    list_values: list[NDArrayNum] = []
+    list_labels: list[NDArrayNum] = []
+    list_args = (tile_args(tile) for tile in tiling_grid)
+    for _, (moments_tile, total_count_tile, values_labels) in _launch_tasks_unordered(
+        config, fun=_zonal_stats_block, list_args=list_args
+    ):
+        moments = moments_tile if moments is None else _merge_grouped_moments(moments, moments_tile)
+        total_count += total_count_tile
+        if values_labels is not None:
+            list_values.append(values_labels[0])
+            list_labels.append(values_labels[1])
+    assert moments is not None  # For mypy
+
+    order_stats: dict[str, NDArrayNum] = {}
+    if len(order_names) > 0:
+        values, labels = np.concatenate(list_values), np.concatenate(list_labels)
+        order_stats = _grouped_order_statistics(values, labels, nb_labels + 1, order_names)
+
+    # Remove the label 0 outside features
+    stats_dict = _get_grouped_stats_dict(moments, order_stats, total_count)
+    return {name: stat[1:] for name, stat in stats_dict.items()}
+
+
+def _rasterize_block(
+    geoms_tile: gpd.GeoSeries,
+    values_tile: NDArrayNum | Number,
+    tile: NDArrayNum,
+    transform: rio.Affine,
+    fill: Number,
+    dtype: DTypeLike,
+) -> tuple[NDArrayNum, NDArrayNum]:
+    """
+    Burn features on a specific tile of a grid.
+
+    :param geoms_tile: Geometries of the features intersecting the tile, in the CRS of the grid.
+    :param values_tile: Value to burn for each feature intersecting the tile, or a single value for all features.
+    :param tile: The bounding box of the tile as [rowmin, rowmax, colmin, colmax].
+    :param transform: Geotransform of the grid.
+    :param fill: Value outside the features.
+    :param dtype: Data type of the output.
+
+    :return: Array of the tile, and its bounding box.
+    """
+    from geoutils.interface.raster_vector import _burn_features_window
+
+    rowmin, rowmax, colmin, colmax = tile
+    window = rio.windows.Window(col_off=colmin, row_off=rowmin, width=colmax - colmin, height=rowmax - rowmin)
+    return _burn_features_window(geoms_tile, values_tile, window, transform, fill, dtype), tile
+
+
+def _multiproc_rasterize(
+    geoms: gpd.GeoSeries,
+    values: NDArrayNum | Number,
+    out_shape: tuple[int, int],
+    transform: rio.Affine,
+    crs: rio.crs.CRS,
+    fill: Number,
+    dtype: DTypeLike,
+    config: MultiprocConfig,
+) -> gu.Raster:
+    """
+    Burn features on a grid tile by tile, in multiprocessing and writing each tile directly to a file, without
+    building the full grid in memory.
+
+    Each tile receives only the features intersecting it, selected with the spatial index of the features.
+
+    See Vector.rasterize() for details.
+
+    :param geoms: Geometries of the features, in the CRS of the grid.
+    :param values: Value to burn for each feature, or a single value for all features.
+    :param out_shape: Shape of the grid.
+    :param transform: Geotransform of the grid.
+    :param crs: CRS of the grid.
+    :param fill: Value outside the features.
+    :param dtype: Data type of the output.
+    :param config: Configuration object containing chunk size, output file path, and an optional cluster.
+
+    :return: Raster of the written file, not loaded.
+    """
+    if config.chunk_size == "auto":
+        chunk_shape = compute_tile_shape(config.memory_budget, dtype=dtype, raster_shape=out_shape)
+    else:
+        chunk_shape = (config.chunk_size, config.chunk_size)
+    tiling_grid = compute_tiling(chunk_shape, out_shape, out_shape).reshape(-1, 4)
+
+    def tile_args(tile: NDArrayNum) -> list[Any]:
+        """Get the arguments of a tile, with only the features intersecting it."""
+        rowmin, rowmax, colmin, colmax = tile
+        window = rio.windows.Window(col_off=colmin, row_off=rowmin, width=colmax - colmin, height=rowmax - rowmin)
+        ind_features = np.sort(geoms.sindex.query(box(*rio.windows.bounds(window, transform))))
+        values_tile = values[ind_features] if isinstance(values, np.ndarray) else values
+        return [geoms.iloc[ind_features], values_tile, tile, transform, fill, dtype]
+
+    list_args = (tile_args(tile) for tile in tiling_grid)
+    results = _launch_tasks_unordered(config, fun=_rasterize_block, list_args=list_args)
+
+    file_metadata = {
+        "width": out_shape[1],
+        "height": out_shape[0],
+        "count": 1,
+        "crs": crs,
+        "transform": transform,
+        "dtype": dtype,
+        "nodata": None,
+    }
+
+    return _write_multiproc_result(results, config, file_metadata, chunk_shape)
+
+
+# Number of features written at once to the output file when polygonizing tile by tile
+_POLYGONIZE_WRITE_BATCH = 2**16
+
+
+def _polygonize_block(
+    raster_tile: _RasterTile,
+    tile: NDArrayNum,
+    target_values: Number | tuple[Number, Number] | list[Number] | NDArrayNum | Literal["all"],
+    dtype: DTypeLike,
+    transform: rio.Affine,
+) -> tuple[NDArrayNum, NDArrayNum, NDArrayNum, NDArrayNum, int]:
+    """
+    Polygonize a specific tile, separating the polygons touching a seam with other tiles.
+
+    Polygons are computed in pixel coordinates of the tile. Those inside the tile are georeferenced, while those
+    touching a seam are returned in pixel coordinates of the full raster, so that they can be stitched exactly.
+
+    :param raster_tile: The description of the tile.
+    :param tile: The bounding box of the tile as [rowmin, rowmax, colmin, colmax].
+    :param target_values: Value or range of values of the raster from which to create geometries.
+    :param dtype: Data type to polygonize the raster values with.
+    :param transform: Geotransform of the full raster.
+
+    :return: Georeferenced polygons inside the tile and their values, polygons touching a seam in pixel coordinates
+        and their values, and the number of valid pixels selected.
+    """
+    from geoutils.interface.raster_vector import (
+        _polygonize_count,
+        _polygonize_selection,
+    )
+
+    raster = raster_tile.load()
+    selection = _polygonize_selection(raster.data, target_values)
+    mask = np.array(selection).astype("uint8")
+    list_shapes = list(shapes(raster.data.astype(dtype), mask=mask, transform=rio.Affine.identity()))
+    geoms = np.array([shapely.geometry.shape(s) for s, _ in list_shapes], dtype=object)
+    values = np.array([v for _, v in list_shapes])
+
+    # Polygons touching an edge of the tile that is not an edge of the raster are on a seam
+    rowmin, rowmax, colmin, colmax = (int(t) for t in tile)
+    height, width = raster_tile.raster_shape
+    bounds = shapely.bounds(geoms).reshape(-1, 4)
+    on_seam = (
+        ((bounds[:, 0] == 0) & (colmin > 0))
+        | ((bounds[:, 2] == colmax - colmin) & (colmax < width))
+        | ((bounds[:, 1] == 0) & (rowmin > 0))
+        | ((bounds[:, 3] == rowmax - rowmin) & (rowmax < height))
+    )
+
+    # Shift polygons to pixel coordinates of the full raster
+    geoms = shapely.transform(geoms, lambda coords: coords + np.array([colmin, rowmin]))
+
+    return (
+        _pixel_to_coords(geoms[~on_seam], transform),
+        values[~on_seam],
+        geoms[on_seam],
+        values[on_seam],
+        _polygonize_count(selection),
+    )
+
+
+def _pixel_to_coords(geoms: NDArrayNum, transform: rio.Affine) -> NDArrayNum:
+    """
+    Georeference geometries from pixel coordinates, in the same order of operations as GDAL during polygonization.
+
+    :param geoms: Geometries in pixel coordinates.
+    :param transform: Geotransform of the raster.
+
+    :return: Georeferenced geometries.
+    """
+    a, b, c, d, e, f = transform[:6]
+
+    def georeference(coords: NDArrayNum) -> NDArrayNum:
+        return np.column_stack((c + coords[:, 0] * a + coords[:, 1] * b, f + coords[:, 0] * d + coords[:, 1] * e))
+
+    return shapely.transform(geoms, georeference)
+
+
+def _stitch_polygons(geoms: NDArrayNum, values: NDArrayNum) -> tuple[NDArrayNum, NDArrayNum]:
+    """
+    Stitch polygons of the same value that were split by seams between tiles.
+
+    Polygons of the same value intersecting each other are grouped in connected components, and each component is
+    merged into its (4-connected) parts.
+
+    :param geoms: Polygons touching a seam, in pixel coordinates.
+    :param values: Raster value of each polygon.
+
+    :return: Stitched polygons and their values.
+    """
+    if len(geoms) == 0:
+        return geoms, values
+
+    # Find pairs of polygons of the same value that intersect
+    left, right = shapely.STRtree(geoms).query(geoms, predicate="intersects")
+    same_value = values[left] == values[right]
+    graph = coo_matrix(
+        (np.ones(np.count_nonzero(same_value)), (left[same_value], right[same_value])), shape=(len(geoms), len(geoms))
+    )
+    _, components = connected_components(graph, directed=False)
+
+    # Merge each component, and split it into its parts (polygons touching only at a corner stay separate)
+    order = np.argsort(components, kind="stable")
+    _, starts = np.unique(components[order], return_index=True)
+    groups = np.split(order, starts[1:])
+    merged = np.array(
+        [geoms[group[0]] if len(group) == 1 else shapely.union_all(geoms[group]) for group in groups], dtype=object
+    )
+    parts, ind_groups = shapely.get_parts(merged, return_index=True)
+    first = np.array([group[0] for group in groups])
+
+    return parts, values[first[ind_groups]]
+
+
+def _multiproc_polygonize(
+    raster: gu.Raster,
+    target_values: Number | tuple[Number, Number] | list[Number] | NDArrayNum | Literal["all"],
+    data_column_name: str,
+    config: MultiprocConfig,
+) -> gu.Vector:
+    """
+    Polygonize a raster tile by tile, in multiprocessing and writing features to a vector file as tiles complete.
+
+    Polygons inside a tile are written directly, while polygons touching a seam between tiles are kept until all tiles
+    are completed, to be stitched with those of neighbouring tiles of the same value. The features are the same as
+    when polygonizing the full raster, but in a different order.
+
+    See Raster.polygonize() for details.
+
+    :param raster: Raster to polygonize.
+    :param target_values: Value or range of values of the raster from which to create geometries.
+    :param data_column_name: Data column name to be associated with target values in the output vector.
+    :param config: Configuration object containing chunk size, output file path, and an optional cluster. The driver
+        of the output file is derived from its extension by GeoPandas (e.g., ".gpkg" or ".parquet" if GDAL supports
+        it), and is a GeoPackage if there is no extension.
+
+    :return: Vector of the written file.
+    """
+    from geoutils.interface.raster_vector import (
+        _polygonize_dtype,
+        _polygonize_no_pixel_message,
+    )
+
+    if not isinstance(target_values, (int, float, np.integer, np.floating, tuple, list, np.ndarray, str)) or (
+        isinstance(target_values, str) and target_values != "all"
+    ):
+        raise ValueError("in_value must be a number, a tuple or a sequence")
+
+    tiling_grid = compute_tiling(
+        _get_chunk_shape(config, raster), raster.shape, raster.shape, offset=_get_block_offset(raster)
+    ).reshape(-1, 4)
+    dtype = _polygonize_dtype(raster.dtype)
+    list_args = ([_get_raster_tile(raster, tile), tile, target_values, dtype, raster.transform] for tile in tiling_grid)
+
+    driver = None if os.path.splitext(config.outfile)[1] else "GPKG"
+    nb_features = 0
+    pending_geoms: list[NDArrayNum] = []
+    pending_values: list[NDArrayNum] = []
+
+    def write_features(force: bool = False) -> None:
+        """Append the pending features to the output file, by batches to limit the cost of each write."""
+        nonlocal nb_features
+        nb_pending = sum(len(g) for g in pending_geoms)
+        if nb_pending == 0 or (not force and nb_pending < _POLYGONIZE_WRITE_BATCH):
+            return
+        gdf = gpd.GeoDataFrame(
+            {
+                data_column_name: np.arange(nb_features, nb_features + nb_pending),
+                "geometry": np.concatenate(pending_geoms),
+                "raster_value": np.concatenate(pending_values),
+            },
+            geometry="geometry",
+            crs=raster.crs,
+        )
+        gdf.to_file(config.outfile, driver=driver, mode="w" if nb_features == 0 else "a")
+        nb_features += nb_pending
+        pending_geoms.clear()
+        pending_values.clear()
+
+    # Write polygons inside tiles as they complete, and keep those on seams
+    count = 0
+    list_seam_geoms: list[NDArrayNum] = []
+    list_seam_values: list[NDArrayNum] = []
+    for _, (geoms, values, seam_geoms, seam_values, count_tile) in _launch_tasks_unordered(
+        config, fun=_polygonize_block, list_args=list_args
+    ):
+        pending_geoms.append(geoms)
+        pending_values.append(values)
+        write_features()
+        list_seam_geoms.append(seam_geoms)
+        list_seam_values.append(seam_values)
+        count += count_tile
+
+    if not isinstance(target_values, str) and count == 0:
+        raise ValueError(_polygonize_no_pixel_message(target_values))
+
+    # Stitch polygons on seams, and write them
+    seam_geoms, seam_values = _stitch_polygons(np.concatenate(list_seam_geoms), np.concatenate(list_seam_values))
+    pending_geoms.append(_pixel_to_coords(seam_geoms, raster.transform))
+    pending_values.append(seam_values)
+    write_features(force=True)
+
+    if nb_features == 0:
+        raise ValueError("No features to write from multiprocessing tasks.")
+
+    return gu.Vector(config.outfile)
+
+
+def _proximity_block(
+    raster_tile: gu.Raster,
+    polygon_tile: _RasterTile | None,
+    target_values: list[float] | None,
+    in_or_out: Literal["in"] | Literal["out"] | Literal["both"],
+    sampling: int | tuple[float | int, float | int],
+    max_distance: float,
+) -> gu.Raster:
+    """
+    Compute the proximity distances to target pixels of a specific tile, including its halo.
+
+    :param raster_tile: Tile of target values.
+    :param polygon_tile: The description of the same tile of polygons (rasterized as 0 and 1), to optionally mask the
+        proximity inside/outside of them.
+    :param target_values: List of target values to use for the proximity, defaults to all non-zero values.
+    :param in_or_out: Compute proximity only 'in' or 'out'-side the polygons, or 'both'.
+    :param sampling: Sampling of the distance transform.
+    :param max_distance: Maximum distance, above which distances are set to nodata.
+
+    :return: Proximity distances of the tile.
+    """
+    from geoutils.interface.distance import (
+        _proximity_from_targets,
+        _proximity_in_or_out,
+        _proximity_targets,
+    )
+    from geoutils.raster.raster import _default_nodata
+
+    mask_boundary = _proximity_targets(raster_tile, target_values)
+    proximity = _proximity_from_targets(mask_boundary, sampling, max_distance=max_distance)
+    if polygon_tile is not None:
+        mask_polygon = np.ma.getdata(polygon_tile.load().data).astype(bool)
+        _proximity_in_or_out(proximity, mask_polygon, in_or_out)
+
+    return gu.Raster.from_array(
+        data=proximity,
+        transform=raster_tile.transform,
+        crs=raster_tile.crs,
+        nodata=_default_nodata(proximity.dtype),
+        area_or_point=raster_tile.area_or_point,
+    )
+
+
+def _get_temporary_config(config: MultiprocConfig) -> MultiprocConfig:
+    """Get a copy of the configuration writing to a temporary GeoTIFF file, for intermediate results."""
+
+    temp_config = config.copy()
+    temp_config.driver = "GTiff"
+    with tempfile.NamedTemporaryFile(suffix=".tif") as tmp:
+        temp_config.outfile = tmp.name
+    return temp_config
+
+
+def _multiproc_proximity(
+    raster: gu.Raster,
+    config: MultiprocConfig,
+    max_distance: float,
+    vector: gu.Vector | None = None,
+    target_values: list[float] | None = None,
+    geometry_type: str = "boundary",
+    in_or_out: Literal["in"] | Literal["out"] | Literal["both"] = "both",
+    distance_unit: Literal["pixel"] | Literal["georeferenced"] = "georeferenced",
+) -> gu.Raster:
+    """
+    Compute proximity distances tile by tile, in multiprocessing and without loading the full raster in memory.
+
+    Each tile is computed with a halo covering the maximum distance, so that distances up to the maximum distance are
+    the same as when computing on the full raster, while distances above it are set to nodata. For a vector, the
+    geometries (and polygons if the proximity is only computed in or out) are first rasterized tile by tile in
+    temporary files.
+
+    See Raster.proximity() for details.
+
+    :param raster: Raster to compute the proximity on.
+    :param config: Configuration object containing chunk size, output file path, and an optional cluster.
+    :param max_distance: Maximum distance (in distance unit), above which distances are set to nodata.
+    :param vector: Vector for which to compute the proximity to geometry, if not provided computed on the raster
+        target pixels.
+    :param target_values: (Only with a raster) List of target values to use for the proximity, defaults to all
+        non-zero values.
+    :param geometry_type: (Only with a vector) Type of geometry to use for the proximity, defaults to 'boundary'.
+    :param in_or_out: (Only with a vector) Compute proximity only 'in' or 'out'-side the geometry, or 'both'.
+    :param distance_unit: Distance unit, either 'georeferenced' or 'pixel'.
+
+    :return: Raster of the written file.
+    """
+    from geoutils.interface.distance import _get_proximity_sampling
+
+    sampling = _get_proximity_sampling(raster, distance_unit)
+    if vector is not None and in_or_out not in ["in", "out", "both"]:
+        raise ValueError('The type of proximity must be one of "in", "out" or "both".')
+
+    # The halo covers the maximum distance along both axes
+    halo = int(np.ceil(max_distance / np.min(np.abs(np.atleast_1d(sampling)))))
+
+    # For a vector, rasterize the geometries (and polygons if needed) tile by tile in temporary files
+    temp_files = []
+    target_raster, polygon_raster = raster, None
+    try:
+        if vector is not None:
+            warnings.filterwarnings("ignore", message="Geometry is in a geographic CRS.*")
+            boundary_shp = gpd.GeoDataFrame(geometry=vector.ds.__getattr__(geometry_type), crs=vector.crs)
+            target_config = _get_temporary_config(config)
+            temp_files.append(target_config.outfile)
+            target_raster = gu.Vector(boundary_shp).create_mask(raster, multiproc_config=target_config)
+            target_values = [1]
+            if in_or_out != "both":
+                if geometry_type == "geometry":
+                    polygon_raster = target_raster
+                else:
+                    polygon_config = _get_temporary_config(config)
+                    temp_files.append(polygon_config.outfile)
+                    polygon_raster = vector.create_mask(raster, multiproc_config=polygon_config)
+
+        chunk_shape = _get_chunk_shape(config, target_raster, depth=halo)
+        tiling_grid = compute_tiling(
+            chunk_shape, raster.shape, raster.shape, overlap=halo, offset=_get_block_offset(target_raster)
+        ).reshape(-1, 4)
+        list_args = (
+            [
+                _proximity_block,
+                _get_raster_tile(target_raster, tile),
+                tile,
+                halo,
+                _get_raster_tile(polygon_raster, tile) if polygon_raster is not None else None,
+                target_values,
+                in_or_out,
+                sampling,
+                max_distance,
+            ]
+            for tile in tiling_grid
+        )
+        results = _launch_tasks_unordered(config, fun=_apply_func_block, list_args=list_args)
+
+        file_metadata = {
+            "width": raster.width,
+            "height": raster.height,
+            "count": 1,
+            "crs": raster.crs,
+            "transform": raster.transform,
+        }
+        return _write_multiproc_result(results, config, file_metadata, chunk_shape)
+
+    finally:
+        for temp_file in temp_files:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+
+def _interp_points_block(
+    raster_tile: _RasterTile,
+    tile: NDArrayNum,
+    points_tile: tuple[NDArrayNum, NDArrayNum],
+    indices_tile: tuple[NDArrayNum, NDArrayNum],
+    halo: int,
+    block_shape: tuple[int, int] | None,
+    block_offset: tuple[int, int],
+    interp_kwargs: dict[str, Any],
+) -> NDArrayNum:
+    """
+    Interpolate points falling in a specific tile, reading only the windows around points.
+
+    If the points touch only a few blocks of the file, a window is read for the points of each block, otherwise a
+    single window covering all points is read.
+
+    :param raster_tile: The description of the tile (of a single band), including the halo.
+    :param tile: The bounding box of the tile as [rowmin, rowmax, colmin, colmax], including the halo.
+    :param points_tile: Coordinates X/Y of the points.
+    :param indices_tile: Row/column indexes of the points in the raster.
+    :param halo: Halo of pixels needed around points for interpolation.
+    :param block_shape: Block shape of the raster file, if read from disk.
+    :param block_offset: Position of the raster in its file, to group points by blocks of the file.
+    :param interp_kwargs: Keyword arguments passed to _interp_points.
+
+    :return: Interpolated values at the points.
+    """
+    # Pixel of each point, relative to the tile
+    rows = np.floor(indices_tile[0]).astype(int) - tile[0]
+    cols = np.floor(indices_tile[1]).astype(int) - tile[2]
+    height, width = tile[1] - tile[0], tile[3] - tile[2]
+
+    # Group points by block of the file only if it reduces the area to read
+    groups = np.zeros(len(rows), dtype=int)
+    if block_shape is not None:
+        # Block of each point in the file, from its position on disk
+        cell_rows = (rows + tile[0] + block_offset[0]) // block_shape[0]
+        cell_cols = (cols + tile[2] + block_offset[1]) // block_shape[1]
+        cells = (cell_rows - cell_rows.min()) * (np.ptp(cell_cols) + 1) + cell_cols - cell_cols.min()
+        unique_cells, inverse = np.unique(cells, return_inverse=True)
+        area_cells = len(unique_cells) * (block_shape[0] + 2 * halo) * (block_shape[1] + 2 * halo)
+        area_bbox = (np.ptp(rows) + 2 * halo) * (np.ptp(cols) + 2 * halo)
+        if area_cells < area_bbox:
+            groups = inverse.ravel()
+
+    values = np.full(len(rows), np.nan, dtype=np.float32)
+    for group in np.unique(groups):
+        ind = groups == group
+        rowmin, rowmax = max(rows[ind].min() - halo, 0), min(rows[ind].max() + halo + 1, height)
+        colmin, colmax = max(cols[ind].min() - halo, 0), min(cols[ind].max() + halo + 1, width)
+        raster = raster_tile.subset(rowmin, rowmax, colmin, colmax).load()
+        # Shift the indexes of points in the full raster to the window, to round them exactly as on the full array
+        values[ind] = _interp_points(
+            raster.get_nanarray(),
+            transform=raster.transform,
+            area_or_point=raster.area_or_point,
+            points=(points_tile[0][ind], points_tile[1][ind]),
+            indices=(indices_tile[0][ind] - tile[0] - rowmin, indices_tile[1][ind] - tile[2] - colmin),
+            **interp_kwargs,
+        )
+
+    return values
+
+
+def _multiproc_interp_points(
+    raster: gu.Raster,
+    points: tuple[Number, Number] | tuple[NDArrayNum, NDArrayNum],
+    config: MultiprocConfig,
+    method: Literal["nearest", "linear", "cubic", "quintic", "slinear", "pchip", "splinef2d"] = "linear",
+    dist_nodata_spread: Literal["half_order_up", "half_order_down"] | int = "half_order_up",
+    band: int = 1,
+    shift_area_or_point: bool | None = None,
+    force_scipy_function: Literal["map_coordinates", "interpn"] | None = None,
+    **kwargs: Any,
+) -> NDArrayNum:
+    """
+    Interpolate a raster at points tile by tile, in multiprocessing and reading only the windows around points.
+
+    Points are sorted by tile, each tile reads only the windows around its points with a halo covering the support of
+    the interpolation method and the nodata spreading, and values are returned in the original order of points.
+    Values are the same as when interpolating the full array, except very close to nodata when the nodata spreading
+    distance is smaller than the support of the method (as nodata are filled from the window only), and within the
+    tolerance of the spline fit for methods fitted on the full grid ("cubic", "quintic", "splinef2d").
+
+    See Raster.interp_points() for details.
+
+    :param raster: Raster to interpolate.
+    :param points: Point(s) at which to interpolate raster value (tuple of X/Y array-likes).
+    :param config: Configuration object containing chunk size and an optional cluster.
+    :param method: Interpolation method.
+    :param dist_nodata_spread: Distance of nodata spreading during interpolation.
+    :param band: The index of the band to interpolate.
+    :param shift_area_or_point: Whether to shift with pixel interpretation.
+    :param force_scipy_function: Force to use either map_coordinates or interpn.
+
+    :return: Array of raster value(s) for the given points.
+    """
+    x, y = (np.atleast_1d(np.asarray(p, dtype=np.float64)) for p in points)
+    shape_points = x.shape
+    x, y = x.ravel(), y.ravel()
+    i, j = _xy2ij(
+        x, y, transform=raster.transform, area_or_point=raster.area_or_point, shift_area_or_point=shift_area_or_point
+    )
+    i, j = np.asarray(i, dtype=np.float64), np.asarray(j, dtype=np.float64)
+
+    # Points outside the image are NaNs, and are not sent to any tile
+    inside = np.isfinite(i) & np.isfinite(j)
+    inside[inside] = ~_outside_image(
+        j[inside],
+        i[inside],
+        transform=raster.transform,
+        area_or_point=raster.area_or_point,
+        shape=raster.shape,
+        index=True,
+    )
+    ind_inside = np.flatnonzero(inside)
+
+    # Sort points by tile, with tiles aligned on the blocks of the file from the position of the raster on disk
+    halo = _get_interp_halo(method, dist_nodata_spread)
+    chunk_shape = _get_chunk_shape(config, raster, depth=halo)
+    block_offset = _get_block_offset(raster)
+    row_shift, col_shift = block_offset[0] % chunk_shape[0], block_offset[1] % chunk_shape[1]
+    nb_tiles_cols = int(np.ceil((raster.width + col_shift) / chunk_shape[1]))
+    tile_rows = (np.clip(np.floor(i[ind_inside]).astype(int), 0, raster.height - 1) + row_shift) // chunk_shape[0]
+    tile_cols = (np.clip(np.floor(j[ind_inside]).astype(int), 0, raster.width - 1) + col_shift) // chunk_shape[1]
+    tile_ids = tile_rows * nb_tiles_cols + tile_cols
+    order = np.argsort(tile_ids, kind="stable")
+    ind_inside, tile_ids = ind_inside[order], tile_ids[order]
+    unique_ids, starts = np.unique(tile_ids, return_index=True)
+    groups = np.split(ind_inside, starts[1:]) if len(unique_ids) > 0 else []
+
+    interp_kwargs = {
+        "method": method,
+        "dist_nodata_spread": dist_nodata_spread,
+        "shift_area_or_point": shift_area_or_point,
+        "force_scipy_function": force_scipy_function,
+        **kwargs,
+    }
+    block_shape = _get_block_shape(raster)
+
+    def tile_args(tile_id: int, ind: NDArrayNum) -> list[Any]:
+        """Get the arguments of a tile, with its halo and only the points falling in it."""
+        row, col = divmod(int(tile_id), nb_tiles_cols)
+        tile = np.array(
+            [
+                max(row * chunk_shape[0] - row_shift - halo, 0),
+                min((row + 1) * chunk_shape[0] - row_shift + halo, raster.height),
+                max(col * chunk_shape[1] - col_shift - halo, 0),
+                min((col + 1) * chunk_shape[1] - col_shift + halo, raster.width),
+            ]
+        )
+        return [
+            _get_raster_band_tile(raster, tile, band),
+            tile,
+            (x[ind], y[ind]),
+            (i[ind], j[ind]),
+            halo,
+            block_shape,
+            block_offset,
+            interp_kwargs,
+        ]
+
+    # Restore the original order of points
+    rpoints = np.full(x.shape, np.nan, dtype=np.float32)
+    list_args = (tile_args(tile_id, ind) for tile_id, ind in zip(unique_ids, groups))
+    for k, values in _launch_tasks_unordered(config, fun=_interp_points_block, list_args=list_args):
+        rpoints[groups[k]] = values
+
+    return rpoints.reshape(shape_points)
+
+
+# Halo in source pixels added around the window of each input for mosaicking, covering the support of all resampling
+# kernels (at most 3 pixels for Lanczos)
+_MOSAIC_RESAMPLING_HALO = 4
+
+
+def _get_mosaic_source_tile(
+    raster: gu.Raster,
+    bounds: rio.coords.BoundingBox,
+    crs: rio.crs.CRS,
+    shape: tuple[int, int],
+    feather_distance: int | None = None,
+) -> NDArrayNum | None:
+    """
+    Get the tile of an input raster needed to reproject it on a tile of the mosaic.
+
+    The window covers the bounds of the mosaic tile transformed in the CRS of the raster, with a halo covering the
+    support of the resampling kernel (scaled by the ratio of resolutions when downsampling), and the feathering
+    distance if feathering weights are computed.
+
+    :param raster: Input raster.
+    :param bounds: Bounds of the mosaic tile.
+    :param crs: CRS of the mosaic.
+    :param shape: Shape of the mosaic tile.
+    :param feather_distance: Distance in pixels of the feathering weights, if they are computed.
+
+    :return: The bounding box of the input tile as [rowmin, rowmax, colmin, colmax], or None if it is empty.
+    """
+    src_bounds = rio.warp.transform_bounds(crs, raster.crs, *bounds, densify_pts=21)
+    window = rio.windows.from_bounds(*src_bounds, transform=raster.transform)
+    scale = max(1.0, window.height / shape[0], window.width / shape[1])
+    halo = int(np.ceil(_MOSAIC_RESAMPLING_HALO * scale)) + (feather_distance or 0)
+
+    rowmin = max(int(np.floor(window.row_off)) - halo, 0)
+    rowmax = min(int(np.ceil(window.row_off + window.height)) + halo, raster.height)
+    colmin = max(int(np.floor(window.col_off)) - halo, 0)
+    colmax = min(int(np.ceil(window.col_off + window.width)) + halo, raster.width)
+    if rowmin >= rowmax or colmin >= colmax:
+        return None
+    return np.array([rowmin, rowmax, colmin, colmax])
+
+
+def _mosaic_block(
+    raster_tiles: list[_RasterTile | None],
+    tile: NDArrayNum,
+    bounds: rio.coords.BoundingBox,
+    res: tuple[float, float],
+    crs: rio.crs.CRS,
+    dtype: DTypeLike,
+    nodata: int | float | None,
+    resampling_method: str | Resampling,
+    merge_algorithm: list[Callable] | list[str] | None,  # type: ignore
+    feather_distance: int | None = None,
+    raster_edges: list[tuple[bool, bool, bool, bool] | None] | None = None,
+) -> tuple[gu.Raster, NDArrayNum]:
+    """
+    Reproject the input tiles overlapping a tile of the mosaic, and stack or merge them.
+
+    With streaming merging algorithms, the input tiles are merged one at a time without stacking them.
+
+    :param raster_tiles: Description of the tiles of input rasters, None for an input not overlapping the tile.
+    :param tile: The bounding box of the mosaic tile as [rowmin, rowmax, colmin, colmax].
+    :param bounds: Bounds of the mosaic tile.
+    :param res: Resolution of the mosaic.
+    :param crs: CRS of the mosaic.
+    :param dtype: Data type of the reprojected inputs.
+    :param nodata: Nodata value of the reference raster.
+    :param resampling_method: Resampling method for reprojection.
+    :param merge_algorithm: List of reductor functions or names of streaming algorithms to merge the inputs with, or
+        None to stack them.
+    :param feather_distance: Distance in pixels of the feathering weights, if they are computed.
+    :param raster_edges: For each input tile, whether its top, bottom, left and right sides are edges of the input
+        raster, to compute feathering weights.
+
+    :return: Stacked or merged tile, and its bounding box.
+    """
+    from geoutils.raster.multiraster import (
+        _merge_stack,
+        _merge_streaming,
+        _reproject_feather_weights,
+        _reproject_first_band,
+    )
+    from geoutils.raster.raster import _default_nodata
+
+    shape = (int(tile[1] - tile[0]), int(tile[3] - tile[2]))
+    reproj_kwargs = {"bounds": bounds, "res": res, "crs": crs, "resampling_method": resampling_method}
+
+    def layers() -> Iterator[tuple[NDArrayNum, NDArrayNum | None]]:
+        """Reproject each input tile (and its feathering weights) on the mosaic tile, loading one at a time."""
+        # A tile not overlapping any input is merged as a single empty input
+        if len(raster_tiles) == 0:
+            yield np.ma.masked_all(shape, dtype=dtype), None
+        for k, raster_tile in enumerate(raster_tiles):
+            if raster_tile is None:
+                yield np.ma.masked_all(shape, dtype=dtype), None
+                continue
+            raster = raster_tile.load()
+            weights = None
+            if feather_distance is not None:
+                assert raster_edges is not None and raster_edges[k] is not None  # For mypy
+                weights = _reproject_feather_weights(raster, feather_distance, edges=raster_edges[k], **reproj_kwargs)
+            yield _reproject_first_band(raster, dtype=dtype, nodata=nodata, **reproj_kwargs), weights
+
+    if merge_algorithm is not None and isinstance(merge_algorithm[0], str):
+        data = _merge_streaming(layers(), merge_algorithm)  # type: ignore
+    else:
+        data = np.ma.asarray([layer for layer, _ in layers()])
+        if merge_algorithm is not None:
+            data = _merge_stack(data, merge_algorithm)
+    out_nodata = nodata if nodata is not None else _default_nodata(data.dtype)
+    data[np.isnan(data)] = out_nodata
+
+    raster_tile = gu.Raster.from_array(
+        data=data, transform=rio.transform.from_origin(bounds.left, bounds.top, *res), crs=crs, nodata=out_nodata
+    )
+    return raster_tile, tile
+
+
+def _multiproc_mosaic(
+    rasters: list[gu.Raster],
+    reference_raster: gu.Raster,
+    bounds: rio.coords.BoundingBox,
+    resampling_method: str | Resampling,
+    config: MultiprocConfig,
+    merge_algorithm: list[Callable] | list[str] | None = None,  # type: ignore
+    progress: bool = True,
+    feather_distance: int | None = None,
+    rasters_bounds: NDArrayNum | None = None,
+) -> gu.Raster:
+    """
+    Stack or merge rasters tile by tile, in multiprocessing and writing each tile directly to a file.
+
+    Each tile of the mosaic only reads and reprojects the windows of the inputs overlapping it, selected from their
+    bounds projected in the CRS of the reference, so that memory scales with the tile size times the number of
+    overlapping inputs (or the number of inputs for a stack).
+
+    See stack_rasters() and merge_rasters() for details.
+
+    :param rasters: List of rasters to stack or merge.
+    :param reference_raster: Reference raster, defining the CRS, resolution, data type and nodata of the mosaic.
+    :param bounds: Bounds of the mosaic.
+    :param resampling_method: Resampling method for reprojection.
+    :param config: Configuration object containing chunk size, output file path, and an optional cluster.
+    :param merge_algorithm: List of reductor functions or names of streaming algorithms to merge the rasters with, or
+        None to stack them.
+    :param progress: If True, will display a progress bar.
+    :param feather_distance: Distance in pixels of the feathering weights, if they are computed.
+    :param rasters_bounds: Bounds of the rasters in the CRS of the reference, if already known (e.g., from the catalog
+        of a collection).
+
+    :return: Raster of the written file, not loaded.
+    """
+    res = reference_raster.res
+    crs = reference_raster.crs
+    dtype = reference_raster.dtype
+
+    # Grid of the mosaic, as derived by reprojection to the bounds and resolution of the reference
+    dst_transform = rio.transform.from_origin(bounds.left, bounds.top, *res)
+    dst_window = rio.windows.from_bounds(*bounds, transform=dst_transform).round_lengths()
+    out_shape = (int(dst_window.height), int(dst_window.width))
+    count = len(rasters) if merge_algorithm is None else len(merge_algorithm)
+
+    if config.chunk_size == "auto":
+        chunk_shape = compute_tile_shape(config.memory_budget, dtype=dtype, count=count, raster_shape=out_shape)
+    else:
+        chunk_shape = (config.chunk_size, config.chunk_size)
+    tiling_grid = compute_tiling(chunk_shape, out_shape, out_shape).reshape(-1, 4)
+
+    # Bounds of the inputs in the CRS of the mosaic, to select those overlapping each tile
+    if rasters_bounds is None:
+        rasters_bounds = np.array([list(raster.get_bounds_projected(crs)) for raster in rasters])
+
+    def tile_args(tile: NDArrayNum) -> list[Any]:
+        """Get the arguments of a tile, with only the windows of the inputs overlapping it."""
+        rowmin, rowmax, colmin, colmax = tile
+        window = rio.windows.Window(col_off=colmin, row_off=rowmin, width=colmax - colmin, height=rowmax - rowmin)
+        tile_bounds = rio.coords.BoundingBox(*rio.windows.bounds(window, dst_transform))
+        overlaps = (
+            (rasters_bounds[:, 0] < tile_bounds[2])
+            & (rasters_bounds[:, 2] > tile_bounds[0])
+            & (rasters_bounds[:, 1] < tile_bounds[3])
+            & (rasters_bounds[:, 3] > tile_bounds[1])
+        )
+        raster_tiles: list[_RasterTile | None] = []
+        raster_edges: list[tuple[bool, bool, bool, bool] | None] = []
+        for raster, overlap in zip(rasters, overlaps):
+            src_tile = (
+                _get_mosaic_source_tile(
+                    raster, tile_bounds, crs, (rowmax - rowmin, colmax - colmin), feather_distance=feather_distance
+                )
+                if overlap
+                else None
+            )
+            if src_tile is not None:
+                raster_tiles.append(_get_raster_band_tile(raster, src_tile, 1))
+                raster_edges.append(
+                    (src_tile[0] == 0, src_tile[1] == raster.height, src_tile[2] == 0, src_tile[3] == raster.width)
+                )
+            # The stack keeps a band per input, while the merge only needs the overlapping inputs
+            elif merge_algorithm is None:
+                raster_tiles.append(None)
+                raster_edges.append(None)
+        return [
+            raster_tiles,
+            tile,
+            tile_bounds,
+            res,
+            crs,
+            dtype,
+            reference_raster.nodata,
+            resampling_method,
+            merge_algorithm,
+            feather_distance,
+            raster_edges,
+        ]
+
+    list_args = (tile_args(tile) for tile in tiling_grid)
+    results = _launch_tasks_unordered(config, fun=_mosaic_block, list_args=list_args)
+    results = iter(tqdm(results, total=len(tiling_grid), disable=not progress))
+
+    file_metadata = {
+        "width": out_shape[1],
+        "height": out_shape[0],
+        "count": count,
+        "crs": crs,
+        "transform": dst_transform,
+    }
+
+    return _write_multiproc_result(results, config, file_metadata, chunk_shape)
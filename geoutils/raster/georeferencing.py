@@ -29,7 +29,7 @@ import numpy as np
 import rasterio as rio
 
 from geoutils._config import config
-from geoutils._typing import ArrayLike, DTypeLike, NDArrayNum
+from geoutils._typing import ArrayLike, DTypeLike, NDArrayBool, NDArrayNum
 
 
 def _ij2xy(
@@ -169,18 +169,22 @@ def _outside_image(
     shape: tuple[int, int],
     area_or_point: Literal["Area", "Point"] | None,
     index: bool = True,
-) -> bool:
+) -> bool | NDArrayBool:
     """See description of Raster.outside_image."""
 
+    is_scalar = np.ndim(xi) == 0 and np.ndim(yj) == 0
+
     if not index:
         yj, xi = _xy2ij(xi, yj, transform=transform, area_or_point=area_or_point)
 
-    if np.any(np.array((xi, yj)) < 0):
-        return True
-    elif np.asanyarray(xi) > shape[1] or np.asanyarray(yj) > shape[0]:
-        return True
-    else:
-        return False
+    # Compare all points at once
+    xi_arr = np.asanyarray(xi)
+    yj_arr = np.asanyarray(yj)
+    outside = (xi_arr < 0) | (yj_arr < 0) | (xi_arr > shape[1]) | (yj_arr > shape[0])
+
+    if is_scalar:
+        return bool(np.any(outside))
+    return outside
 
 
 def _res(transform: rio.transform.Affine) -> tuple[float, float]:
@@ -26,6 +26,7 @@ import warnings
 from typing import Iterable, Literal
 
 import affine
+import dask.array as da
 import numpy as np
 import rasterio as rio
 from rasterio.crs import CRS
@@ -39,6 +40,7 @@ from geoutils.raster._geotransformations import (
     _rio_reproject,
     _user_input_reproject,
 )
+from geoutils.raster.distributed_computing.dask import delayed_reproject
 from geoutils.raster.distributed_computing.multiproc import _multiproc_reproject
 from geoutils.raster.georeferencing import _cast_pixel_interpretation
 
@@ -62,9 +64,11 @@ def _reproject(
     n_threads: int = 0,
     memory_limit: int = 64,
     multiproc_config: gu.raster.MultiprocConfig | None = None,
-) -> tuple[bool, MArrayNum | None, affine.Affine | None, CRS | None, int | float | None]:
+) -> tuple[bool, MArrayNum | da.Array | None, affine.Affine | None, CRS | None, int | float | None]:
     """
     Reproject raster. See Raster.reproject() for details.
+
+    For a lazy raster, the reprojected array is a lazy dask array.
     """
 
     # 1/ Process user input
@@ -115,6 +119,20 @@ def _reproject(
         _multiproc_reproject(source_raster, config=multiproc_config, **reproj_kwargs)
         return False, None, None, None, None
 
+    elif source_raster.is_lazy:
+        # Masked values cannot be counted without computing them, so they are filled with the destination nodata
+        # if no source nodata exists
+        if src_nodata is None:
+            reproj_kwargs.update({"src_nodata": nodata})
+        src_darr = da.ma.filled(source_raster.data, reproj_kwargs["src_nodata"])
+        # Reproject chunk by chunk for each band
+        if src_darr.ndim == 2:
+            dst_darr = delayed_reproject(src_darr, **reproj_kwargs)
+        else:
+            dst_darr = da.stack([delayed_reproject(band_darr, **reproj_kwargs) for band_darr in src_darr])
+        dst_darr = da.ma.masked_equal(dst_darr.astype(dtype), nodata)
+        return False, dst_darr, reproj_kwargs["dst_transform"], reproj_kwargs["dst_crs"], reproj_kwargs["dst_nodata"]
+
     else:
         if src_nodata is None and np.sum(source_raster.data.mask) > 0:
             raise ValueError(
@@ -136,16 +154,12 @@ def _reproject(
 #########
 
 
-def _crop(
+def _crop_bounds(
     source_raster: gu.Raster,
     bbox: gu.Raster | gu.Vector | list[float] | tuple[float, ...],
-    mode: Literal["match_pixel"] | Literal["match_extent"] = "match_pixel",
     distance_unit: Literal["georeferenced", "pixel"] = "georeferenced",
-) -> tuple[MArrayNum, affine.Affine]:
-    """Crop raster. See details in Raster.crop()."""
-
-    assert mode in ["match_extent", "match_pixel"], "mode must be one of 'match_pixel', 'match_extent'"
-    assert distance_unit in ["georeferenced", "pixel"], "distance_unit must be 'georeferenced' or 'pixel'"
+) -> tuple[float, float, float, float]:
+    """Get georeferenced bounds (xmin, ymin, xmax, ymax) to crop to. See details in Raster.crop()."""
 
     if isinstance(bbox, (gu.Raster, gu.Vector)):
         # For another Vector or Raster, we reproject the bounding box in the same CRS as self
@@ -163,42 +177,82 @@ def _crop(
     else:
         raise ValueError("cropGeom must be a Raster, Vector, or list of coordinates.")
 
+    return xmin, ymin, xmax, ymax
+
+
+def _crop_windows(
+    source_raster: gu.Raster,
+    bounds: tuple[float, float, float, float],
+) -> tuple[rio.windows.Window, rio.windows.Window | None, affine.Affine]:
+    """
+    Get windows and transform to crop to bounds while preserving the original pixel resolution ("match_pixel" mode).
+
+    :param source_raster: Raster to crop.
+    :param bounds: Bounds to crop to (xmin, ymin, xmax, ymax), in the CRS of the raster.
+
+    :return: Window in the raster, window on disk (None if the raster is loaded), transform of the cropped raster.
+    """
+    xmin, ymin, xmax, ymax = bounds
+
+    # Finding the intersection of requested bounds and original bounds, cropped to image shape
+    ref_win = rio.windows.from_bounds(xmin, ymin, xmax, ymax, transform=source_raster.transform)
+    self_win = rio.windows.from_bounds(*source_raster.bounds, transform=source_raster.transform).crop(
+        *source_raster.shape
+    )
+    final_window = ref_win.intersection(self_win).round_lengths().round_offsets()
+
+    # Update bounds and transform accordingly
+    new_xmin, new_ymin, new_xmax, new_ymax = rio.windows.bounds(final_window, transform=source_raster.transform)
+    tfm = rio.transform.from_origin(new_xmin, new_ymax, *source_raster.res)
+
+    # In case data is loaded, no need for a window on disk
+    if source_raster.is_loaded:
+        return final_window, None, tfm
+
+    assert source_raster._disk_shape is not None  # This should not be the case, sanity check to make mypy happy
+
+    # If data was not loaded, and self's transform was updated (e.g. due to downsampling or a previous crop) need to
+    # get the Window corresponding to on disk data
+    # As the window is always derived in the transform on disk, nested crops compose naturally
+    ref_win_disk = rio.windows.from_bounds(
+        new_xmin, new_ymin, new_xmax, new_ymax, transform=source_raster._disk_transform
+    )
+    self_win_disk = rio.windows.from_bounds(*source_raster.bounds, transform=source_raster._disk_transform).crop(
+        *source_raster._disk_shape[1:]
+    )
+    final_window_disk = ref_win_disk.intersection(self_win_disk).round_lengths().round_offsets()
+
+    # Round up to downsampling size, to match __init__
+    final_window_disk = rio.windows.round_window_to_full_blocks(
+        final_window_disk, ((source_raster._downsample, source_raster._downsample),)
+    )
+
+    return final_window, final_window_disk, tfm
+
+
+def _crop(
+    source_raster: gu.Raster,
+    bbox: gu.Raster | gu.Vector | list[float] | tuple[float, ...],
+    mode: Literal["match_pixel"] | Literal["match_extent"] = "match_pixel",
+    distance_unit: Literal["georeferenced", "pixel"] = "georeferenced",
+) -> tuple[MArrayNum, affine.Affine]:
+    """Crop raster. See details in Raster.crop()."""
+
+    assert mode in ["match_extent", "match_pixel"], "mode must be one of 'match_pixel', 'match_extent'"
+    assert distance_unit in ["georeferenced", "pixel"], "distance_unit must be 'georeferenced' or 'pixel'"
+
+    xmin, ymin, xmax, ymax = _crop_bounds(source_raster=source_raster, bbox=bbox, distance_unit=distance_unit)
+
     if mode == "match_pixel":
-        # Finding the intersection of requested bounds and original bounds, cropped to image shape
-        ref_win = rio.windows.from_bounds(xmin, ymin, xmax, ymax, transform=source_raster.transform)
-        self_win = rio.windows.from_bounds(*source_raster.bounds, transform=source_raster.transform).crop(
-            *source_raster.shape
-        )
-        final_window = ref_win.intersection(self_win).round_lengths().round_offsets()
-
-        # Update bounds and transform accordingly
-        new_xmin, new_ymin, new_xmax, new_ymax = rio.windows.bounds(final_window, transform=source_raster.transform)
-        tfm = rio.transform.from_origin(new_xmin, new_ymax, *source_raster.res)
-
-        if source_raster.is_loaded:
+        final_window, final_window_disk, tfm = _crop_windows(source_raster, bounds=(xmin, ymin, xmax, ymax))
+
+        if final_window_disk is None:
             # In case data is loaded on disk, can extract directly from np array
             (rowmin, rowmax), (colmin, colmax) = final_window.toranges()
             crop_img = source_raster.data[..., rowmin:rowmax, colmin:colmax]
 
         else:
 
-            assert source_raster._disk_shape is not None  # This should not be the case, sanity check to make mypy happy
-
-            # If data was not loaded, and self's transform was updated (e.g. due to downsampling) need to
-            # get the Window corresponding to on disk data
-            ref_win_disk = rio.windows.from_bounds(
-                new_xmin, new_ymin, new_xmax, new_ymax, transform=source_raster._disk_transform
-            )
-            self_win_disk = rio.windows.from_bounds(
-                *source_raster.bounds, transform=source_raster._disk_transform
-            ).crop(*source_raster._disk_shape[1:])
-            final_window_disk = ref_win_disk.intersection(self_win_disk).round_lengths().round_offsets()
-
-            # Round up to downsampling size, to match __init__
-            final_window_disk = rio.windows.round_window_to_full_blocks(
-                final_window_disk, ((source_raster._downsample, source_raster._downsample),)
-            )
-
             # Load data for "on_disk" window but out_shape matching in-memory transform -> enforce downsampling
             # AD (24/04/24): Note that the same issue as #447 occurs here when final_window_disk extends beyond
             # self's bounds. Using option `boundless=True` solves the issue but causes other tests to fail
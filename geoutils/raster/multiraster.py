@@ -21,22 +21,26 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import numpy as np
 import rasterio as rio
 import rasterio.warp
+from scipy import ndimage
 from tqdm import tqdm
 
 import geoutils as gu
-from geoutils._typing import NDArrayNum
+from geoutils._typing import DTypeLike, MArrayNum, NDArrayBool, NDArrayNum
 from geoutils.raster._geotransformations import _resampling_method_from_str
 from geoutils.raster.array import get_array_and_mask
+from geoutils.raster.collection import RasterCollection
+from geoutils.raster.distributed_computing import MultiprocConfig
+from geoutils.raster.distributed_computing.multiproc import _multiproc_mosaic
 from geoutils.raster.raster import RasterType, _default_nodata
 
 
 def load_multiple_rasters(
-    raster_paths: list[str], crop: bool = True, ref_grid: int | None = None, **kwargs: Any
+    raster_paths: list[str] | RasterCollection, crop: bool = True, ref_grid: int | None = None, **kwargs: Any
 ) -> list[RasterType]:
     """
     Function to load multiple rasters at once in a memory efficient way.
@@ -45,7 +49,8 @@ def load_multiple_rasters(
     Optionally, reproject all rasters to the grid of one raster set as reference (after optional crop).
     Otherwise, simply load the full rasters.
 
-    :param raster_paths: List of paths to the rasters to be loaded.
+    :param raster_paths: List of paths to the rasters to be loaded, or collection of rasters (for which metadata is
+        read from its catalog).
     :param crop: If set to True, will only load rasters in the area they intersect.
     :param ref_grid: If set to an integer value, the raster with that index will be considered as the reference
         and all other rasters will be reprojected on the same grid (after optional crop).
@@ -63,20 +68,27 @@ def load_multiple_rasters(
     else:
         raise ValueError("`ref_grid` must be None or an integer")
 
-    # Need to define a reference CRS for calculating intersection
-    ref_crs = gu.Raster(raster_paths[ref_grid], load_data=False).crs
+    # For a collection, the reference CRS and bounds are derived from its catalog
+    if isinstance(raster_paths, RasterCollection):
+        ref_crs = raster_paths.get_metadata(ref_grid)["crs"]
+        output_rst = raster_paths.to_rasters()
+        bounds = [tuple(bound) for bound in raster_paths.get_bounds_projected(ref_crs)]
 
-    # First load all rasters metadata
-    output_rst = []
-    bounds = []
-    for path in raster_paths:
-        # Initialize raster
-        rst = gu.Raster(path, load_data=False)
-        output_rst.append(rst)
+    else:
+        # Need to define a reference CRS for calculating intersection
+        ref_crs = gu.Raster(raster_paths[ref_grid], load_data=False).crs
+
+        # First load all rasters metadata
+        output_rst = []
+        bounds = []
+        for path in raster_paths:
+            # Initialize raster
+            rst = gu.Raster(path, load_data=False)
+            output_rst.append(rst)
 
-        # Get bound in reference CRS
-        bound = rst.get_bounds_projected(ref_crs)
-        bounds.append(bound)
+            # Get bound in reference CRS
+            bound = rst.get_bounds_projected(ref_crs)
+            bounds.append(bound)
 
     # Second get the intersection of all raster bounds
     intersection = gu.projtools.merge_bounds(bounds, merging_algorithm="intersection")
@@ -118,21 +130,371 @@ def load_multiple_rasters(
                 out_rst.load()
             output_rst[index] = out_rst
 
-    # if no crop or reproject option, simply load the rasters
-    if (not crop) & (not reproject):
+    # if no reproject option, simply load the rasters (only in the cropped window, as the crop is lazy)
+    if not reproject:
         for rst in output_rst:
-            rst.load()
+            if not rst.is_loaded:
+                rst.load()
 
     return output_rst
 
 
-def stack_rasters(
+def _reproject_first_band(
+    raster: gu.Raster,
+    bounds: rio.coords.BoundingBox | tuple[float, float, float, float],
+    res: tuple[float, float],
+    crs: rio.crs.CRS,
+    dtype: DTypeLike,
+    nodata: int | float | None,
+    resampling_method: str | rio.enums.Resampling,
+) -> NDArrayNum:
+    """
+    Reproject the first band of a raster on a destination grid, to stack or merge it with other rasters.
+
+    :param raster: Raster to reproject.
+    :param bounds: Bounds of the destination grid.
+    :param res: Resolution of the destination grid.
+    :param crs: CRS of the destination grid.
+    :param dtype: Data type of the reprojected array.
+    :param nodata: Nodata value of the reference raster, defaults to that of the data type if None.
+    :param resampling_method: Resampling method for reprojection.
+
+    :return: Reprojected masked array of the first band.
+    """
+    if nodata is None:
+        nodata = _default_nodata(dtype)
+
+    reprojected_raster = raster.reproject(
+        bounds=bounds,
+        res=res,
+        crs=crs,
+        dtype=dtype,
+        nodata=nodata,
+        resampling=resampling_method,
+        silent=True,
+    )
+    # If the georeferenced grid was the same, reproject() will have returned self with a warning (silenced here),
+    # and we want to copy the raster and just modify its nodata (or would modify raster inputs of this function)
+    if reprojected_raster.georeferenced_grid_equal(raster):
+        reprojected_raster = reprojected_raster.copy()
+        reprojected_raster.set_nodata(nodata)
+
+    if reprojected_raster.count == 1:
+        return reprojected_raster.data[:]
+    return reprojected_raster.data[0, :]
+
+
+def _merge_stack(data: NDArrayNum, merge_algorithm: list[Callable]) -> NDArrayNum:  # type: ignore
+    """
+    Merge a stack of arrays along its first axis with each merging algorithm.
+
+    :param data: Stack of arrays of shape (N, height, width).
+    :param merge_algorithm: List of reductor functions.
+
+    :return: Masked array of merged arrays of shape (number of algorithms, height, width).
+    """
+    # Try to use the keyword axis=0 for the merging algorithm (if it's a numpy ufunc).
+    merged_data = []
+    for algo in merge_algorithm:
+        try:
+            merged_data.append(algo(data, axis=0))
+        # If that doesn't work, use the slower np.apply_along_axis approach.
+        except TypeError as exception:
+            if not (
+                "'axis' is an invalid keyword" in str(exception)
+                or "got an unexpected keyword argument 'axis'" in str(exception)
+            ):
+                raise exception
+            merged_data.append(np.apply_along_axis(algo, axis=0, arr=data))
+
+    # Convert to masked array
+    return np.ma.asarray(merged_data)
+
+
+# Names of the merging algorithms updated raster by raster, without stacking all rasters
+_STREAMING_MERGE_ALGORITHMS = ("mean", "count", "min", "max", "first", "last", "feather", "median")
+
+
+class _MergeAccumulator:
+    """
+    Per-pixel reducer of rasters on the same grid, updated one raster at a time so that the stack of all rasters is
+    never built.
+
+    The mean, count, minimum, maximum, first and last valid values, and feathered mean (weighted by distance to the
+    edges of valid data) use a constant memory. The median keeps a buffer of values per pixel, with a depth that is the
+    maximum number of valid values at a pixel, and a capacity that doubles when the depth exceeds it (so at most twice
+    the depth, with amortized copies). Merging tile by tile bounds the buffer to a tile times that capacity.
+    """
+
+    def __init__(self, merge_algorithm: str, shape: tuple[int, int], dtype: DTypeLike) -> None:
+        """
+        Initialize an empty accumulator.
+
+        :param merge_algorithm: Name of the merging algorithm.
+        :param shape: Shape of the grid.
+        :param dtype: Data type of the rasters.
+        """
+        self.merge_algorithm = merge_algorithm
+        self.count = np.zeros(shape, dtype=np.uint32)
+        if merge_algorithm in ["mean", "feather"]:
+            self.sum = np.zeros(shape, dtype=np.float64)
+            self.sum_weights = np.zeros(shape, dtype=np.float64)
+        elif merge_algorithm in ["min", "max", "first", "last"]:
+            self.values = np.zeros(shape, dtype=dtype)
+        elif merge_algorithm == "median":
+            # The buffer is padded with the largest value of the data type, so that the padding is sorted last
+            self.fill = np.inf if np.issubdtype(dtype, np.floating) else np.iinfo(dtype).max
+            self.values = np.full((0, *shape), self.fill, dtype=dtype)
+            self.depth = 0
+
+    def update(self, data: MArrayNum, weights: NDArrayNum | None = None) -> None:
+        """
+        Update the accumulator with the values of a raster.
+
+        :param data: Masked array of the raster.
+        :param weights: Weights of the raster values, only used by the feathered mean (defaults to one).
+        """
+        valid = ~np.ma.getmaskarray(data)
+        values = np.ma.getdata(data)
+        is_first = valid & (self.count == 0)
+
+        if self.merge_algorithm == "mean":
+            self.sum[valid] += values[valid]
+        elif self.merge_algorithm == "feather":
+            # Valid values always have a positive weight, even if resampling brought it to zero
+            weights_valid = (
+                np.maximum(weights[valid].astype(np.float64), np.finfo(np.float32).tiny) if weights is not None else 1
+            )
+            self.sum[valid] += weights_valid * values[valid]
+            self.sum_weights[valid] += weights_valid
+        elif self.merge_algorithm == "min":
+            update = is_first | (valid & (values < self.values))
+            self.values[update] = values[update]
+        elif self.merge_algorithm == "max":
+            update = is_first | (valid & (values > self.values))
+            self.values[update] = values[update]
+        elif self.merge_algorithm == "first":
+            self.values[is_first] = values[is_first]
+        elif self.merge_algorithm == "last":
+            self.values[valid] = values[valid]
+        elif self.merge_algorithm == "median":
+            # Grow the depth by one layer only when a pixel has more valid values than it, and double the capacity
+            # of the buffer when the depth exceeds it
+            if np.any(self.count[valid] >= self.depth):
+                self.depth += 1
+                if self.depth > self.values.shape[0]:
+                    capacity = max(2 * self.values.shape[0], 1)
+                    buffer = np.full((capacity, *self.count.shape), self.fill, dtype=self.values.dtype)
+                    buffer[: self.values.shape[0]] = self.values
+                    self.values = buffer
+            rows, cols = np.nonzero(valid)
+            self.values[self.count[valid], rows, cols] = values[valid]
+
+        self.count[valid] += 1
+
+    def result(self) -> MArrayNum:
+        """
+        Get the merged raster from the accumulated values.
+
+        :return: Masked array of the merged raster, masked where no raster was valid.
+        """
+        mask = self.count == 0
+        if self.merge_algorithm == "count":
+            return np.ma.masked_array(self.count)
+        if self.merge_algorithm == "mean":
+            merged = self.sum / np.maximum(self.count, 1)
+        elif self.merge_algorithm == "feather":
+            merged = self.sum / np.where(mask, 1, self.sum_weights)
+        elif self.merge_algorithm == "median":
+            # Average the values at the two middle ranks of each pixel, after sorting the buffer in place
+            merged = np.full(self.count.shape, np.nan)
+            if self.depth > 0:
+                buffer = self.values[: self.depth]
+                buffer.sort(axis=0)
+                count = self.count.astype(np.int64)[np.newaxis]
+                low = np.take_along_axis(buffer, np.maximum(count - 1, 0) // 2, axis=0)[0]
+                high = np.take_along_axis(buffer, count // 2, axis=0)[0]
+                merged = (low.astype(np.float64) + high) / 2
+        else:
+            merged = self.values
+        return np.ma.masked_array(merged, mask=mask)
+
+
+def _feather_weights(
+    mask: NDArrayBool, feather_distance: int, edges: tuple[bool, bool, bool, bool] = (True, True, True, True)
+) -> NDArrayNum:
+    """
+    Get feathering weights increasing linearly with the distance to the edges of valid data, up to a maximum distance.
+
+    As weights depend only on the data within the maximum distance, they are the same on a window with a halo of that
+    distance, with the window sides not on the edges of the raster considered to extend the data.
+
+    :param mask: Mask of invalid values.
+    :param feather_distance: Distance in pixels after which the weight is maximum.
+    :param edges: Whether the top, bottom, left and right sides of the array are edges of the raster.
+
+    :return: Weights between 0 (invalid) and 1.
+    """
+    # Pad the sides on the edges of the raster with invalid values, and the others with valid values
+    top, bottom, left, right = edges
+    valid = np.pad(~mask, ((1, 1), (0, 0)), constant_values=False)
+    valid[0, :], valid[-1, :] = not top, not bottom
+    valid = np.pad(valid, ((0, 0), (1, 1)), constant_values=False)
+    valid[:, 0], valid[:, -1] = not left, not right
+
+    distance = ndimage.distance_transform_edt(valid)[1:-1, 1:-1]
+    return np.minimum(distance / feather_distance, 1).astype(np.float32)
+
+
+def _reproject_feather_weights(
+    raster: gu.Raster,
+    feather_distance: int,
+    bounds: rio.coords.BoundingBox | tuple[float, float, float, float],
+    res: tuple[float, float],
+    crs: rio.crs.CRS,
+    resampling_method: str | rio.enums.Resampling,
+    edges: tuple[bool, bool, bool, bool] = (True, True, True, True),
+) -> NDArrayNum:
+    """
+    Compute the feathering weights of the first band of a raster on its grid, and reproject them on a destination
+    grid.
+
+    :param raster: Raster to compute the weights of.
+    :param feather_distance: Distance in pixels of the raster after which the weight is maximum.
+    :param bounds: Bounds of the destination grid.
+    :param res: Resolution of the destination grid.
+    :param crs: CRS of the destination grid.
+    :param resampling_method: Resampling method for reprojection.
+    :param edges: Whether the top, bottom, left and right sides of the raster array are edges of the full raster.
+
+    :return: Reprojected weights, zero outside the raster.
+    """
+    mask = np.ma.getmaskarray(raster.data)
+    if raster.count > 1:
+        mask = mask[0]
+    weights = gu.Raster.from_array(
+        _feather_weights(mask, feather_distance, edges), transform=raster.transform, crs=raster.crs, nodata=None
+    )
+    reprojected_weights = _reproject_first_band(
+        weights, bounds=bounds, res=res, crs=crs, dtype=np.float32, nodata=None, resampling_method=resampling_method
+    )
+    return np.ma.filled(reprojected_weights, 0)
+
+
+def _merge_streaming(layers: Iterable[tuple[MArrayNum, NDArrayNum | None]], merge_algorithm: list[str]) -> MArrayNum:
+    """
+    Merge rasters one at a time with streaming merging algorithms.
+
+    :param layers: Non-empty iterable of masked arrays of the rasters on the same grid, with their feathering weights
+        (or None).
+    :param merge_algorithm: List of names of streaming merging algorithms.
+
+    :return: Masked array of merged arrays of shape (number of algorithms, height, width).
+    """
+    accumulators: list[_MergeAccumulator] = []
+    for data, weights in layers:
+        if len(accumulators) == 0:
+            accumulators = [_MergeAccumulator(algo, data.shape, data.dtype) for algo in merge_algorithm]
+        for accumulator in accumulators:
+            accumulator.update(data, weights)
+
+    return np.ma.asarray([accumulator.result() for accumulator in accumulators])
+
+
+def _check_merge_algorithm(merge_algorithm: list[Callable | str]) -> bool:  # type: ignore
+    """
+    Check the merging algorithms, that must be either all functions or all names of streaming algorithms.
+
+    :param merge_algorithm: List of merging algorithms.
+
+    :return: Whether the merging algorithms are streaming.
+    """
+    is_streaming = [isinstance(algo, str) for algo in merge_algorithm]
+    if any(is_streaming):
+        if not all(is_streaming):
+            raise ValueError("merge_algorithm cannot mix names of streaming algorithms and functions.")
+        for algo in merge_algorithm:
+            if algo not in _STREAMING_MERGE_ALGORITHMS:
+                raise ValueError(
+                    f"merge_algorithm name must be one of {', '.join(_STREAMING_MERGE_ALGORITHMS)}, got '{algo}'."
+                )
+        return True
+
+    # Try to run the merge_algorithm with an arbitrary list. Raise an error if the algorithm is incompatible.
+    for algo in merge_algorithm:
+        try:
+            algo([1, 2])
+        except TypeError as exception:
+            raise TypeError(f"merge_algorithm must be able to take a list as its first argument.\n\n{exception}")
+    return False
+
+
+def _get_mosaic_bounds(
     rasters: list[RasterType],
+    reference_raster: gu.Raster,
+    use_ref_bounds: bool,
+    rasters_bounds: NDArrayNum | None = None,
+) -> rio.coords.BoundingBox:
+    """
+    Get the bounds of a mosaic of rasters, in the CRS of the reference raster.
+
+    :param rasters: List of rasters of the mosaic.
+    :param reference_raster: Reference raster.
+    :param use_ref_bounds: If True, will use reference bounds, otherwise will use maximum bounds of all rasters.
+    :param rasters_bounds: Bounds of the rasters in the CRS of the reference, if already known (e.g., from the
+        catalog of a collection).
+
+    :return: Bounds of the mosaic.
+    """
+    if use_ref_bounds:
+        return reference_raster.bounds
+    if rasters_bounds is None:
+        rasters_bounds = np.array(
+            [list(raster.get_bounds_projected(out_crs=reference_raster.crs)) for raster in rasters]
+        )
+    return gu.projtools.merge_bounds(rasters_bounds, resolution=reference_raster.res[0], return_rio_bbox=True)
+
+
+def _get_collection_rasters(
+    collection: RasterCollection, reference: int | gu.Raster, use_ref_bounds: bool, select: bool
+) -> tuple[list[gu.Raster], gu.Raster, NDArrayNum]:
+    """
+    Get the rasters of a collection to stack or merge from its catalog, without opening any file.
+
+    :param collection: Collection of rasters.
+    :param reference: Index of reference raster in the collection or separate reference raster.
+    :param use_ref_bounds: Whether the mosaic has the bounds of the reference.
+    :param select: Whether to keep only the rasters intersecting the bounds of the reference, selected with the
+        spatial index of the collection, if the mosaic has those bounds.
+
+    :return: Rasters not loaded, reference raster, and bounds of the rasters in the CRS of the reference.
+    """
+    if not isinstance(reference, (int, gu.Raster)):
+        raise ValueError("reference should be either an integer or geoutils.Raster object")
+    reference_raster = collection[reference] if isinstance(reference, int) else reference
+
+    if use_ref_bounds and select:
+        collection = collection.query(reference_raster.bounds, crs=reference_raster.crs)
+        if len(collection) == 0:
+            raise ValueError("No raster of the collection intersects the bounds of the reference raster.")
+        rasters = collection.to_rasters()
+    else:
+        rasters = collection.to_rasters()
+        # As for a list of rasters, the reference is the same object as the raster of the list
+        if isinstance(reference, int):
+            reference_raster = rasters[reference]
+
+    return rasters, reference_raster, collection.get_bounds_projected(reference_raster.crs)
+
+
+def stack_rasters(
+    rasters: list[RasterType] | RasterCollection,
     reference: int | gu.Raster = 0,
     resampling_method: str | rio.enums.Resampling = "bilinear",
     use_ref_bounds: bool = False,
     diff: bool = False,
     progress: bool = True,
+    multiproc_config: MultiprocConfig | None = None,
 ) -> gu.Raster:
     """
     Stack a list of rasters on their maximum extent into a multi-band raster.
@@ -148,16 +510,26 @@ def stack_rasters(
     Note that all rasters will be loaded once in memory. The data is only loaded for
     reprojection then deleted to optimize memory usage.
 
-    :param rasters: List of rasters to be stacked.
+    With a multiprocessing configuration, the stack is computed tile by tile without loading the full rasters:
+    each tile reads and reprojects only the windows of the rasters overlapping it, and is written directly to the
+    output file.
+
+    :param rasters: List of rasters to be stacked, or collection of rasters.
     :param reference: Index of reference raster in the list or separate reference raster.
         Defaults to the first raster in the list.
     :param resampling_method: Resampling method for reprojection.
     :param use_ref_bounds: If True, will use reference bounds, otherwise will use maximum bounds of all rasters.
     :param diff: If True, will return the difference to the reference raster.
     :param progress: If True, will display a progress bar. Default is True.
+    :param multiproc_config: Multiprocessing configuration, to compute the stack tile by tile and write it to a file.
 
     :returns: The merged raster with same CRS and resolution (and optionally bounds) as the reference.
     """
+    # For a collection, rasters and their bounds are derived from its catalog
+    rasters_bounds = None
+    if isinstance(rasters, RasterCollection):
+        rasters, reference, rasters_bounds = _get_collection_rasters(rasters, reference, use_ref_bounds, select=False)
+
     # Check resampling method
     if isinstance(resampling_method, str):
         resampling_method = _resampling_method_from_str(resampling_method)
@@ -175,13 +547,20 @@ def stack_rasters(
         raise ValueError("reference should be either an integer or geoutils.Raster object")
 
     # Set output bounds
-    if use_ref_bounds:
-        dst_bounds = reference_raster.bounds
-    else:
-        dst_bounds = gu.projtools.merge_bounds(
-            [raster.get_bounds_projected(out_crs=reference_raster.crs) for raster in rasters],
-            resolution=reference_raster.res[0],
-            return_rio_bbox=True,
+    dst_bounds = _get_mosaic_bounds(rasters, reference_raster, use_ref_bounds, rasters_bounds=rasters_bounds)
+
+    # Optionally, stack tile by tile
+    if multiproc_config is not None:
+        if diff:
+            raise ValueError("The difference to the reference raster is not supported with a multiprocessing config.")
+        return _multiproc_mosaic(
+            rasters,
+            reference_raster,
+            dst_bounds,
+            resampling_method,
+            multiproc_config,
+            progress=progress,
+            rasters_bounds=rasters_bounds,
         )
 
     # Make a data list and add all the reprojected rasters into it.
@@ -192,39 +571,24 @@ def stack_rasters(
         if not raster.is_loaded:
             raster.load()
 
-        nodata = (
-            reference_raster.nodata
-            if reference_raster.nodata is not None
-            else gu.raster.raster._default_nodata(reference_raster.data.dtype)
-        )
-        # Reproject to reference grid
-        reprojected_raster = raster.reproject(
+        # Reproject to reference grid, using only first band
+        reprojected_data = _reproject_first_band(
+            raster,
             bounds=dst_bounds,
             res=reference_raster.res,
             crs=reference_raster.crs,
             dtype=reference_raster.data.dtype,
-            nodata=nodata,
-            resampling=resampling_method,
-            silent=True,
+            nodata=reference_raster.nodata,
+            resampling_method=resampling_method,
         )
-        # If the georeferenced grid was the same, reproject() will have returned self with a warning (silenced here),
-        # and we want to copy the raster and just modify its nodata (or would modify raster inputs of this function)
-        if reprojected_raster.georeferenced_grid_equal(raster):
-            reprojected_raster = reprojected_raster.copy()
-            reprojected_raster.set_nodata(nodata)
 
         # Optionally calculate difference
         if diff:
-            diff_to_ref = (reference_raster.data - reprojected_raster.data).squeeze()
+            diff_to_ref = (reference_raster.data - reprojected_data).squeeze()
             diff_to_ref, _ = get_array_and_mask(diff_to_ref)
             data.append(diff_to_ref)
         else:
-            # img_data, _ = get_array_and_mask(reprojected_raster.data.squeeze())
-            # Use only first band
-            if reprojected_raster.count == 1:
-                data.append(reprojected_raster.data[:])
-            else:
-                data.append(reprojected_raster.data[0, :])
+            data.append(reprojected_data)
 
         # Remove unloaded rasters
         if not raster.is_loaded:
@@ -241,7 +605,7 @@ def stack_rasters(
     # Save as gu.Raster - needed as some child classes may not accept multiple bands
     r = gu.Raster.from_array(
         data=data,
-        transform=rio.transform.from_bounds(*dst_bounds, width=data[0].shape[1], height=data[0].shape[0]),
+        transform=rio.transform.from_origin(dst_bounds.left, dst_bounds.top, *reference_raster.res),
         crs=reference_raster.crs,
         nodata=nodata,
     )
@@ -250,12 +614,14 @@ def stack_rasters(
 
 
 def merge_rasters(
-    rasters: list[RasterType],
+    rasters: list[RasterType] | RasterCollection,
     reference: int | RasterType = 0,
-    merge_algorithm: Callable | list[Callable] = np.nanmean,  # type: ignore
+    merge_algorithm: Callable | str | list[Callable] | list[str] = np.nanmean,  # type: ignore
     resampling_method: str | rio.enums.Resampling = "bilinear",
     use_ref_bounds: bool = False,
     progress: bool = True,
+    multiproc_config: MultiprocConfig | None = None,
+    feather_distance: int = 20,
 ) -> RasterType:
     """
     Spatially merge a list of rasters into one larger raster of their maximum extent.
@@ -268,29 +634,46 @@ def merge_rasters(
     Note that all rasters will be loaded once in memory. The data is only loaded for
     reprojection then deleted to optimize memory usage.
 
-    :param rasters: List of rasters to be merged.
+    The merging algorithm can be a function applied to the stack of all reprojected rasters, or the name of a
+    streaming algorithm updated raster by raster, so that the stack is never built and memory scales with a single
+    raster: "mean", "count", "min", "max", "first" or "last" (first or last valid value in the order of the list),
+    "feather" (mean weighted by the distance to the edges of valid data of each raster, up to `feather_distance`) or
+    "median" (with a buffer per pixel as deep as the maximum number of valid values at a pixel, up to twice that in
+    capacity, which a multiprocessing configuration bounds to a tile).
+
+    With a multiprocessing configuration, the merge is computed tile by tile without loading the full rasters:
+    each tile reads and reprojects only the windows of the rasters overlapping it, which are merged and written
+    directly to the output file. Memory then scales with the tile size times the number of overlapping rasters.
+    The result is the same as in memory for merging algorithms ignoring rasters without data at a pixel (such as
+    the default), as the rasters not overlapping a tile are not passed to the algorithm.
+
+    :param rasters: List of rasters to be merged, or collection of rasters.
     :param reference: Index of reference raster in the list or separate reference raster.
         Defaults to the first raster in the list.
-    :param merge_algorithm: Reductor function (or list of functions) to merge the rasters with. Defaults to the mean.
-        If several algorithms are provided, each result is returned as a separate band.
+    :param merge_algorithm: Reductor function (or list of functions) to merge the rasters with, or name (or list of
+        names) of streaming algorithms. Defaults to the mean. If several algorithms are provided, each result is
+        returned as a separate band.
     :param resampling_method: Resampling method for reprojection.
     :param use_ref_bounds: If True, will use reference bounds, otherwise will use maximum bounds of all rasters.
     :param progress: If True, will display a progress bar. Default is True.
+    :param multiproc_config: Multiprocessing configuration, to compute the merge tile by tile and write it to a file.
+    :param feather_distance: For the "feather" algorithm, distance in pixels of each raster after which the weights
+        of its values stop increasing from the edges of its valid data.
 
     :returns: The merged raster with same CRS and resolution (and optionally bounds) as the reference.
     """
+    # For a collection, rasters and their bounds are derived from its catalog, keeping only those intersecting the
+    # reference if the merge has its bounds
+    rasters_bounds = None
+    if isinstance(rasters, RasterCollection):
+        rasters, reference, rasters_bounds = _get_collection_rasters(rasters, reference, use_ref_bounds, select=True)
+
     # Make sure merge_algorithm is a list
     if not isinstance(merge_algorithm, (list, tuple)):
         merge_algorithm = [
             merge_algorithm,
         ]
-
-    # Try to run the merge_algorithm with an arbitrary list. Raise an error if the algorithm is incompatible.
-    for algo in merge_algorithm:
-        try:
-            algo([1, 2])
-        except TypeError as exception:
-            raise TypeError(f"merge_algorithm must be able to take a list as its first argument.\n\n{exception}")
+    is_streaming = _check_merge_algorithm(merge_algorithm)
 
     # Select reference raster
     if isinstance(reference, int):
@@ -300,31 +683,71 @@ def merge_rasters(
     else:
         raise ValueError("reference should be either an integer or geoutils.Raster object")
 
-    # Reproject and stack all rasters
-    raster_stack = stack_rasters(
-        rasters,
-        reference=reference,
-        resampling_method=resampling_method,
-        use_ref_bounds=use_ref_bounds,
-        progress=progress,
-    )
+    # Check raster has a single band (already done when stacking)
+    if (multiproc_config is not None or is_streaming) and any(r.count > 1 for r in rasters):
+        warnings.warn("Some input Rasters have multiple bands, only their first band will be used.")
 
-    # Try to use the keyword axis=0 for the merging algorithm (if it's a numpy ufunc).
-    merged_data = []
-    for algo in merge_algorithm:
-        try:
-            merged_data.append(algo(raster_stack.data, axis=0))
-        # If that doesn't work, use the slower np.apply_along_axis approach.
-        except TypeError as exception:
-            if not (
-                "'axis' is an invalid keyword" in str(exception)
-                or "got an unexpected keyword argument 'axis'" in str(exception)
-            ):
-                raise exception
-            merged_data.append(np.apply_along_axis(algo, axis=0, arr=raster_stack.data))
+    # Feathering weights are only computed for the feathered mean
+    feather = feather_distance if is_streaming and "feather" in merge_algorithm else None
+
+    # Optionally, merge tile by tile
+    if multiproc_config is not None:
+        return _multiproc_mosaic(
+            rasters,
+            reference_raster,
+            _get_mosaic_bounds(rasters, reference_raster, use_ref_bounds, rasters_bounds=rasters_bounds),
+            resampling_method,
+            multiproc_config,
+            merge_algorithm=list(merge_algorithm),
+            progress=progress,
+            feather_distance=feather,
+            rasters_bounds=rasters_bounds,
+        )
+
+    if is_streaming:
+        # Reproject and merge rasters one at a time
+        dst_bounds = _get_mosaic_bounds(rasters, reference_raster, use_ref_bounds, rasters_bounds=rasters_bounds)
+
+        def reprojected_layers() -> Iterable[tuple[MArrayNum, NDArrayNum | None]]:
+            """Reproject each raster (and its feathering weights) to the reference grid, loading it temporarily."""
+            for raster in tqdm(rasters, disable=not progress):
+                is_loaded = raster.is_loaded
+                if not is_loaded:
+                    raster.load()
+                reproj_kwargs = {"bounds": dst_bounds, "res": reference_raster.res, "crs": reference_raster.crs}
+                data = _reproject_first_band(
+                    raster,
+                    dtype=reference_raster.dtype,
+                    nodata=reference_raster.nodata,
+                    resampling_method=resampling_method,
+                    **reproj_kwargs,
+                )
+                weights = (
+                    _reproject_feather_weights(raster, feather, resampling_method=resampling_method, **reproj_kwargs)
+                    if feather is not None
+                    else None
+                )
+                # Remove data of rasters that were not loaded
+                if not is_loaded:
+                    raster._data = None
+                yield data, weights
+
+        merged_data = _merge_streaming(reprojected_layers(), merge_algorithm)
+    else:
+        # Reproject and stack all rasters
+        raster_stack = stack_rasters(
+            rasters,
+            reference=reference,
+            resampling_method=resampling_method,
+            use_ref_bounds=use_ref_bounds,
+            progress=progress,
+        )
+        dst_bounds = raster_stack.bounds
+
+        # Merge the stack
+        merged_data = _merge_stack(raster_stack.data, merge_algorithm)
 
-    # Convert to masked array, and set all Nans to nodata
-    merged_data = np.ma.asarray(merged_data)
+    # Set all Nans to nodata
     if reference_raster.nodata is not None:
         nodata = reference_raster.nodata
     else:
@@ -334,9 +757,7 @@ def merge_rasters(
     # Save as gu.Raster
     merged_raster = reference_raster.from_array(
         data=np.reshape(merged_data, (len(merged_data),) + merged_data[0].shape),
-        transform=rio.transform.from_bounds(
-            *raster_stack.bounds, width=merged_data[0].shape[1], height=merged_data[0].shape[0]
-        ),
+        transform=rio.transform.from_origin(dst_bounds.left, dst_bounds.top, *reference_raster.res),
         crs=reference_raster.crs,
         nodata=nodata,
     )
@@ -23,20 +23,25 @@ Module for Raster class.
 
 from __future__ import annotations
 
+import concurrent.futures
+import copy
 import logging
 import math
 import pathlib
 import warnings
+import zlib
 from collections import abc
 from contextlib import ExitStack
 from math import floor
 from typing import IO, Any, Callable, TypeVar, overload
 
 import affine
+import dask.array as da
 import geopandas as gpd
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import rasterio as rio
 import rasterio.windows
 import rioxarray
@@ -59,12 +64,19 @@ from geoutils._typing import (
     Number,
 )
 from geoutils.interface.distance import _proximity_from_vector_or_raster
-from geoutils.interface.interpolate import _interp_points
+from geoutils.interface.interpolate import (
+    _GLOBAL_SPLINE_METHODS,
+    _interp_points,
+    _InterpolationContext,
+)
 from geoutils.interface.raster_point import (
+    _get_windows,
     _raster_to_pointcloud,
+    _read_windows,
+    _reduce_windows,
     _regular_pointcloud_to_raster,
 )
-from geoutils.interface.raster_vector import _polygonize
+from geoutils.interface.raster_vector import _polygonize, _zonal_stats
 from geoutils.misc import deprecate
 from geoutils.projtools import (
     _get_bounds_projected,
@@ -72,7 +84,19 @@ from geoutils.projtools import (
     _get_utm_ups_crs,
     reproject_from_latlon,
 )
-from geoutils.raster.distributed_computing.multiproc import MultiprocConfig
+from geoutils.raster.distributed_computing.dask import (
+    delayed_interp_points,
+    delayed_read,
+    delayed_subsample,
+    delayed_write,
+)
+from geoutils.raster.distributed_computing.multiproc import (
+    MultiprocConfig,
+    _multiproc_interp_points,
+    _multiproc_proximity,
+    _multiproc_statistics,
+    _multiproc_zonal_stats,
+)
 from geoutils.raster.georeferencing import (
     _bounds,
     _cast_nodata,
@@ -84,13 +108,23 @@ from geoutils.raster.georeferencing import (
     _res,
     _xy2ij,
 )
-from geoutils.raster.geotransformations import _crop, _reproject, _translate
+from geoutils.raster.geotransformations import (
+    _crop,
+    _crop_bounds,
+    _crop_windows,
+    _reproject,
+    _translate,
+)
 from geoutils.raster.sampling import subsample_array
 from geoutils.raster.satimg import (
     decode_sensor_metadata,
     parse_and_convert_metadata_from_filename,
 )
-from geoutils.stats import linear_error, nmad
+from geoutils.stats import (
+    _get_order_statistics,
+    _get_stats_dict,
+    _StatsAccumulator,
+)
 from geoutils.vector.vector import Vector
 
 # If python38 or above, Literal is builtin. Otherwise, use typing_extensions
@@ -217,16 +251,18 @@ def _load_rio(
     Useful ones are:
     .. hlist::
     * out_shape : to load a downsampled version, always use with out_count
-    * window : to load a cropped version
+    * window : to load a cropped version, can be used with out_shape
     * resampling : to set the resampling algorithm
     """
+    # A window on disk can be passed directly
+    window = kwargs.pop("window", None)
+
     # If out_shape is passed, no need to account for transform and shape
     if kwargs.get("out_shape") is not None:
-        window = None
         # If multi-band raster, the out_shape needs to contain the count
         if out_count is not None and out_count > 1:
             kwargs["out_shape"] = (out_count, *kwargs["out_shape"])
-    else:
+    elif window is None:
         if transform is not None and shape is not None:
             if transform == dataset.transform:
                 row_off, col_off = 0, 0
@@ -250,6 +286,21 @@ def _load_rio(
     return data
 
 
+def _array_checksum(array: MArrayNum) -> int:
+    """
+    Compute a checksum of the values and mask of an array, to detect writes in place.
+
+    :param array: Masked array.
+
+    :return: CRC32 checksum.
+    """
+    checksum = zlib.crc32(np.ascontiguousarray(np.ma.getdata(array)))
+    mask = np.ma.getmask(array)
+    if mask is not np.ma.nomask:
+        checksum = zlib.crc32(np.ascontiguousarray(mask), checksum)
+    return checksum
+
+
 def _cast_numeric_array_raster(
     raster: RasterType, other: RasterType | NDArrayNum | Number, operation_name: str
 ) -> tuple[MArrayNum, MArrayNum | NDArrayNum | Number, float | int | None, Literal["Area", "Point"] | None]:
@@ -377,10 +428,15 @@ class Raster:
         silent: bool = True,
         downsample: Number = 1,
         nodata: int | float | None = None,
+        chunks: int | tuple[int, int] | None = None,
     ) -> None:
         """
         Instantiate a raster from a filename or rasterio dataset.
 
+        If chunks are passed, the raster is lazy: its data is a masked dask array read from disk by windows for
+        each chunk, which is only computed on demand. Arithmetic, reproject(), subsample(), interp_points() and save()
+        are computed chunk by chunk, while other methods require to load the data in memory with load().
+
         :param filename_or_dataset: Path to file or Rasterio dataset.
         :param bands: Band(s) to load into the object. Default loads all bands.
         :param load_data: Whether to load the array during instantiation. Default is False.
@@ -388,6 +444,7 @@ class Raster:
         :param silent: Whether to parse metadata silently or with console output.
         :param downsample: Downsample the array once loaded by a round factor. Default is no downsampling.
         :param nodata: Nodata value to be used (overwrites the metadata). Default reads from metadata.
+        :param chunks: Chunk sizes (rows, columns) to read the raster lazily as a dask array. Default is not lazy.
         """
         self._driver: str | None = None
         self._name: str | None = None
@@ -404,16 +461,19 @@ class Raster:
         self._out_count: int | None = None
         self._out_shape: tuple[int, int] | None = None
         self._disk_hash: int | None = None
-        self._is_modified = True
+        self._data_version = 0
+        self._disk_version: int | None = None
+        self._interp_context: tuple[tuple[Any, ...], _InterpolationContext] | None = None
         self._disk_shape: tuple[int, int, int] | None = None
         self._disk_bands: tuple[int] | None = None
         self._disk_dtype: str | None = None
         self._disk_transform: affine.Affine | None = None
+        self._window: rio.windows.Window | None = None
         self._downsample: int | float = 1
         self._area_or_point: Literal["Area", "Point"] | None = None
         self._profile: dict[str, Any] | None = None
 
-        # This is for Raster.from_array to work.
+        # This is for Raster.from_array (and Raster._from_disk_metadata, without data) to work.
         if isinstance(filename_or_dataset, dict):
 
             self.tags = filename_or_dataset["tags"]
@@ -422,14 +482,17 @@ class Raster:
 
             # Need to set nodata before the data setter, which uses it
             # We trick set_nodata into knowing the data type by setting self._disk_dtype, then unsetting it
-            # (as a raster created from an array doesn't have a disk dtype)
-            if np.dtype(filename_or_dataset["data"].dtype) != bool:  # Exception for Mask class
-                self._disk_dtype = filename_or_dataset["data"].dtype
+            # (as a raster created from an array doesn't have a disk dtype, and one described on disk sets it below)
+            has_data = "data" in filename_or_dataset
+            dtype = filename_or_dataset["data"].dtype if has_data else filename_or_dataset["_disk_dtype"]
+            if np.dtype(dtype) != bool:  # Exception for Mask class
+                self._disk_dtype = dtype
                 self.set_nodata(filename_or_dataset["nodata"], update_array=False, update_mask=False)
                 self._disk_dtype = None
 
             # Then, we can set the data, transform and crs
-            self.data = filename_or_dataset["data"]
+            if has_data:
+                self.data = filename_or_dataset["data"]
             self.transform: rio.transform.Affine = filename_or_dataset["transform"]
             self.crs: rio.crs.CRS = filename_or_dataset["crs"]
 
@@ -512,26 +575,40 @@ class Raster:
             self._out_shape = out_shape
             self._out_count = count
 
-            if load_data:
+            if chunks is not None and self.filename is not None:
+                if downsample != 1:
+                    raise ValueError("Chunks cannot be used with downsampling, as the data is read lazily by windows.")
+                if isinstance(chunks, int):
+                    chunks = (chunks, chunks)
+                # Values equal to nodata are already masked by rasterio, as the nodata is that of the dataset
+                self._set_data(
+                    delayed_read(self.filename, chunks=chunks, bands=self.bands),
+                    nodata_masked=True,
+                )
+
+            elif load_data:
                 # Mypy doesn't like the out_shape for some reason. I can't figure out why! (erikmannerfelt, 14/01/2022)
                 # Don't need to pass shape and transform, because out_shape overrides it
-                self.data = _load_rio(
-                    ds,
-                    indexes=bands,
-                    masked=self._masked,
-                    out_shape=out_shape,
-                    out_count=count,
-                )  # type: ignore
+                # Values equal to nodata are already masked by rasterio if the nodata is that of the dataset
+                self._set_data(
+                    _load_rio(
+                        ds,
+                        indexes=bands,
+                        masked=self._masked,
+                        out_shape=out_shape,
+                        out_count=count,
+                    ),  # type: ignore
+                    nodata_masked=self._masked and self.nodata == ds.nodata,
+                )
 
             # Probably don't want to use set_nodata that can update array, setting self._nodata is sufficient
             # Set nodata only if data is loaded
             # if nodata is not None and self._data is not None:
             #     self.set_nodata(self._nodata)
 
-            # If data was loaded explicitly, initiate is_modified and save disk hash
-            if load_data and isinstance(filename_or_dataset, str):
-                self._is_modified = False
-                self._disk_hash = hash((self.data.tobytes(), self.transform, self.crs, self.nodata))
+            # If data was loaded explicitly, initiate is_modified by saving the data version and metadata hash
+            if (load_data or self.is_lazy) and isinstance(filename_or_dataset, str):
+                self._set_disk_state()
 
         # Provide a catch in case trying to load from data array
         elif isinstance(filename_or_dataset, np.ndarray):
@@ -557,10 +634,10 @@ class Raster:
     def count(self) -> int:
         """Count of bands loaded in memory if they are, otherwise the one on disk."""
         if self.is_loaded:
-            if self.data.ndim == 2:
+            if self._data.ndim == 2:  # type: ignore
                 return 1
             else:
-                return int(self.data.shape[0])
+                return int(self._data.shape[0])  # type: ignore
         #  This can only happen if data is not loaded, with a DatasetReader on disk is open, never returns None
         return self.count_on_disk  # type: ignore
 
@@ -574,11 +651,11 @@ class Raster:
                 return self._disk_shape[1]  # type: ignore
         else:
             # If the raster is single-band
-            if self.data.ndim == 2:
-                return int(self.data.shape[0])
+            if self._data.ndim == 2:  # type: ignore
+                return int(self._data.shape[0])  # type: ignore
             # Or multi-band
             else:
-                return int(self.data.shape[1])
+                return int(self._data.shape[1])  # type: ignore
 
     @property
     def width(self) -> int:
@@ -590,11 +667,11 @@ class Raster:
                 return self._disk_shape[2]  # type: ignore
         else:
             # If the raster is single-band
-            if self.data.ndim == 2:
-                return int(self.data.shape[1])
+            if self._data.ndim == 2:  # type: ignore
+                return int(self._data.shape[1])  # type: ignore
             # Or multi-band
             else:
-                return int(self.data.shape[2])
+                return int(self._data.shape[2])  # type: ignore
 
     @property
     def shape(self) -> tuple[int, int]:
@@ -622,15 +699,20 @@ class Raster:
 
     @property
     def is_loaded(self) -> bool:
-        """Whether the raster array is loaded."""
+        """Whether the raster array is loaded (in memory, or lazily as a dask array)."""
         return self._data is not None
 
+    @property
+    def is_lazy(self) -> bool:
+        """Whether the raster array is a lazy dask array, only computed on demand."""
+        return isinstance(self._data, da.Array)
+
     @property
     def dtype(self) -> str:
         """Data type of the raster (string representation)."""
         if not self.is_loaded and self._disk_dtype is not None:
             return self._disk_dtype
-        return str(self.data.dtype)
+        return str((self._data if self.is_loaded else self.data).dtype)  # type: ignore
 
     @property
     def bands_on_disk(self) -> None | tuple[int, ...]:
@@ -823,6 +905,7 @@ class Raster:
                 shape=self.shape,
                 out_shape=self._out_shape,
                 out_count=out_count,
+                window=self._window,
                 **kwargs,
             )
 
@@ -836,14 +919,32 @@ class Raster:
 
     def load(self, bands: int | list[int] | None = None, **kwargs: Any) -> None:
         """
-        Load the raster array from disk.
+        Load the raster array from disk, or compute it in memory if it is lazy.
 
         :param bands: Band(s) to load. Note that rasterio begins counting at 1, not 0.
         :param kwargs: Optional keyword arguments sent to '_load_rio()'.
 
-        :raises ValueError: If the data are already loaded.
+        :raises ValueError: If the data are already loaded, or if the bands or keyword arguments are invalid for a
+            lazy raster.
         :raises AttributeError: If no 'filename' attribute exists.
         """
+        # If the array is lazy, its values are already masked and only need to be computed
+        if self.is_lazy:
+            if len(kwargs) > 0:
+                raise ValueError(f"Cannot pass keyword arguments {list(kwargs)} when computing a lazy raster.")
+            data = self._data
+            if bands is not None:
+                # Bands of the lazy array are counted from 1 in their order in memory
+                valid_bands = (bands,) if isinstance(bands, int) else tuple(bands)
+                if len(valid_bands) == 0 or any(b not in self.bands for b in valid_bands):
+                    raise ValueError(f"Bands {valid_bands} must be among the bands of the lazy raster {self.bands}.")
+                if self.count > 1:
+                    positions = [b - 1 for b in valid_bands]
+                    data = data[positions[0]] if len(positions) == 1 else data[positions]  # type: ignore
+                self._bands_loaded = valid_bands
+            self._data = self._compute_lazy_data(data)  # type: ignore
+            return
+
         if self.is_loaded:
             raise ValueError("Data are already loaded.")
 
@@ -870,16 +971,21 @@ class Raster:
         self._bands_loaded = valid_bands
 
         # If a downsampled out_shape was defined during instantiation
+        # Values equal to nodata are already masked by rasterio if the nodata is that of the dataset
         with rio.open(self.filename) as dataset:
-            self.data = _load_rio(
-                dataset,
-                indexes=list(valid_bands),
-                masked=self._masked,
-                transform=self.transform,
-                shape=self.shape,
-                out_shape=self._out_shape,
-                out_count=self._out_count,
-                **kwargs,
+            self._set_data(
+                _load_rio(
+                    dataset,
+                    indexes=list(valid_bands),
+                    masked=self._masked,
+                    transform=self.transform,
+                    shape=self.shape,
+                    out_shape=self._out_shape,
+                    out_count=self._out_count,
+                    window=self._window,
+                    **kwargs,
+                ),
+                nodata_masked=self._masked and self.nodata == dataset.nodata,
             )
 
         # Probably don't want to use set_nodata() that updates the array
@@ -888,8 +994,24 @@ class Raster:
         #     self.set_nodata(nodata=self._nodata)
 
         # To have is_modified work correctly when data is loaded implicitly (not in init)
-        self._is_modified = False
-        self._disk_hash = hash((self.data.tobytes(), self.transform, self.crs, self.nodata))
+        self._set_disk_state()
+
+    def _compute_lazy_data(self, data: da.Array | None = None) -> MArrayNum:
+        """
+        Compute a lazy array of the raster in memory, without storing it in the raster.
+
+        :param data: Lazy array to compute, defaults to that of the raster.
+
+        :return: Masked array with the nodata of the raster as fill value.
+        """
+        computed = (self._data if data is None else data).compute()  # type: ignore
+        return np.ma.masked_array(data=np.ma.getdata(computed), mask=np.ma.getmask(computed), fill_value=self.nodata)
+
+    def _set_disk_state(self) -> None:
+        """Save the current data version and metadata hash as the reference state on disk, for is_modified."""
+
+        self._disk_version = self._data_version
+        self._disk_hash = hash((self.transform, self.crs, self.nodata))
 
     @classmethod
     def from_array(
@@ -961,6 +1083,84 @@ class Raster:
                 }
             )
 
+    @classmethod
+    def _from_disk_metadata(
+        cls: type[RasterType],
+        filename: str,
+        transform: Affine,
+        crs: CRS,
+        shape: tuple[int, int],
+        count: int,
+        dtype: str,
+        nodata: int | float | None,
+        area_or_point: Literal["Area", "Point"] | None = None,
+    ) -> RasterType:
+        """
+        Create a raster not loaded from the metadata of its file on disk, without opening the file.
+
+        This is used to create the rasters of a RasterCollection from its catalog. Tags of the file other than the
+        pixel interpretation are not read.
+
+        :param filename: Path to the raster file.
+        :param transform: Geotransform of the raster on disk.
+        :param crs: Coordinate reference system of the raster.
+        :param shape: Shape (height, width) of the raster on disk.
+        :param count: Number of bands on disk.
+        :param dtype: Data type of the raster on disk.
+        :param nodata: Nodata value on disk.
+        :param area_or_point: Pixel interpretation of the raster.
+
+        :returns: Raster not loaded, whose data is read from the file on demand.
+        """
+        return cls(
+            {
+                "transform": transform,
+                "crs": crs,
+                "nodata": nodata,
+                "area_or_point": area_or_point,
+                "tags": {},
+                "filename": str(filename),
+                "_disk_shape": (count, *shape),
+                "_disk_bands": tuple(range(1, count + 1)),
+                "_disk_dtype": dtype,
+                "_disk_transform": transform,
+                "_out_shape": shape,
+                "_out_count": count,
+            }
+        )
+
+    @classmethod
+    def open_many(
+        cls: type[RasterType],
+        paths: abc.Iterable[str | pathlib.Path],
+        workers: int | None = None,
+        metadata_only: bool = False,
+        **kwargs: Any,
+    ) -> list[RasterType] | pd.DataFrame:
+        """
+        Open many raster files without loading their data, reading their headers concurrently in a thread pool.
+
+        Reading headers is mostly waiting on file latency (for instance on network storage), which rasterio does
+        without holding the GIL, so that threads read many headers in parallel.
+
+        :param paths: Paths to the raster files.
+        :param workers: Number of threads. Defaults to that of concurrent.futures.ThreadPoolExecutor.
+        :param metadata_only: Whether to only read the metadata of each file into a table, without instantiating
+            rasters (skipping the parsing of tags and sensor metadata).
+        :param kwargs: Keyword arguments passed to Raster() for each file, except load_data (not used with
+            metadata_only).
+
+        :return: List of rasters not loaded, in the order of the paths, or table of their metadata with one row per
+            file (path, CRS, width, height, count, dtype, nodata and transform) if metadata_only is True.
+        """
+        from geoutils.raster.collection import _read_raster_metadata
+
+        paths = list(paths)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            if metadata_only:
+                return pd.DataFrame(list(executor.map(_read_raster_metadata, paths)))
+            return list(executor.map(lambda path: cls(path, load_data=False, **kwargs), paths))
+
     def to_rio_dataset(self) -> rio.io.DatasetReader:
         """Export to a Rasterio in-memory dataset."""
 
@@ -1141,6 +1341,7 @@ class Raster:
         # For multi-band rasters with a mask/array
         else:
             self._data[:, ind] = assign  # type: ignore
+        self._data_version += 1
         return None
 
     def raster_equal(self, other: RasterType, strict_masked: bool = True, warn_failure_reason: bool = False) -> bool:
@@ -1159,14 +1360,18 @@ class Raster:
         if not isinstance(other, Raster):
             raise NotImplementedError("Equality with other object than Raster not supported by raster_equal.")
 
+        # Lazy arrays are computed in memory for the comparison
+        self_data = self._compute_lazy_data() if self.is_lazy else self.data
+        other_data = other._compute_lazy_data() if other.is_lazy else other.data
+
         if strict_masked:
             names = ["data.data", "data.mask", "data.fill_value", "dtype", "transform", "crs", "nodata"]
             equalities = [
-                np.array_equal(self.data.data, other.data.data, equal_nan=True),
+                np.array_equal(self_data.data, other_data.data, equal_nan=True),
                 # Use getmaskarray to avoid comparing boolean with array when mask=False
-                np.array_equal(np.ma.getmaskarray(self.data), np.ma.getmaskarray(other.data)),
-                self.data.fill_value == other.data.fill_value,
-                self.data.dtype == other.data.dtype,
+                np.array_equal(np.ma.getmaskarray(self_data), np.ma.getmaskarray(other_data)),
+                self_data.fill_value == other_data.fill_value,
+                self_data.dtype == other_data.dtype,
                 self.transform == other.transform,
                 self.crs == other.crs,
                 self.nodata == other.nodata,
@@ -1174,9 +1379,9 @@ class Raster:
         else:
             names = ["data", "data.fill_value", "dtype", "transform", "crs", "nodata"]
             equalities = [
-                np.ma.allequal(self.data, other.data),
-                self.data.fill_value == other.data.fill_value,
-                self.data.dtype == other.data.dtype,
+                np.ma.allequal(self_data, other_data),
+                self_data.fill_value == other_data.fill_value,
+                self_data.dtype == other_data.dtype,
                 self.transform == other.transform,
                 self.crs == other.crs,
                 self.nodata == other.nodata,
@@ -1516,6 +1721,7 @@ class Raster:
 
         if inplace:
             self._data = out_data  # type: ignore
+            self._data_version += 1
             if convert_nodata:
                 self.set_nodata(new_nodata=_default_nodata(dtype))
             return None
@@ -1530,19 +1736,20 @@ class Raster:
     def is_modified(self) -> bool:
         """Whether the array has been modified since it was loaded from disk.
 
+        Modifications are tracked by a version counter updated by the data setter, index assignment, set_mask(),
+        set_nodata() and in-place operations, without reading the array. Writing directly into the array returned by
+        .data (e.g., raster.data[0, 0] = 1) is not tracked.
+
         :returns: True if raster has been modified.
 
         """
         if not self.is_loaded:
             return False
 
-        if not self._is_modified:
-            new_hash = hash(
-                (self._data.tobytes() if self._data is not None else 0, self.transform, self.crs, self.nodata)
-            )
-            self._is_modified = not (self._disk_hash == new_hash)
+        if self._disk_version is None or self._data_version != self._disk_version:
+            return True
 
-        return self._is_modified
+        return self._disk_hash != hash((self.transform, self.crs, self.nodata))
 
     @property
     def nodata(self) -> int | float | None:
@@ -1583,6 +1790,7 @@ class Raster:
         replaces the nodata values in the data of the masked array, and updates the mask of the masked array.
 
         Careful! If the new nodata value already exists in the array, the related grid cells will be masked by default.
+        For a lazy raster, the array is updated lazily and no warning is raised for those cells.
 
         If the nodata value was not defined in the raster, run this function with a new nodata value corresponding to
         the value of nodata that exists in the data array and is not yet accounted for. All those values will be masked.
@@ -1611,8 +1819,27 @@ class Raster:
             if not rio.dtypes.can_cast_dtype(new_nodata, self.dtype):
                 raise ValueError(f"Nodata value {new_nodata} incompatible with self.dtype {self.dtype}.")
 
+        # For a lazy array, the values and mask are updated lazily, so existing new nodata cells cannot be counted
+        # without computing the array and no warning is raised
+        if self.is_lazy and (update_array or update_mask):
+            values = da.ma.getdata(self._data)
+            mask = da.ma.getmaskarray(self._data)
+            no_cells = da.zeros_like(values, dtype=bool)
+            index_old_nodatas = values == self.nodata if self.nodata is not None else no_cells
+            index_new_nodatas = values == new_nodata if new_nodata is not None else no_cells
+
+            if update_array and new_nodata is not None:
+                values = da.where(index_old_nodatas, values.dtype.type(new_nodata), values)
+            if update_mask:
+                if not update_array or new_nodata is None:
+                    mask = mask & ~index_old_nodatas
+                mask = mask | index_new_nodatas
+
+            self._data = da.ma.masked_array(values, mask=mask)
+            self._data_version += 1
+
         # If we update mask or array, get the masked array
-        if update_array or update_mask:
+        elif update_array or update_mask:
 
             # Extract the data variable, so the self.data property doesn't have to be called a bunch of times
             imgdata = self.data
@@ -1664,12 +1891,13 @@ class Raster:
 
             # Update the data
             self._data = imgdata
+            self._data_version += 1
 
         # Update the nodata value
         self._nodata = new_nodata
 
-        # Update the fill value only if the data is loaded
-        if self.is_loaded:
+        # Update the fill value only if the data is loaded in memory (a lazy array gets it when computed)
+        if self.is_loaded and not self.is_lazy:
             self.data.fill_value = new_nodata
 
     @property
@@ -1702,8 +1930,24 @@ class Raster:
         :param new_data: New data to assign to this instance of Raster.
 
         """
-        # Check that new_data is a NumPy array
-        if not isinstance(new_data, np.ndarray):
+        self._set_data(new_data)
+
+    def _set_data(self, new_data: NDArrayNum | MArrayNum | da.Array, nodata_masked: bool = False) -> None:
+        """
+        Set the contents of .data and possibly update .nodata. See the data setter for details.
+
+        The array and its mask are scanned at most once for non-finite values (only for floating types) and once for
+        values equal to nodata, and the masks are combined only if they contain any values.
+
+        For a dask array, the values are masked lazily and never scanned, so no default nodata value is set and no
+        warning is raised for unmasked values equal to nodata.
+
+        :param new_data: New data to assign to this instance of Raster.
+        :param nodata_masked: Whether values equal to nodata are already known to be masked (e.g., for masked reads
+            of rasterio with the same nodata), to skip checking for them.
+        """
+        # Check that new_data is a NumPy or dask array
+        if not isinstance(new_data, (np.ndarray, da.Array)):
             raise ValueError("New data must be a numpy array.")
 
         if new_data.ndim not in [2, 3]:
@@ -1739,60 +1983,81 @@ class Raster:
         # (we accept setting an array with new dtype to mirror NumPy behaviour)
         self._nodata = _cast_nodata(new_data.dtype, self.nodata)
 
-        # If the new data is not masked and has non-finite values, we define a default nodata value
-        if (not np.ma.is_masked(new_data) and self.nodata is None and np.count_nonzero(~np.isfinite(new_data)) > 0) or (
-            np.ma.is_masked(new_data)
-            and self.nodata is None
-            and np.count_nonzero(~np.isfinite(new_data.data[~new_data.mask])) > 0
-        ):
-            warnings.warn(
-                "Setting default nodata {:.0f} to mask non-finite values found in the array, as "
-                "no nodata value was defined.".format(_default_nodata(dtype)),
-                UserWarning,
-            )
-            self._nodata = _default_nodata(dtype)
+        # For a lazy array, mask non-finite values and values equal to nodata chunk by chunk when computed
+        if isinstance(new_data, da.Array):
+            invalid = ~da.isfinite(new_data) if new_data.dtype.kind in ["f", "c"] else None
+            if not nodata_masked and self.nodata is not None:
+                invalid = new_data == self.nodata if invalid is None else invalid | (new_data == self.nodata)
+            if invalid is not None:
+                new_data = da.ma.masked_where(invalid, new_data)
+            elif not isinstance(new_data._meta, np.ma.MaskedArray):
+                new_data = da.ma.masked_array(new_data)
+            self._data = new_data
+            self._data_version += 1
+            return
 
-        # Now comes the important part, the data setting!
-        # Several cases to consider:
+        # Extract the array and mask once, the mask being "nomask" if there are no masked values
+        if np.ma.isMaskedArray(new_data):
+            array = new_data.data
+            mask = new_data.mask
+        else:
+            array = new_data
+            mask = np.ma.nomask
+
+        # Only floating or complex types can contain non-finite values, so we skip the check for other types
+        if array.dtype.kind in ["f", "c"]:
+            nonfinite = ~np.isfinite(array)
+            if np.count_nonzero(nonfinite) == 0:
+                nonfinite = None
+        else:
+            nonfinite = None
 
-        # 1/ If the new data is not masked (either classic array or masked array with no mask, hence the use of
-        # as array) and contains non-finite values such as NaNs, define a mask
-        if not np.ma.is_masked(new_data) and np.count_nonzero(~np.isfinite(new_data)) > 0:
-            self._data = np.ma.masked_array(
-                data=np.asarray(new_data), mask=~np.isfinite(new_data.data), fill_value=self.nodata
-            )
+        # If non-finite values are not masked, we mask them and, if undefined, set a default nodata value
+        if nonfinite is not None:
+            if mask is np.ma.nomask:
+                unmasked_nonfinite = True
+                mask = nonfinite
+            else:
+                unmasked_nonfinite = np.count_nonzero(np.logical_and(nonfinite, ~mask)) > 0
+                if unmasked_nonfinite:
+                    mask = np.logical_or(nonfinite, mask)
 
-        # 2/ If the new data is masked but some non-finite values aren't masked, add them to the mask
-        elif np.ma.is_masked(new_data) and np.count_nonzero(~np.isfinite(new_data.data[~new_data.mask])) > 0:
-            self._data = np.ma.masked_array(
-                data=new_data.data,
-                mask=np.logical_or(~np.isfinite(new_data.data), new_data.mask),
-                fill_value=self.nodata,
-            )
+            if unmasked_nonfinite and self.nodata is None:
+                warnings.warn(
+                    "Setting default nodata {:.0f} to mask non-finite values found in the array, as "
+                    "no nodata value was defined.".format(_default_nodata(dtype)),
+                    UserWarning,
+                )
+                self._nodata = _default_nodata(dtype)
 
-        # 3/ If the new data is a Masked Array, we pass data.data and data.mask independently (passing directly the
-        # masked array to data= has a strange behaviour that redefines fill_value)
-        elif np.ma.isMaskedArray(new_data):
-            self._data = np.ma.masked_array(data=new_data.data, mask=new_data.mask, fill_value=self.nodata)
+        # Mask values equal to the nodata value in case they weren't masked, but raise a warning
+        if not nodata_masked and self.nodata is not None:
+            index_nodata = array == self.nodata
+            if mask is np.ma.nomask:
+                unmasked_nodata = np.count_nonzero(index_nodata) > 0
+            else:
+                unmasked_nodata = np.count_nonzero(np.logical_and(index_nodata, ~mask)) > 0
 
-        # 4/ If the new data is classic ndarray
-        else:
-            self._data = np.ma.masked_array(data=new_data, fill_value=self.nodata)
+            if unmasked_nodata:
+                # This can happen during a numerical operation, especially for integer values that max out with a
+                # modulo. It can also happen with from_array()
+                warnings.warn(
+                    category=UserWarning,
+                    message="Unmasked values equal to the nodata value found in data array. They are now masked.\n "
+                    "If this happened when creating or updating the array, to silence this warning, "
+                    "convert nodata values in the array to np.nan or mask them with np.ma.masked prior "
+                    "to creating or updating the raster.\n"
+                    "If this happened during a numerical operation, use astype() prior to the operation "
+                    "to convert to a data type that won't derive the nodata values (e.g., a float type).",
+                )
+                mask = index_nodata if mask is np.ma.nomask else np.logical_or(index_nodata, mask)
 
-        # Finally, mask values equal to the nodata value in case they weren't masked, but raise a warning
-        if np.count_nonzero(np.logical_and(~self._data.mask, self._data.data == self.nodata)) > 0:
-            # This can happen during a numerical operation, especially for integer values that max out with a modulo
-            # It can also happen with from_array()
-            warnings.warn(
-                category=UserWarning,
-                message="Unmasked values equal to the nodata value found in data array. They are now masked.\n "
-                "If this happened when creating or updating the array, to silence this warning, "
-                "convert nodata values in the array to np.nan or mask them with np.ma.masked prior "
-                "to creating or updating the raster.\n"
-                "If this happened during a numerical operation, use astype() prior to the operation "
-                "to convert to a data type that won't derive the nodata values (e.g., a float type).",
-            )
-            self._data[self._data.data == self.nodata] = np.ma.masked
+        # Pass the array and mask independently (passing directly the masked array to data= has a strange behaviour
+        # that redefines fill_value)
+        self._data = np.ma.masked_array(data=array, mask=mask, fill_value=self.nodata)
+
+        # Update the data version for is_modified
+        self._data_version += 1
 
     @property
     def transform(self) -> affine.Affine:
@@ -1883,14 +2148,23 @@ class Raster:
         else:
             raise AttributeError("self.data must be loaded first, with e.g. self.load()")
 
-        # If the mask is a Mask instance, pass the boolean array
+        # If the mask is a Mask instance, pass the boolean array (lazy if the mask is lazy)
         if isinstance(mask, Mask):
-            mask_arr = mask.data.filled(False)
+            mask_arr = da.ma.filled(mask.data, False) if mask.is_lazy else mask.data.filled(False)
         else:
             mask_arr = mask
         mask_arr = mask_arr.squeeze()
+        if not self.is_lazy and isinstance(mask_arr, da.Array):
+            mask_arr = mask_arr.compute()
 
-        if mask_arr.shape != orig_shape:
+        # For a lazy array, the mask is combined lazily (broadcasting a 2D mask to all bands)
+        if self.is_lazy:
+            if mask_arr.shape != orig_shape and orig_shape[1:] != mask_arr.shape:
+                raise ValueError(f"mask must be of the same shape as existing data: {orig_shape}.")
+            self._data = da.ma.masked_array(
+                da.ma.getdata(self._data), mask=da.ma.getmaskarray(self._data) | (mask_arr > 0)
+            )
+        elif mask_arr.shape != orig_shape:
             # In case first dimension is more than one (several bands) and other dimensions match
             if orig_shape[1:] == mask_arr.shape:
                 self.data[:, mask_arr > 0] = np.ma.masked
@@ -1898,60 +2172,77 @@ class Raster:
                 raise ValueError(f"mask must be of the same shape as existing data: {orig_shape}.")
         else:
             self.data[mask_arr > 0] = np.ma.masked
+        self._data_version += 1
 
-    def _statistics(self, band: int = 1, counts: tuple[int, int] | None = None) -> dict[str, np.floating[Any]]:
+    def _statistics(
+        self,
+        band: int = 1,
+        counts: tuple[int, int] | None = None,
+        inlier_mask: Mask | NDArrayBool | None = None,
+        stats_names: list[str] | None = None,
+    ) -> dict[str, np.floating[Any]]:
         """
         Calculate common statistics for a specified band in the raster.
 
+        The valid values are extracted once, moments are computed in a single accumulator, and all requested order
+        statistics are derived from a single partition of the values.
+
         :param band: The index of the band for which to compute statistics. Default is 1.
         :param counts: (number of finite data points in the array, number of valid points in inlier_mask).
+        :param inlier_mask: A boolean mask of values to exclude from statistics.
+        :param stats_names: Names of the statistics to compute. Defaults to all.
 
         :returns: A dictionary containing the calculated statistics for the selected band.
         """
 
-        if self.count == 1:
-            data = self.data
-        else:
-            data = self.data[band - 1]
-
-        # Compute the statistics
-        mdata = np.ma.filled(data.astype(float), np.nan)
-        valid_count = np.count_nonzero(~self.get_mask()) if counts is None else counts[0]
-        stats_dict = {
-            "Mean": np.ma.mean(data),
-            "Median": np.ma.median(data),
-            "Max": np.ma.max(data),
-            "Min": np.ma.min(data),
-            "Sum": np.ma.sum(data),
-            "Sum of squares": np.ma.sum(np.square(data)),
-            "90th percentile": np.nanpercentile(mdata, 90),
-            "LE90": linear_error(mdata, interval=90),
-            "NMAD": nmad(data),
-            "RMSE": np.sqrt(np.ma.mean(np.square(data))),
-            "Standard deviation": np.ma.std(data),
-            "Valid count": valid_count,
-            "Total count": data.size,
-            "Percentage valid points": (valid_count / data.size) * 100,
-        }
+        data = self._get_band_data(band)
+        mask = np.ma.getmaskarray(data)
+        valid_count = np.count_nonzero(~mask) if counts is None else counts[0]
 
-        if counts is not None:
-            valid_inlier_count = np.count_nonzero(~self.get_mask())
-            stats_dict.update(
-                {
-                    "Valid inlier count": valid_inlier_count,
-                    "Total inlier count": counts[1],
-                    "Percentage inlier points": (valid_inlier_count / counts[0]) * 100,
-                    "Percentage valid inlier points": (valid_inlier_count / counts[1]) * 100 if counts[1] != 0 else 0,
-                }
-            )
+        # Exclude values outside the inlier mask, without copying the raster
+        total_inlier_count = counts[1] if counts is not None else None
+        if inlier_mask is not None:
+            inlier_arr = self._get_inlier_array(inlier_mask, band)
+            total_inlier_count = np.count_nonzero(~inlier_arr)
+            mask = np.logical_or(mask, inlier_arr)
+
+        # Extract valid values once, in double precision
+        values = np.ma.getdata(data)[~mask].astype(np.float64)
+
+        acc = _StatsAccumulator.from_values(values)
+        order_stats = _get_order_statistics(values, stats_names=stats_names)
+
+        return _get_stats_dict(acc, order_stats, valid_count, data.size, total_inlier_count=total_inlier_count)
+
+    def _get_band_data(self, band: int = 1) -> MArrayNum:
+        """
+        Get the data of a band of the raster.
+
+        :param band: The index of the band.
+
+        :returns: Data of the band.
+        """
+        return self.data if self.count == 1 else self.data[band - 1]
+
+    def _get_inlier_array(self, inlier_mask: Mask | NDArrayBool, band: int = 1) -> NDArrayBool:
+        """
+        Get the boolean array of an inlier mask of values to exclude, for a band of the raster.
 
-        # If there are no valid data points, set all statistics to NaN
-        if np.count_nonzero(~self.get_mask()) == 0:
-            logging.warning("Empty raster, returns Nan for all stats")
-            for key in stats_dict:
-                stats_dict[key] = np.nan
+        :param inlier_mask: A boolean mask of values to exclude, either of the shape of a band or of the raster.
+        :param band: The index of the band.
 
-        return stats_dict
+        :returns: Boolean array of values to exclude.
+        """
+        if isinstance(inlier_mask, Mask):
+            inlier_arr = inlier_mask.data.filled(False)
+        else:
+            inlier_arr = np.asarray(inlier_mask)
+        inlier_arr = inlier_arr.squeeze() > 0
+        if self.count > 1 and inlier_arr.shape == (self.count, *self.shape):
+            inlier_arr = inlier_arr[band - 1]
+        if inlier_arr.shape != self.shape:
+            raise ValueError(f"mask must be of the same shape as existing data: {self.shape}.")
+        return inlier_arr
 
     @overload
     def get_stats(
@@ -1960,6 +2251,7 @@ class Raster:
         inlier_mask: Mask | NDArrayBool | None = None,
         band: int = 1,
         counts: tuple[int, int] | None = None,
+        multiproc_config: MultiprocConfig | None = None,
     ) -> np.floating[Any]: ...
 
     @overload
@@ -1969,6 +2261,7 @@ class Raster:
         inlier_mask: Mask | NDArrayBool | None = None,
         band: int = 1,
         counts: tuple[int, int] | None = None,
+        multiproc_config: MultiprocConfig | None = None,
     ) -> dict[str, np.floating[Any]]: ...
 
     def get_stats(
@@ -1979,6 +2272,7 @@ class Raster:
         inlier_mask: Mask | NDArrayBool | None = None,
         band: int = 1,
         counts: tuple[int, int] | None = None,
+        multiproc_config: MultiprocConfig | None = None,
     ) -> np.floating[Any] | dict[str, np.floating[Any]]:
         """
         Retrieve specified statistics or all available statistics for the raster data. Allows passing custom callables
@@ -1993,24 +2287,75 @@ class Raster:
         :param inlier_mask: A boolean mask to filter values for statistical calculations.
         :param band: The index of the band for which to compute statistics. Default is 1.
         :param counts: (number of finite data points in the array, number of valid points in inlier_mask). DO NOT USE.
+        :param multiproc_config: Multiprocessing configuration to compute statistics tile by tile, without loading the
+            raster in memory. Custom callables are not supported in this case.
         :returns: The requested statistic or a dictionary of statistics if multiple or all are requested.
         """
-        if not self.is_loaded:
-            self.load()
-        if inlier_mask is not None:
-            valid_points = np.count_nonzero(~self.get_mask())
-            if isinstance(inlier_mask, Mask):
-                inlier_points = np.count_nonzero(~inlier_mask.data)
-            else:
-                inlier_points = np.count_nonzero(~inlier_mask)
-            dem_masked = self.copy()
-            dem_masked.set_mask(inlier_mask)
-            return dem_masked.get_stats(stats_name=stats_name, band=band, counts=(valid_points, inlier_points))
-        stats_dict = self._statistics(band=band, counts=counts)
+        stats_aliases = self._get_stats_aliases(inlier=inlier_mask is not None or counts is not None)
+
+        # Compute only the statistics that are requested
+        names = stats_name if isinstance(stats_name, list) else [stats_name] if stats_name is not None else []
+        stats_names = (
+            [stats_aliases.get(self._normalize_stat_name(name), name) for name in names if not callable(name)]
+            if stats_name is not None
+            else None
+        )
+
+        if multiproc_config is not None:
+            if any(callable(name) for name in names):
+                raise ValueError("Custom callables are not supported for statistics with a multiprocessing config.")
+            stats_dict = _multiproc_statistics(
+                self, multiproc_config, band=band, inlier_mask=inlier_mask, stats_names=stats_names
+            )
+        else:
+            if not self.is_loaded:
+                self.load()
+            stats_dict = self._statistics(band=band, counts=counts, inlier_mask=inlier_mask, stats_names=stats_names)
+
         if stats_name is None:
             return stats_dict
 
-        # Define the metric aliases and their actual names
+        # Custom callables are passed the band data masked outside inliers
+        if any(callable(name) for name in names):
+            data = self._get_band_data(band)
+            if inlier_mask is not None:
+                inlier_arr = self._get_inlier_array(inlier_mask, band)
+                data = np.ma.masked_array(data, mask=np.logical_or(np.ma.getmaskarray(data), inlier_arr))
+
+        if isinstance(stats_name, list):
+            result = {}
+            for name in stats_name:
+                if callable(name):
+                    result[name.__name__] = name(data)
+                else:
+                    result[name] = self._get_single_stat(stats_dict, stats_aliases, name)
+            return result
+        else:
+            if callable(stats_name):
+                return stats_name(data)
+            else:
+                return self._get_single_stat(stats_dict, stats_aliases, stats_name)
+
+    @staticmethod
+    def _normalize_stat_name(stat_name: str) -> str:
+        """
+        Normalize the name of a statistic to match its aliases.
+
+        :param stat_name: The name or alias of the statistic.
+
+        :returns: The normalized name.
+        """
+        return stat_name.lower().replace(" ", "").replace("_", "").replace("-", "")
+
+    @staticmethod
+    def _get_stats_aliases(inlier: bool = False) -> dict[str, str]:
+        """
+        Get the aliases of statistic names mapped to their actual names.
+
+        :param inlier: Whether to include the aliases of statistics on inliers.
+
+        :returns: The dictionary of alias mappings to the actual stat names.
+        """
         stats_aliases = {
             "mean": "Mean",
             "median": "Median",
@@ -2033,7 +2378,7 @@ class Raster:
             "totalcount": "Total count",
             "percentagevalidpoints": "Percentage valid points",
         }
-        if counts is not None:
+        if inlier:
             stats_aliases.update(
                 {
                     "validinliercount": "Valid inlier count",
@@ -2043,19 +2388,7 @@ class Raster:
                 }
             )
 
-        if isinstance(stats_name, list):
-            result = {}
-            for name in stats_name:
-                if callable(name):
-                    result[name.__name__] = name(self.data[band] if self.count > 1 else self.data)
-                else:
-                    result[name] = self._get_single_stat(stats_dict, stats_aliases, name)
-            return result
-        else:
-            if callable(stats_name):
-                return stats_name(self.data[band] if self.count > 1 else self.data)
-            else:
-                return self._get_single_stat(stats_dict, stats_aliases, stats_name)
+        return stats_aliases
 
     @staticmethod
     def _get_single_stat(
@@ -2071,7 +2404,7 @@ class Raster:
         :returns: The requested statistic value, or None if the stat name is not recognized.
         """
 
-        normalized_name = stat_name.lower().replace(" ", "").replace("_", "").replace("-", "")
+        normalized_name = Raster._normalize_stat_name(stat_name)
         if normalized_name in stats_aliases:
             actual_name = stats_aliases[normalized_name]
             return stats_dict[actual_name]
@@ -2079,6 +2412,56 @@ class Raster:
             logging.warning("Statistic name '%s' is not recognized", stat_name)
             return np.float32(np.nan)
 
+    def zonal_stats(
+        self,
+        vector: Vector | gpd.GeoDataFrame,
+        stats_name: str | list[str] | None = None,
+        band: int = 1,
+        multiproc_config: MultiprocConfig | None = None,
+    ) -> pd.DataFrame:
+        """
+        Compute statistics of the raster within each feature of a vector (zonal statistics).
+
+        All features are rasterized at once on the raster grid into integer labels, and statistics are computed for all
+        features in a single pass with grouped reductions. Pixels are attributed to features whose geometry covers
+        their center, and overlapping features are rasterized in separate layers so that they share their pixels.
+
+        :param vector: Vector of features (e.g., polygons) defining the zones.
+        :param stats_name: Name or list of names of the statistics to compute, see Raster.get_stats() for accepted
+            names. If None, all statistics are computed.
+        :param band: The index of the band for which to compute statistics. Default is 1.
+        :param multiproc_config: Multiprocessing configuration to compute statistics tile by tile, without loading the
+            raster in memory. Only features intersecting a tile are rasterized on that tile.
+
+        :returns: Dataframe of statistics with one row per feature (with the same index as the vector), and one column
+            per statistic.
+        """
+        stats_aliases = self._get_stats_aliases()
+        names = [stats_name] if isinstance(stats_name, str) else stats_name
+        stats_names = (
+            [stats_aliases.get(self._normalize_stat_name(name), name) for name in names] if names is not None else None
+        )
+
+        if multiproc_config is not None:
+            stats_dict = _multiproc_zonal_stats(self, vector, multiproc_config, stats_names=stats_names, band=band)
+        else:
+            if not self.is_loaded:
+                self.load()
+            stats_dict = _zonal_stats(self, vector, stats_names=stats_names, band=band)
+
+        gdf = vector.ds if isinstance(vector, Vector) else vector
+        if names is not None:
+            columns = {}
+            for name, actual_name in zip(names, stats_names):  # type: ignore
+                if actual_name in stats_dict:
+                    columns[name] = stats_dict[actual_name]
+                else:
+                    logging.warning("Statistic name '%s' is not recognized", name)
+                    columns[name] = np.full(len(gdf), np.nan)
+            stats_dict = columns
+
+        return pd.DataFrame(stats_dict, index=gdf.index)
+
     @overload
     def info(self, stats: bool = False, *, verbose: Literal[True] = ...) -> None: ...
 
@@ -2206,21 +2589,33 @@ class Raster:
         :returns Array with masked data as NaNs, (Optional) Mask of invalid data.
         """
 
+        if not self.is_loaded:
+            self.load()
+        data: MArrayNum = self._data  # type: ignore
+
+        # For a lazy array, the NaN array and mask are also lazy, and filled chunk by chunk when computed
+        if self.is_lazy:
+            darr = data.astype(floating_dtype) if "int" in str(data.dtype) else data
+            nanarray = da.ma.filled(darr, np.nan)
+            if return_mask:
+                return nanarray, da.ma.getmaskarray(data)
+            return nanarray
+
         # Cast array to float32 is its dtype is integer (cannot be filled with NaNs otherwise)
-        if "int" in str(self.data.dtype):
+        if "int" in str(data.dtype):
             # Get the array with masked value fill with NaNs
-            nanarray = self.data.astype(floating_dtype).filled(fill_value=np.nan).squeeze()
+            nanarray = data.astype(floating_dtype).filled(fill_value=np.nan).squeeze()
         else:
             # Same here
-            nanarray = self.data.filled(fill_value=np.nan).squeeze()
+            nanarray = data.filled(fill_value=np.nan).squeeze()
 
         # The function np.ma.filled() only returns a copy if the array is masked, copy the array if it's not the case
-        if not np.ma.is_masked(self.data):
+        if not np.ma.is_masked(data):
             nanarray = np.copy(nanarray)
 
         # Return the NaN array, and possibly the mask as well
         if return_mask:
-            return nanarray, np.copy(np.ma.getmaskarray(self.data).squeeze())
+            return nanarray, np.copy(np.ma.getmaskarray(data).squeeze())
         else:
             return nanarray
 
@@ -2481,10 +2876,15 @@ class Raster:
         :returns: A new raster (or None if inplace).
         """
 
+        # If the raster is not loaded, crop lazily by only updating the window to read on disk
+        if not self.is_loaded and mode == "match_pixel":
+            return self._crop_unloaded(bounds=_crop_bounds(source_raster=self, bbox=bbox), inplace=inplace)
+
         crop_img, tfm = _crop(source_raster=self, bbox=bbox, mode=mode)
 
         if inplace:
             self._data = crop_img
+            self._data_version += 1
             self.transform = tfm
             return None
         else:
@@ -2521,16 +2921,51 @@ class Raster:
 
         :returns: Cropped raster or None (if inplace=True).
         """
+        # If the raster is not loaded, crop lazily by only updating the window to read on disk
+        if not self.is_loaded:
+            return self._crop_unloaded(
+                bounds=_crop_bounds(source_raster=self, bbox=bbox, distance_unit="pixel"), inplace=inplace
+            )
+
         crop_img, tfm = _crop(source_raster=self, bbox=bbox, distance_unit="pixel")
 
         if inplace:
             self._data = crop_img
+            self._data_version += 1
             self.transform = tfm
             return None
         else:
             newraster = self.from_array(crop_img, tfm, self.crs, self.nodata, self.area_or_point)
             return newraster
 
+    def _crop_unloaded(
+        self: RasterType, bounds: tuple[float, float, float, float], inplace: bool = False
+    ) -> RasterType | None:
+        """
+        Crop an unloaded raster without reading data, by updating the window to read on disk.
+
+        The data of the window only is read when .data is first accessed. Nested crops compose their windows, as the
+        window is always defined in the transform on disk.
+
+        :param bounds: Bounds to crop to (xmin, ymin, xmax, ymax), in the CRS of the raster.
+        :param inplace: If True, modify the raster in place. Otherwise, return a new cropped raster.
+
+        :returns: Cropped unloaded raster or None (if inplace=True).
+        """
+        final_window, final_window_disk, tfm = _crop_windows(self, bounds=bounds)
+
+        if inplace:
+            rst = self
+        else:
+            rst = copy.copy(self)
+            rst.tags = self.tags.copy()
+
+        rst._window = final_window_disk
+        rst._out_shape = (int(final_window.height), int(final_window.width))
+        rst.transform = tfm
+
+        return None if inplace else rst
+
     @overload
     def reproject(
         self: RasterType,
@@ -2818,6 +3253,13 @@ class Raster:
                     warnings.warn(f"No nodata set, will use default value of {nodata}")
                 save_data = save_data.filled(nodata)
 
+            # If lazy array, fill masked values chunk by chunk (they cannot be counted without computing them)
+            elif isinstance(save_data, da.Array):
+                if nodata is None:
+                    nodata = _default_nodata(save_data.dtype)
+                    warnings.warn(f"No nodata set, will use default value of {nodata}")
+                save_data = da.ma.filled(save_data, nodata)
+
         # Cast to 3D before saving if single band
         if self.count == 1:
             save_data = save_data[np.newaxis, :, :]
@@ -2837,7 +3279,11 @@ class Raster:
             tiled=tiled,
             **co_opts,
         ) as dst:
-            dst.write(save_data)
+            # A lazy array is computed and written chunk by chunk
+            if isinstance(save_data, da.Array):
+                delayed_write(save_data, dst)
+            else:
+                dst.write(save_data)
 
             # Add metadata (tags in rio)
             dst.update_tags(**meta)
@@ -3195,7 +3641,9 @@ class Raster:
 
         By default, samples pixel value of each band. Can be passed a band index to sample from.
 
-        Uses Rasterio's windowed reading to keep memory usage low (for a raster not loaded).
+        For a single band, the windows of all points are gathered at once and reduced along an axis for common reducers
+        (mean, median, min, max, std, sum). For a raster not loaded, Rasterio's windowed reading keeps memory usage low,
+        and each block of the file is read only once for all points falling in it.
 
         :param points: Point(s) at which to interpolate raster value (tuple of X/Y array-likes). If points fall
             outside of image, value returned is nan.
@@ -3266,85 +3714,106 @@ class Raster:
                 value = None
             return value
 
-        # Initiate output lists
-        list_values = []
-        if return_window:
-            list_windows = []
-
-        # Convert to latlon if asked
-        if input_latlon:
-            x, y = reproject_from_latlon((y, x), self.crs)  # type: ignore
-
-        # Convert coordinates to pixel space
-        rows, cols = rio.transform.rowcol(self.transform, x, y, op=floor)
-
-        # Loop over all coordinates passed
-        for k in range(len(rows)):  # type: ignore
-            value: float | dict[int, float] | tuple[float | dict[int, float] | tuple[list[float], NDArrayNum] | Any]
-
-            row = rows[k]  # type: ignore
-            col = cols[k]  # type: ignore
-
-            # Decide what pixel coordinates to read:
-            if window is not None:
-                half_win = (window - 1) / 2
-                # Subtract start coordinates back to top left of window
-                col = col - half_win
-                row = row - half_win
-                # Offset to read to == window
-                width = window
-                height = window
-            else:
-                # Start reading at col,row and read 1px each way
-                width = 1
-                height = 1
-
-            # Make sure coordinates are int
-            col = int(col)
-            row = int(row)
+        # Define subfunction for reading and reducing the window of a single point
+        def reduce_point(row: int, col: int) -> tuple[Any, Any]:
+            """Read and reduce the window of a point, from the upper-left pixel of the window"""
 
             # Create rasterio's window for reading
-            rio_window = rio.windows.Window(col, row, width, height)
+            rio_window = rio.windows.Window(col, row, size, size)
 
             if self.is_loaded:
                 if self.count == 1:
-                    data = self.data[row : row + height, col : col + width]
+                    data = self.data[row : row + size, col : col + size]
                 else:
-                    data = self.data[slice(None) if band is None else band - 1, row : row + height, col : col + width]
+                    data = self.data[slice(None) if band is None else band - 1, row : row + size, col : col + size]
+                if self.is_lazy:
+                    data = data.compute()
                 if not masked:
                     data = data.astype(np.float32).filled(np.nan)
-                value = format_value(data)
-                win: NDArrayNum | dict[int, NDArrayNum] = data
+                return format_value(data), data
+
+            # For a lazily cropped raster, shift the window to its position on disk
+            if self._window is not None:
+                rio_window = rio.windows.Window(col + self._window.col_off, row + self._window.row_off, size, size)
+            with rio.open(self.filename) as raster:
+                data = raster.read(
+                    window=rio_window,
+                    fill_value=self.nodata,
+                    boundless=boundless,
+                    masked=masked,
+                    indexes=band,
+                )
+            return format_value(data), data
 
-            else:
-                # TODO: if we want to allow sampling multiple bands, need to do it also when data is loaded
-                # if self.count == 1:
-                with rio.open(self.filename) as raster:
-                    data = raster.read(
-                        window=rio_window,
-                        fill_value=self.nodata,
-                        boundless=boundless,
-                        masked=masked,
-                        indexes=band,
+        # Convert to latlon if asked
+        if input_latlon:
+            x, y = reproject_from_latlon((y, x), self.crs)  # type: ignore
+
+        # Convert coordinates to pixel space, and shift to the upper-left pixel of the windows
+        size = window if window is not None else 1
+        rows, cols = rio.transform.rowcol(self.transform, x, y, op=floor)
+        rows = np.atleast_1d(np.asarray(rows, dtype=int)) - (size - 1) // 2
+        cols = np.atleast_1d(np.asarray(cols, dtype=int)) - (size - 1) // 2
+
+        # For a single band, gather windows of all points at once, and reduce them along an axis
+        ind_batch = np.zeros(0, dtype=int)
+        values_batch: Any = []
+        windows: Any = []
+        if band is not None or self.count == 1:
+            band_batch = band if band is not None else 1
+            if self.is_loaded:
+                ind_batch = np.flatnonzero(
+                    (rows >= 0) & (cols >= 0) & (rows + size <= self.height) & (cols + size <= self.width)
+                )
+                data = self.data if self.count == 1 else self.data[band_batch - 1]
+                # For a lazy array, only the chunks intersecting windows are computed, with point-wise indexing
+                if self.is_lazy:
+                    offsets = np.arange(size)
+                    windows = np.ma.masked_array(
+                        data.vindex[
+                            rows[ind_batch, None, None] + offsets[None, :, None],
+                            cols[ind_batch, None, None] + offsets[None, None, :],
+                        ].compute()
                     )
-                value = format_value(data)
-                win = data
-                # else:
-                #     value = {}
-                #     win = {}
-                #     with rio.open(self.filename) as raster:
-                #         for b in self.indexes:
-                #             data = raster.read(
-                #                 window=rio_window, fill_value=self.nodata, boundless=boundless,
-                #                 masked=masked, indexes=b
-                #             )
-                #             val = format_value(data)
-                #             value[b] = val
-                #             win[b] = data  # type: ignore
-
-            list_values.append(value)
+                else:
+                    windows = _get_windows(data, rows[ind_batch], cols[ind_batch], size)
+                if not masked:
+                    windows = windows.astype(np.float32).filled(np.nan)
+            # For a raster not loaded, each block of the file is read only once
+            else:
+                row_off, col_off = (self._window.row_off, self._window.col_off) if self._window is not None else (0, 0)
+                ind_batch, windows = _read_windows(
+                    self.filename,  # type: ignore
+                    rows + int(row_off),
+                    cols + int(col_off),
+                    size,
+                    band=band_batch,
+                    nodata=self.nodata,
+                    masked=masked,
+                    boundless=boundless,
+                )
+            values_batch = _reduce_windows(windows, reducer_function) if window is not None else windows[:, 0, 0]
+            if not masked:
+                values_batch = np.ma.getdata(values_batch)
+
+        # Initiate output lists
+        if len(ind_batch) == len(rows):
+            list_values = values_batch
+            if return_window:
+                list_windows = list(windows)
+        else:
+            list_values = [None] * len(rows)
             if return_window:
-                list_windows.append(win)
+                list_windows = [None] * len(rows)
+            for k, value, win in zip(ind_batch, values_batch, windows):
+                list_values[k] = value
+                if return_window:
+                    list_windows[k] = win
+            # Other points are read and reduced one by one
+            for k in np.setdiff1d(np.arange(len(rows)), ind_batch):
+                list_values[k], win = reduce_point(int(rows[k]), int(cols[k]))
+                if return_window:
+                    list_windows[k] = win
 
         # If for a single value, unwrap output list
         if unwrap:
@@ -3352,7 +3821,7 @@ class Raster:
             if return_window:
                 output_win = list_windows[0]
         else:
-            output_val = np.array(list_values)  # type: ignore
+            output_val = list_values if isinstance(list_values, np.ndarray) else np.array(list_values)  # type: ignore
             if return_window:
                 output_win = list_windows  # type: ignore
 
@@ -3456,15 +3925,15 @@ class Raster:
             force_offset=force_offset,
         )
 
-    def outside_image(self, xi: ArrayLike, yj: ArrayLike, index: bool = True) -> bool:
+    def outside_image(self, xi: ArrayLike, yj: ArrayLike, index: bool = True) -> bool | NDArrayBool:
         """
-        Check whether a given point falls outside the raster.
+        Check whether given point(s) fall outside the raster.
 
         :param xi: Indices (or coordinates) of x direction to check.
         :param yj: Indices (or coordinates) of y direction to check.
         :param index: Interpret ij as raster indices (default is ``True``). If False, assumes ij is coordinates.
 
-        :returns is_outside: ``True`` if ij is outside the image.
+        :returns is_outside: ``True`` if ij is outside the image, or a boolean array for array inputs.
         """
 
         return _outside_image(
@@ -3480,6 +3949,7 @@ class Raster:
         input_latlon: bool = False,
         shift_area_or_point: bool | None = None,
         force_scipy_function: Literal["map_coordinates", "interpn"] | None = None,
+        multiproc_config: MultiprocConfig | None = None,
         **kwargs: Any,
     ) -> NDArrayNum:
         """
@@ -3492,6 +3962,18 @@ class Raster:
          to ensure that the interpolation of points is done at the right location. See parameter description
          of shift_area_or_point for more details.
 
+         The nodata-filled array, dilated nodata masks and prepared interpolators of the band are cached on the raster,
+         and re-used by later calls to only evaluate new points, until the data is modified (see Raster.is_modified).
+
+         If the raster is not loaded, or if a multiprocessing configuration is passed, the raster is not loaded in
+         memory: points are sorted by tile, and only the windows around points (with a halo for the interpolation
+         method and nodata spreading) are read on disk, sequentially or in parallel depending on the configuration.
+         For spline methods fitted on the full grid ("cubic", "quintic", "splinef2d"), values then differ from those
+         of the full array within the tolerance of the spline fit, so this is done only if a configuration is passed.
+
+         If the raster is lazy, only the chunks containing points are computed, with the default nodata spreading and
+         no other arguments.
+
         :param points: Point(s) at which to interpolate raster value (tuple of X/Y array-likes). If points fall
             outside of image, value returned is nan.
         :param method: Interpolation method, one of 'nearest', 'linear', 'cubic', 'quintic', 'slinear', 'pchip' or
@@ -3506,21 +3988,79 @@ class Raster:
             coordinates if self.area_or_point is "Point" and maintains corner pixel coordinate if it is "Area" or None.
             Defaults to True. Can be configured with the global setting geoutils.config["shift_area_or_point"].
         :param force_scipy_function: Force to use either map_coordinates or interpn. Mainly for testing purposes.
+        :param multiproc_config: Multiprocessing configuration to interpolate points tile by tile, reading only the
+            windows around points. Defaults to a sequential configuration for a raster not loaded (except for spline
+            methods fitted on the full grid).
 
         :returns rpoints: Array of raster value(s) for the given points.
         """
 
-        # Extract array supporting NaNs
-        array = self.get_nanarray()
-        if self.count != 1:
-            array = array[band - 1, :, :]
-
         # If those are in latlon, convert to Raster CRS
         if input_latlon:
             points = reproject_from_latlon(points, out_crs=self.crs)  # type: ignore
 
+        # For a lazy array, only the chunks containing points are computed, interpolating in pixel index coordinates
+        if self.is_lazy:
+            array = self.get_nanarray()
+            if self.count != 1:
+                array = array[band - 1, :, :]
+            if method not in ["nearest", "linear", "cubic", "quintic"]:
+                raise ValueError(f"Interpolation method '{method}' is not supported for a lazy raster.")
+            unsupported = {
+                "dist_nodata_spread": dist_nodata_spread != "half_order_up",
+                "force_scipy_function": force_scipy_function is not None,
+                "multiproc_config": multiproc_config is not None,
+                **{key: True for key in kwargs},
+            }
+            if any(unsupported.values()):
+                raise ValueError(
+                    f"Arguments {[k for k, v in unsupported.items() if v]} are not supported for a lazy raster, "
+                    "load() it first."
+                )
+            i, j = _xy2ij(
+                points[0],
+                points[1],
+                transform=self.transform,
+                area_or_point=self.area_or_point,
+                shift_area_or_point=shift_area_or_point,
+            )
+            # Points outside the image are NaNs
+            inside = (i >= 0) & (i <= self.height - 1) & (j >= 0) & (j <= self.width - 1)
+            rpoints = np.full(i.shape, np.nan, dtype=np.float32)
+            if np.count_nonzero(inside) > 0:
+                rpoints[inside] = delayed_interp_points(
+                    array, points=(i[inside], j[inside]), resolution=(1, 1), method=method  # type: ignore
+                )
+            return rpoints
+
+        # For a raster not loaded, only the windows around points are read on disk (except for spline methods fitted on
+        # the full grid, for which values would differ slightly from those of the loaded raster)
+        if (
+            multiproc_config is None
+            and not self.is_loaded
+            and self.filename is not None
+            and self._downsample == 1
+            and method not in _GLOBAL_SPLINE_METHODS
+        ):
+            multiproc_config = MultiprocConfig(chunk_size="auto")
+        if multiproc_config is not None:
+            return _multiproc_interp_points(
+                self,
+                points=points,
+                config=multiproc_config,
+                method=method,
+                dist_nodata_spread=dist_nodata_spread,
+                band=band,
+                shift_area_or_point=shift_area_or_point,
+                force_scipy_function=force_scipy_function,
+                **kwargs,
+            )
+
+        # Re-use the interpolation state of the band across calls (nodata-filled array, dilated masks, interpolators)
+        context = self._get_interpolation_context(band)
+
         return _interp_points(
-            array,
+            context.array,
             transform=self.transform,
             area_or_point=self.area_or_point,
             points=points,
@@ -3528,9 +4068,31 @@ class Raster:
             shift_area_or_point=shift_area_or_point,
             dist_nodata_spread=dist_nodata_spread,
             force_scipy_function=force_scipy_function,
+            context=context,
             **kwargs,
         )
 
+    def _get_interpolation_context(self, band: int = 1) -> _InterpolationContext:
+        """
+        Get the interpolation context of a band, attached to the raster and re-created when data changes.
+
+        Data changes are tracked by the same version counter as Raster.is_modified and, as the array returned by .data
+        can be modified in place, by a checksum of the array.
+
+        :param band: Band to use (from 1 to self.count).
+
+        :returns: Interpolation context of the band.
+        """
+        if not self.is_loaded:
+            self.load()
+        key = (band, self._data_version, id(self._data), _array_checksum(self._data))  # type: ignore
+        if self._interp_context is None or self._interp_context[0] != key:
+            array = self.get_nanarray()
+            if self.count != 1:
+                array = array[band - 1, :, :]
+            self._interp_context = (key, _InterpolationContext(array))
+        return self._interp_context[1]
+
     def split_bands(self: RasterType, copy: bool = False, bands: list[int] | int | None = None) -> list[Raster]:
         """
         Split the bands into separate rasters.
@@ -3681,8 +4243,14 @@ class Raster:
         :returns: A point cloud, or array of the shape (N, 2 + count) where N is the sample count.
         """
 
+        # For a lazy array, sample from a copy computed in memory
+        source_raster = self
+        if self.is_lazy:
+            source_raster = self.copy()
+            source_raster.load()
+
         return _raster_to_pointcloud(
-            source_raster=self,
+            source_raster=source_raster,
             data_column_name=data_column_name,
             data_band=data_band,
             auxiliary_data_bands=auxiliary_data_bands,
@@ -3738,19 +4306,32 @@ class Raster:
         self,
         target_values: Number | tuple[Number, Number] | list[Number] | NDArrayNum | Literal["all"] = "all",
         data_column_name: str = "id",
+        multiproc_config: MultiprocConfig | None = None,
     ) -> Vector:
         """
         Polygonize the raster into a vector.
 
+        The raster can be polygonized out-of-memory by passing a multiprocessing configuration: tiles are polygonized
+        in parallel and their features are written to the output file of the configuration as tiles complete, while
+        features crossing the seams between tiles are stitched at the end. The features are the same as when
+        polygonizing the full raster, but in a different order.
+
         :param target_values: Value or range of values of the raster from which to
           create geometries (defaults to "all", for which all unique pixel values of the raster are used).
         :param data_column_name: Data column name to be associated with target values in the output vector
             (defaults to "id").
+        :param multiproc_config: Multiprocessing configuration to polygonize tile by tile, writing features to the
+            output file of the configuration (driver derived from its extension, GeoPackage if none).
 
         :returns: Vector containing the polygonized geometries associated to target values.
         """
 
-        return _polygonize(source_raster=self, target_values=target_values, data_column_name=data_column_name)
+        return _polygonize(
+            source_raster=self,
+            target_values=target_values,
+            data_column_name=data_column_name,
+            multiproc_config=multiproc_config,
+        )
 
     def proximity(
         self,
@@ -3759,6 +4340,8 @@ class Raster:
         geometry_type: str = "boundary",
         in_or_out: Literal["in"] | Literal["out"] | Literal["both"] = "both",
         distance_unit: Literal["pixel"] | Literal["georeferenced"] = "georeferenced",
+        max_distance: float | None = None,
+        multiproc_config: MultiprocConfig | None = None,
     ) -> Raster:
         """
         Compute proximity distances to the raster target pixels, or to a vector geometry on the raster grid.
@@ -3777,10 +4360,28 @@ class Raster:
         :param geometry_type: (Only with a vector) Type of geometry to use for the proximity, defaults to 'boundary'.
         :param in_or_out: (Only with a vector) Compute proximity only 'in' or 'out'-side the geometry, or 'both'.
         :param distance_unit: Distance unit, either 'georeferenced' or 'pixel'.
+        :param max_distance: Maximum distance (in distance unit), above which distances are set to nodata.
+        :param multiproc_config: Multiprocessing configuration to compute the proximity tile by tile, writing to the
+            output file of the configuration. Each tile is computed with a halo covering the maximum distance, which
+            is required.
 
         :return: Proximity distances raster.
         """
 
+        if multiproc_config is not None:
+            if max_distance is None:
+                raise ValueError("A maximum distance is required to compute proximity with a multiprocessing config.")
+            return _multiproc_proximity(
+                raster=self,
+                config=multiproc_config,
+                max_distance=max_distance,
+                vector=vector,
+                target_values=target_values,
+                geometry_type=geometry_type,
+                in_or_out=in_or_out,
+                distance_unit=distance_unit,
+            )
+
         proximity = _proximity_from_vector_or_raster(
             raster=self,
             vector=vector,
@@ -3788,6 +4389,7 @@ class Raster:
             geometry_type=geometry_type,
             in_or_out=in_or_out,
             distance_unit=distance_unit,
+            max_distance=max_distance,
         )
 
         out_nodata = _default_nodata(proximity.dtype)
@@ -3843,8 +4445,19 @@ class Raster:
         :return: Array of sampled valid values, or array of sampled indices.
         """
 
+        # For a lazy array, the valid values are counted and sampled chunk by chunk for a single band, and the array is
+        # computed for multiple bands (sampled along all axes)
+        if self.is_lazy:
+            if self.count == 1:
+                return delayed_subsample(
+                    self.get_nanarray(), subsample=subsample, return_indices=return_indices, random_state=random_state
+                )
+            array = self._compute_lazy_data()
+        else:
+            array = self.data
+
         return subsample_array(
-            array=self.data, subsample=subsample, return_indices=return_indices, random_state=random_state
+            array=array, subsample=subsample, return_indices=return_indices, random_state=random_state
         )
 
 
@@ -4123,6 +4736,7 @@ class Mask(Raster):
         self,
         target_values: Number | tuple[Number, Number] | list[Number] | NDArrayNum | Literal["all"] = 1,
         data_column_name: str = "id",
+        multiproc_config: MultiprocConfig | None = None,
     ) -> Vector:
         # If target values is passed but does not correspond to 0 or 1, raise a warning
         if not isinstance(target_values, (int, np.integer, float, np.floating)) or target_values not in [0, 1]:
@@ -4133,7 +4747,7 @@ class Mask(Raster):
         self._data = self.data.astype("uint8")  # type: ignore
 
         # Get output from parent method
-        output = super().polygonize(target_values=target_values)
+        output = super().polygonize(target_values=target_values, multiproc_config=multiproc_config)
 
         # Convert array back to boolean
         self._data = self.data.astype(bool)  # type: ignore
@@ -4147,6 +4761,8 @@ class Mask(Raster):
         geometry_type: str = "boundary",
         in_or_out: Literal["in"] | Literal["out"] | Literal["both"] = "both",
         distance_unit: Literal["pixel"] | Literal["georeferenced"] = "georeferenced",
+        max_distance: float | None = None,
+        multiproc_config: MultiprocConfig | None = None,
     ) -> Raster:
         # By default, target True values of the mask
         if vector is None and target_values is None:
@@ -4177,6 +4793,8 @@ class Mask(Raster):
             geometry_type=geometry_type,
             in_or_out=in_or_out,
             distance_unit=distance_unit,
+            max_distance=max_distance,
+            multiproc_config=multiproc_config,
         )
 
     def __and__(self: Mask, other: Mask | NDArrayBool) -> Mask:
@@ -23,7 +23,9 @@ import math
 import sys
 
 import numpy as np
+import rasterio as rio
 from matplotlib.patches import Rectangle
+from numpy.typing import DTypeLike
 
 import geoutils as gu
 from geoutils._typing import NDArrayNum
@@ -140,6 +142,7 @@ def _generate_tiling_grid(
     row_split: int,
     col_split: int,
     overlap: int = 0,
+    offset: tuple[int, int] = (0, 0),
 ) -> NDArrayNum:
     """
     Generate a grid of positions by splitting [row_min, row_max] x
@@ -152,12 +155,16 @@ def _generate_tiling_grid(
     :param row_split: Height of each tile.
     :param col_split: Width of each tile.
     :param overlap: size of overlapping between tiles (both vertically and horizontally).
+    :param offset: Row and column offsets of the origin of the grid of tiles, for instance the position on disk of
+        a raster cropped lazily, so that tile boundaries fall on multiples of the tile size from that origin.
     :return: A numpy array grid with splits in two dimensions (0: row, 1: column),
              where each cell contains [row_min, row_max, col_min, col_max].
     """
-    # Calculate the total range of rows and columns
-    col_range = col_max - col_min
-    row_range = row_max - row_min
+    # Calculate the total range of rows and columns, including the shift of the first tile to the origin of the grid
+    row_shift = offset[0] % row_split
+    col_shift = offset[1] % col_split
+    col_range = col_max - col_min + col_shift
+    row_range = row_max - row_min + row_shift
 
     # Calculate the number of splits considering overlap
     nb_col_split = math.ceil(col_range / col_split)
@@ -170,49 +177,175 @@ def _generate_tiling_grid(
     if 0 < row_range % row_split <= overlap:
         nb_row_split = max(nb_row_split - 1, 1)
 
-    # Initialize the output grid
-    tiling_grid = np.zeros(shape=(nb_row_split, nb_col_split, 4), dtype=int)
-
-    for row in range(nb_row_split):
-        for col in range(nb_col_split):
-            # Calculate the start of the tile
-            row_start = max(row_min + row * row_split - overlap, 0)
-            col_start = max(col_min + col * col_split - overlap, 0)
-
-            # Calculate the end of the tile ensuring it doesn't exceed the bounds
-            row_end = min(row_max, (row + 1) * row_split + overlap)
-            col_end = min(col_max, (col + 1) * col_split + overlap)
+    # Calculate the start and end of the tiles in each dimension, ensuring they don't exceed the bounds
+    rows = np.arange(nb_row_split)
+    cols = np.arange(nb_col_split)
+    row_starts = np.maximum(row_min + rows * row_split - row_shift - overlap, 0)
+    col_starts = np.maximum(col_min + cols * col_split - col_shift - overlap, 0)
+    row_ends = np.minimum(row_max, (rows + 1) * row_split - row_shift + overlap)
+    col_ends = np.minimum(col_max, (cols + 1) * col_split - col_shift + overlap)
 
-            # Populate the grid with the tile boundaries
-            tiling_grid[row, col] = [row_start, row_end, col_start, col_end]
+    # Populate the grid with the tile boundaries by broadcasting rows and columns
+    tiling_grid = np.zeros(shape=(nb_row_split, nb_col_split, 4), dtype=int)
+    tiling_grid[:, :, 0] = row_starts[:, None]
+    tiling_grid[:, :, 1] = row_ends[:, None]
+    tiling_grid[:, :, 2] = col_starts[None, :]
+    tiling_grid[:, :, 3] = col_ends[None, :]
 
     return tiling_grid
 
 
 def compute_tiling(
-    tile_size: int,
+    tile_size: int | tuple[int, int],
     raster_shape: tuple[int, int],
     ref_shape: tuple[int, int],
     overlap: int = 0,
+    offset: tuple[int, int] = (0, 0),
 ) -> NDArrayNum:
     """
     Compute the raster tiling grid to coregister raster by block.
 
-    :param tile_size: Size of each tile (square tiles).
+    :param tile_size: Size of each tile, either an integer for square tiles or a tuple of (rows, columns).
     :param raster_shape: Shape of the raster to determine tiling parameters.
     :param ref_shape: The shape of another raster to coregister, use to validate the shape.
     :param overlap: Size of overlap between tiles (optional).
+    :param offset: Row and column offsets of the origin of the grid of tiles (optional), see _get_block_offset().
     :return: tiling_grid (array of tile boundaries).
     """
     if raster_shape != ref_shape:
         raise Exception("Reference and secondary rasters do not have the same shape")
     row_max, col_max = raster_shape
+    if isinstance(tile_size, (int, np.integer)):
+        row_split, col_split = int(tile_size), int(tile_size)
+    else:
+        row_split, col_split = tile_size
 
     # Generate tiling
-    tiling_grid = _generate_tiling_grid(0, 0, row_max, col_max, tile_size, tile_size, overlap=overlap)
+    tiling_grid = _generate_tiling_grid(0, 0, row_max, col_max, row_split, col_split, overlap=overlap, offset=offset)
     return tiling_grid
 
 
+def _get_block_shape(raster: gu.Raster) -> tuple[int, int] | None:
+    """
+    Get the internal block shape of the file of a raster, if its data is read from disk.
+
+    :param raster: Raster to get the block shape from.
+
+    :return: Block shape as (rows, columns) of the first band, or None if the raster data is not read on disk.
+    """
+    if raster.is_loaded or raster.filename is None or raster._downsample != 1:
+        return None
+    with rio.open(raster.filename) as ds:
+        block_shape = ds.block_shapes[0]
+    return int(block_shape[0]), int(block_shape[1])
+
+
+def _get_block_offset(raster: gu.Raster) -> tuple[int, int]:
+    """
+    Get the position on disk of the first pixel of a raster, to align tiles with the blocks of its file.
+
+    :param raster: Raster to get the offset from.
+
+    :return: Row and column offsets of the raster in its file, non-zero only for a raster cropped lazily.
+    """
+    if raster.is_loaded or raster._window is None:
+        return 0, 0
+    return int(raster._window.row_off), int(raster._window.col_off)
+
+
+def compute_tile_shape(
+    memory_budget: int,
+    dtype: DTypeLike,
+    count: int = 1,
+    overlap: int = 0,
+    block_shape: tuple[int, int] | None = None,
+    raster_shape: tuple[int, int] | None = None,
+) -> tuple[int, int]:
+    """
+    Compute the largest tile shape fitting a memory budget, aligned with the internal block shape of a file.
+
+    The memory of a tile accounts for the data and its mask for each band, including the overlap on each side. To
+    read each block of a file only once, the tile shape is rounded down to a multiple of the block shape. For strip
+    layouts (blocks spanning the full width), tiles span the full width. If a single block does not fit in the
+    memory budget along a dimension, the tile is not aligned along that dimension.
+
+    :param memory_budget: Memory budget per tile (in bytes).
+    :param dtype: Data type of the raster.
+    :param count: Number of bands of the raster.
+    :param overlap: Size of overlap between tiles.
+    :param block_shape: Internal block shape of the file as (rows, columns), e.g. from "dataset.block_shapes".
+    :param raster_shape: Shape of the raster, to not exceed it.
+
+    :raises ValueError: If the memory budget is too small to fit a tile with this overlap.
+
+    :return: Tile shape as (rows, columns).
+
+    :examples:
+        >>> compute_tile_shape(2**20, "float32", block_shape=(256, 256))
+        (768, 256)
+        >>> compute_tile_shape(2**20, "float32", block_shape=(1, 1000), raster_shape=(5000, 1000))
+        (209, 1000)
+    """
+    # Memory of a pixel for the data and mask of all bands
+    bytes_per_pixel = count * (np.dtype(dtype).itemsize + 1)
+    max_pixels = memory_budget // bytes_per_pixel
+    side = math.isqrt(max_pixels) - 2 * overlap
+    if side < 1:
+        raise ValueError(
+            f"Memory budget of {memory_budget} bytes is too small to fit a tile with an overlap of {overlap} pixels."
+        )
+
+    if block_shape is None:
+        block_shape = (1, 1)
+    block_rows, block_cols = block_shape
+
+    # Start from a square tile for the columns, rounded to the block width and not exceeding the raster width
+    if side >= block_cols:
+        tile_cols = side // block_cols * block_cols
+    # If the square tile is narrower than a block, use a single block width if a tile of one row still fits
+    elif (block_cols + 2 * overlap) * (1 + 2 * overlap) <= max_pixels:
+        tile_cols = block_cols
+    else:
+        tile_cols = side
+    if raster_shape is not None:
+        tile_cols = min(tile_cols, raster_shape[1])
+
+    # Then, use the remaining memory budget for the rows, rounded to the block height if at least one block fits
+    tile_rows = max_pixels // (tile_cols + 2 * overlap) - 2 * overlap
+    if tile_rows >= block_rows:
+        tile_rows = tile_rows // block_rows * block_rows
+    if raster_shape is not None:
+        tile_rows = min(tile_rows, raster_shape[0])
+
+    return int(tile_rows), int(tile_cols)
+
+
+def compute_tiling_adaptive(
+    raster: gu.Raster,
+    memory_budget: int,
+    overlap: int = 0,
+) -> NDArrayNum:
+    """
+    Compute the raster tiling grid with a tile shape adapted to a memory budget and to the file block layout.
+
+    See compute_tile_shape() for details.
+
+    :param raster: Raster to compute the tiling for.
+    :param memory_budget: Memory budget per tile (in bytes).
+    :param overlap: Size of overlap between tiles (optional).
+    :return: tiling_grid (array of tile boundaries).
+    """
+    tile_shape = compute_tile_shape(
+        memory_budget,
+        dtype=raster.dtype,
+        count=raster.count,
+        overlap=overlap,
+        block_shape=_get_block_shape(raster),
+        raster_shape=raster.shape,
+    )
+    return compute_tiling(tile_shape, raster.shape, raster.shape, overlap=overlap, offset=_get_block_offset(raster))
+
+
 def plot_tiling(raster: gu.Raster, tiling_grid: NDArrayNum) -> None:
     """
     Plot raster with its tiling.
@@ -17,7 +17,8 @@
 # limitations under the License.
 
 """ Statistical tools"""
-from typing import Any
+import logging
+from typing import Any, Iterable
 
 import numpy as np
 
@@ -68,3 +69,486 @@ def linear_error(data: NDArrayNum, interval: float = 90) -> np.floating[Any]:
         mdata = data
     le = np.nanpercentile(mdata, 50 + interval / 2) - np.nanpercentile(mdata, 50 - interval / 2)
     return le
+
+
+class _StatsAccumulator:
+    """
+    Mergeable accumulator of statistics on valid values: count, mean, sum of squared deviations to the mean, sum, sum
+    of squares, minimum and maximum.
+
+    Accumulators computed on blocks of values are combined exactly with the parallel algorithm of Chan et al. (1979),
+    so that the mean and standard deviation do not suffer from the cancellation of a naive sum of squares.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    @classmethod
+    def from_values(cls, values: NDArrayNum) -> "_StatsAccumulator":
+        """
+        Compute the accumulator of a block of valid values.
+
+        :param values: 1D array of valid values.
+
+        :returns: Accumulator of the values.
+        """
+        acc = cls()
+        if values.size == 0:
+            return acc
+        values = values.astype(np.float64, copy=False)
+        acc.count = values.size
+        acc.sum = float(np.sum(values))
+        acc.mean = acc.sum / acc.count
+        deviations = values - acc.mean
+        acc.m2 = float(np.dot(deviations, deviations))
+        acc.sum_squares = float(np.dot(values, values))
+        acc.min = float(np.min(values))
+        acc.max = float(np.max(values))
+        return acc
+
+    def merge(self, other: "_StatsAccumulator") -> "_StatsAccumulator":
+        """
+        Merge with the accumulator of another block of values.
+
+        :param other: Accumulator of the other block.
+
+        :returns: Accumulator of the values of both blocks.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        acc = _StatsAccumulator()
+        acc.count = self.count + other.count
+        delta = other.mean - self.mean
+        acc.mean = self.mean + delta * other.count / acc.count
+        acc.m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / acc.count
+        acc.sum = self.sum + other.sum
+        acc.sum_squares = self.sum_squares + other.sum_squares
+        acc.min = min(self.min, other.min)
+        acc.max = max(self.max, other.max)
+        return acc
+
+    @property
+    def std(self) -> float:
+        """Standard deviation of the values."""
+        return float(np.sqrt(self.m2 / self.count)) if self.count > 0 else np.nan
+
+    @property
+    def rmse(self) -> float:
+        """Root mean square of the values."""
+        return float(np.sqrt(self.sum_squares / self.count)) if self.count > 0 else np.nan
+
+
+# Exact order statistics of values spread in blocks, with a histogram refinement:
+# 1/ The histogram of all values is computed on a fixed binning between their minimum and maximum (mergeable by sum),
+# 2/ The bins containing the ranks of interest are located with the cumulative histogram,
+# 3/ The distinct values (and their counts) that fall in those bins only are collected, and the ranks selected exactly.
+
+
+def _get_histogram_bins(values: NDArrayNum, vmin: float, vmax: float, nb_bins: int) -> NDArrayNum:
+    """
+    Get the histogram bin index of each value, for a fixed binning between a minimum and maximum.
+
+    :param values: 1D array of values.
+    :param vmin: Minimum of all values.
+    :param vmax: Maximum of all values.
+    :param nb_bins: Number of bins.
+
+    :returns: Bin index of each value.
+    """
+    if vmax == vmin:
+        return np.zeros(values.shape, dtype=np.int64)
+    bins = ((values.astype(np.float64, copy=False) - vmin) * (nb_bins / (vmax - vmin))).astype(np.int64)
+    return np.clip(bins, 0, nb_bins - 1)
+
+
+def _get_histogram(values: NDArrayNum, vmin: float, vmax: float, nb_bins: int) -> NDArrayNum:
+    """
+    Get the histogram of values for a fixed binning, to be summed over blocks.
+
+    :param values: 1D array of values.
+    :param vmin: Minimum of all values.
+    :param vmax: Maximum of all values.
+    :param nb_bins: Number of bins.
+
+    :returns: Count of values per bin.
+    """
+    return np.bincount(_get_histogram_bins(values, vmin, vmax, nb_bins), minlength=nb_bins)
+
+
+def _locate_ranks(histogram: NDArrayNum, ranks: NDArrayNum) -> tuple[NDArrayNum, NDArrayNum]:
+    """
+    Locate the bins containing ranks of the sorted values, and the ranks within these bins.
+
+    :param histogram: Count of all values per bin.
+    :param ranks: Ranks of the sorted values (starting at 0).
+
+    :returns: Bin index and rank within the bin for each rank.
+    """
+    cumulative = np.cumsum(histogram)
+    bins = np.searchsorted(cumulative, ranks, side="right")
+    return bins, ranks - (cumulative[bins] - histogram[bins])
+
+
+def _get_values_in_bins(
+    values: NDArrayNum, vmin: float, vmax: float, nb_bins: int, bins: NDArrayNum
+) -> dict[int, tuple[NDArrayNum, NDArrayNum]]:
+    """
+    Get the distinct values and their counts in some bins, to be merged over blocks.
+
+    :param values: 1D array of values.
+    :param vmin: Minimum of all values.
+    :param vmax: Maximum of all values.
+    :param nb_bins: Number of bins.
+    :param bins: Bin indexes to collect.
+
+    :returns: Distinct values and their counts, for each bin.
+    """
+    values_bins = _get_histogram_bins(values, vmin, vmax, nb_bins)
+    return {int(b): np.unique(values[values_bins == b], return_counts=True) for b in np.unique(bins)}
+
+
+def _merge_values_in_bins(
+    values1: dict[int, tuple[NDArrayNum, NDArrayNum]], values2: dict[int, tuple[NDArrayNum, NDArrayNum]]
+) -> dict[int, tuple[NDArrayNum, NDArrayNum]]:
+    """
+    Merge the distinct values and their counts in bins of two blocks.
+
+    :param values1: Distinct values and their counts for each bin of the first block.
+    :param values2: Distinct values and their counts for each bin of the second block.
+
+    :returns: Distinct values and their counts for each bin of both blocks.
+    """
+    merged = dict(values1)
+    for b, (vals2, counts2) in values2.items():
+        if b not in merged:
+            merged[b] = (vals2, counts2)
+            continue
+        vals, inverse = np.unique(np.concatenate((merged[b][0], vals2)), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate((merged[b][1], counts2)), minlength=vals.size)
+        merged[b] = (vals, counts.astype(np.int64))
+    return merged
+
+
+def _select_ranks(
+    values_in_bins: dict[int, tuple[NDArrayNum, NDArrayNum]], bins: NDArrayNum, ranks_in_bins: NDArrayNum
+) -> NDArrayNum:
+    """
+    Select the values at ranks within bins, from the distinct values and their counts in these bins.
+
+    :param values_in_bins: Distinct values and their counts for each bin.
+    :param bins: Bin index of each rank.
+    :param ranks_in_bins: Rank within the bin of each rank.
+
+    :returns: Value at each rank.
+    """
+    selected = np.zeros(len(bins), dtype=np.float64)
+    for i, (b, r) in enumerate(zip(bins, ranks_in_bins)):
+        vals, counts = values_in_bins[int(b)]
+        selected[i] = vals[np.searchsorted(np.cumsum(counts), r, side="right")]
+    return selected
+
+
+def _percentile_ranks(count: int, percentile: float) -> tuple[int, int, float]:
+    """
+    Get the ranks of sorted values to interpolate a percentile, with the "linear" method of np.percentile.
+
+    :param count: Number of values.
+    :param percentile: Percentile between 0 and 100.
+
+    :returns: Lower rank, upper rank, and interpolation weight of the upper rank.
+    """
+    position = percentile / 100 * (count - 1)
+    lower = int(np.floor(position))
+    return lower, min(lower + 1, count - 1), position - lower
+
+
+def _interpolate_percentile(values_at_ranks: dict[int, float], count: int, percentile: float) -> float:
+    """
+    Interpolate a percentile from the sorted values at its ranks, with the "linear" method of np.percentile.
+
+    :param values_at_ranks: Sorted values at ranks, including those of the percentile.
+    :param count: Number of values.
+    :param percentile: Percentile between 0 and 100.
+
+    :returns: Value of the percentile.
+    """
+    lower, upper, weight = _percentile_ranks(count, percentile)
+    return values_at_ranks[lower] + (values_at_ranks[upper] - values_at_ranks[lower]) * weight
+
+
+# Percentiles required by each order statistic (the NMAD also requires the median of absolute deviations)
+_ORDER_STATISTICS = {"Median": [50], "90th percentile": [90], "LE90": [5, 95], "NMAD": [50]}
+
+
+def _get_order_statistics(values: NDArrayNum, stats_names: Iterable[str] | None = None) -> dict[str, float]:
+    """
+    Compute order statistics of valid values with a single partition for all requested percentiles, and one more
+    partition of absolute deviations to the median for the NMAD.
+
+    Values are partitioned in place.
+
+    :param values: 1D array of valid values.
+    :param stats_names: Names of the order statistics to compute, other names are ignored. Defaults to all.
+
+    :returns: Dictionary of order statistics.
+    """
+    names = [n for n in _ORDER_STATISTICS if stats_names is None or n in stats_names]
+    if values.size == 0 or len(names) == 0:
+        return {}
+
+    count = values.size
+    percentiles = {p for n in names for p in _ORDER_STATISTICS[n]}
+    ranks = sorted({r for p in percentiles for r in _percentile_ranks(count, p)[:2]})
+    values.partition(ranks)
+    values_at_ranks = {r: float(values[r]) for r in ranks}
+
+    order_stats: dict[str, float] = {}
+    for name in names:
+        if name == "LE90":
+            order_stats[name] = _interpolate_percentile(values_at_ranks, count, 95) - _interpolate_percentile(
+                values_at_ranks, count, 5
+            )
+        elif name == "NMAD":
+            median = _interpolate_percentile(values_at_ranks, count, 50)
+            deviations = np.abs(values - median)
+            ranks_deviations = sorted(set(_percentile_ranks(count, 50)[:2]))
+            deviations.partition(ranks_deviations)
+            deviations_at_ranks = {r: float(deviations[r]) for r in ranks_deviations}
+            order_stats[name] = 1.4826 * _interpolate_percentile(deviations_at_ranks, count, 50)
+        else:
+            order_stats[name] = _interpolate_percentile(values_at_ranks, count, _ORDER_STATISTICS[name][0])
+
+    return order_stats
+
+
+def _get_stats_dict(
+    acc: _StatsAccumulator,
+    order_stats: dict[str, float],
+    valid_count: int,
+    total_count: int,
+    total_inlier_count: int | None = None,
+) -> dict[str, Any]:
+    """
+    Build the dictionary of statistics of a raster band from its moments, order statistics and counts.
+
+    Order statistics not computed are not included, unless there are no valid values.
+
+    :param acc: Accumulator of the valid (inlier) values.
+    :param order_stats: Dictionary of order statistics.
+    :param valid_count: Number of valid values, without accounting for the inlier mask.
+    :param total_count: Total number of values.
+    :param total_inlier_count: Total number of inlier values, if an inlier mask was used.
+
+    :returns: Dictionary of statistics.
+    """
+    stats_dict: dict[str, Any] = {
+        "Mean": np.float64(acc.mean),
+        "Median": order_stats.get("Median"),
+        "Max": np.float64(acc.max),
+        "Min": np.float64(acc.min),
+        "Sum": np.float64(acc.sum),
+        "Sum of squares": np.float64(acc.sum_squares),
+        "90th percentile": order_stats.get("90th percentile"),
+        "LE90": order_stats.get("LE90"),
+        "NMAD": order_stats.get("NMAD"),
+        "RMSE": np.float64(acc.rmse),
+        "Standard deviation": np.float64(acc.std),
+        "Valid count": valid_count,
+        "Total count": total_count,
+        "Percentage valid points": (valid_count / total_count) * 100,
+    }
+    stats_dict = {
+        k: np.float64(v) if k in order_stats else v
+        for k, v in stats_dict.items()
+        if k not in _ORDER_STATISTICS or k in order_stats or acc.count == 0
+    }
+
+    if total_inlier_count is not None:
+        stats_dict.update(
+            {
+                "Valid inlier count": acc.count,
+                "Total inlier count": total_inlier_count,
+                "Percentage inlier points": (acc.count / valid_count) * 100 if valid_count != 0 else 0,
+                "Percentage valid inlier points": (
+                    (acc.count / total_inlier_count) * 100 if total_inlier_count != 0 else 0
+                ),
+            }
+        )
+
+    # If there are no valid data points, set all statistics to NaN
+    if acc.count == 0:
+        logging.warning("Empty raster, returns Nan for all stats")
+        for key in stats_dict:
+            stats_dict[key] = np.nan
+
+    return stats_dict
+
+
+# Statistics of values grouped by integer labels (e.g., zones of features rasterized on a grid), computed for all
+# groups at once with grouped reductions: moments with np.bincount, and order statistics by sorting values by group
+
+
+def _grouped_moments(values: NDArrayNum, labels: NDArrayNum, nb_groups: int) -> dict[str, NDArrayNum]:
+    """
+    Compute the moments of values for each group of labels.
+
+    :param values: 1D array of valid values.
+    :param labels: 1D array of group label of each value, between 0 and nb_groups - 1.
+    :param nb_groups: Number of groups.
+
+    :returns: Count, mean, sum of squared deviations to the mean, sum, sum of squares, minimum and maximum per group.
+    """
+    values = values.astype(np.float64, copy=False)
+    count = np.bincount(labels, minlength=nb_groups)
+    sums = np.bincount(labels, weights=values, minlength=nb_groups)
+    mean = np.divide(sums, count, out=np.zeros(nb_groups), where=count > 0)
+    deviations = values - mean[labels]
+    vmin = np.full(nb_groups, np.inf)
+    np.minimum.at(vmin, labels, values)
+    vmax = np.full(nb_groups, -np.inf)
+    np.maximum.at(vmax, labels, values)
+
+    return {
+        "count": count,
+        "mean": mean,
+        "m2": np.bincount(labels, weights=deviations**2, minlength=nb_groups),
+        "sum": sums,
+        "sum_squares": np.bincount(labels, weights=values**2, minlength=nb_groups),
+        "min": vmin,
+        "max": vmax,
+    }
+
+
+def _merge_grouped_moments(moments1: dict[str, NDArrayNum], moments2: dict[str, NDArrayNum]) -> dict[str, NDArrayNum]:
+    """
+    Merge the moments per group of two blocks of values, see _StatsAccumulator.merge().
+
+    :param moments1: Moments per group of the first block.
+    :param moments2: Moments per group of the second block.
+
+    :returns: Moments per group of both blocks.
+    """
+    count = moments1["count"] + moments2["count"]
+    delta = moments2["mean"] - moments1["mean"]
+    weight = np.divide(moments2["count"], count, out=np.zeros(count.shape), where=count > 0)
+
+    return {
+        "count": count,
+        "mean": moments1["mean"] + delta * weight,
+        "m2": moments1["m2"] + moments2["m2"] + delta**2 * moments1["count"] * weight,
+        "sum": moments1["sum"] + moments2["sum"],
+        "sum_squares": moments1["sum_squares"] + moments2["sum_squares"],
+        "min": np.minimum(moments1["min"], moments2["min"]),
+        "max": np.maximum(moments1["max"], moments2["max"]),
+    }
+
+
+def _grouped_percentile(sorted_values: NDArrayNum, count: NDArrayNum, percentile: float) -> NDArrayNum:
+    """
+    Interpolate a percentile for each group of sorted values, with the "linear" method of np.percentile.
+
+    :param sorted_values: 1D array of values sorted by group, then by value.
+    :param count: Number of values per group.
+    :param percentile: Percentile between 0 and 100.
+
+    :returns: Percentile per group, NaN for empty groups.
+    """
+    starts = np.cumsum(count) - count
+    valid = count > 0
+    position = percentile / 100 * (count[valid] - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, count[valid] - 1)
+    lower_values = sorted_values[starts[valid] + lower]
+    upper_values = sorted_values[starts[valid] + upper]
+
+    output = np.full(count.shape, np.nan)
+    output[valid] = lower_values + (upper_values - lower_values) * (position - lower)
+    return output
+
+
+def _grouped_order_statistics(
+    values: NDArrayNum, labels: NDArrayNum, nb_groups: int, stats_names: Iterable[str] | None = None
+) -> dict[str, NDArrayNum]:
+    """
+    Compute order statistics of values for each group of labels, with a single sort of values by group.
+
+    :param values: 1D array of valid values.
+    :param labels: 1D array of group label of each value, between 0 and nb_groups - 1.
+    :param nb_groups: Number of groups.
+    :param stats_names: Names of the order statistics to compute, other names are ignored. Defaults to all.
+
+    :returns: Dictionary of order statistics per group.
+    """
+    names = [n for n in _ORDER_STATISTICS if stats_names is None or n in stats_names]
+    if len(names) == 0:
+        return {}
+
+    order = np.lexsort((values, labels))
+    sorted_values = values[order].astype(np.float64, copy=False)
+    count = np.bincount(labels, minlength=nb_groups)
+
+    order_stats: dict[str, NDArrayNum] = {}
+    for name in names:
+        if name == "LE90":
+            order_stats[name] = _grouped_percentile(sorted_values, count, 95) - _grouped_percentile(
+                sorted_values, count, 5
+            )
+        elif name == "NMAD":
+            sorted_labels = labels[order]
+            median = _grouped_percentile(sorted_values, count, 50)
+            deviations = np.abs(sorted_values - median[sorted_labels])
+            sorted_deviations = deviations[np.lexsort((deviations, sorted_labels))]
+            order_stats[name] = 1.4826 * _grouped_percentile(sorted_deviations, count, 50)
+        else:
+            order_stats[name] = _grouped_percentile(sorted_values, count, _ORDER_STATISTICS[name][0])
+
+    return order_stats
+
+
+def _get_grouped_stats_dict(
+    moments: dict[str, NDArrayNum], order_stats: dict[str, NDArrayNum], total_count: NDArrayNum
+) -> dict[str, NDArrayNum]:
+    """
+    Build the dictionary of statistics per group from their moments, order statistics and counts.
+
+    Order statistics not computed are not included. Statistics of groups without valid values are NaN.
+
+    :param moments: Moments per group.
+    :param order_stats: Order statistics per group.
+    :param total_count: Total number of values per group, including invalid values.
+
+    :returns: Dictionary of statistics per group.
+    """
+    count = moments["count"]
+    valid = count > 0
+
+    def _valid_only(array: NDArrayNum) -> NDArrayNum:
+        return np.where(valid, array, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stats_dict = {
+            "Mean": _valid_only(moments["mean"]),
+            "Median": order_stats.get("Median"),
+            "Max": _valid_only(moments["max"]),
+            "Min": _valid_only(moments["min"]),
+            "Sum": _valid_only(moments["sum"]),
+            "Sum of squares": _valid_only(moments["sum_squares"]),
+            "90th percentile": order_stats.get("90th percentile"),
+            "LE90": order_stats.get("LE90"),
+            "NMAD": order_stats.get("NMAD"),
+            "RMSE": _valid_only(np.sqrt(moments["sum_squares"] / count)),
+            "Standard deviation": _valid_only(np.sqrt(moments["m2"] / count)),
+            "Valid count": count,
+            "Total count": total_count,
+            "Percentage valid points": count / total_count * 100,
+        }
+
+    return {k: v for k, v in stats_dict.items() if v is not None}
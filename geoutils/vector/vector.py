@@ -59,6 +59,7 @@ from geoutils.projtools import (
     _get_footprint_projected,
     _get_utm_ups_crs,
 )
+from geoutils.raster.distributed_computing.multiproc import MultiprocConfig
 from geoutils.vector.geometric import _buffer_metric, _buffer_without_overlap
 from geoutils.vector.geotransformations import _reproject
 
@@ -1419,6 +1420,7 @@ class Vector:
         buffer: int | float | np.integer[Any] | np.floating[Any] = 0,
         *,
         as_array: Literal[False] = False,
+        multiproc_config: None = None,
     ) -> gu.Mask: ...
 
     @overload
@@ -1432,8 +1434,23 @@ class Vector:
         buffer: int | float | np.integer[Any] | np.floating[Any] = 0,
         *,
         as_array: Literal[True],
+        multiproc_config: None = None,
     ) -> NDArrayNum: ...
 
+    @overload
+    def create_mask(
+        self,
+        raster: str | gu.Raster | None = None,
+        crs: CRS | None = None,
+        xres: float | None = None,
+        yres: float | None = None,
+        bounds: tuple[float, float, float, float] | None = None,
+        buffer: int | float | np.integer[Any] | np.floating[Any] = 0,
+        *,
+        as_array: Literal[False] = False,
+        multiproc_config: MultiprocConfig,
+    ) -> gu.Raster: ...
+
     def create_mask(
         self,
         raster: gu.Raster | None = None,
@@ -1443,7 +1460,8 @@ class Vector:
         bounds: tuple[float, float, float, float] | None = None,
         buffer: int | float | np.integer[Any] | np.floating[Any] = 0,
         as_array: bool = False,
-    ) -> gu.Mask | NDArrayBool:
+        multiproc_config: MultiprocConfig | None = None,
+    ) -> gu.Mask | gu.Raster | NDArrayBool:
         """
         Create a mask from the vector features.
 
@@ -1454,6 +1472,11 @@ class Vector:
 
         Vector features which fall outside the bounds of the raster file are not written to the new mask file.
 
+        The mask can be created out-of-memory by passing a multiprocessing configuration: features are burned tile by
+        tile directly into the output file, each tile receiving only the features intersecting it. As a mask is always
+        loaded, the output is then an unloaded raster of the output file, with values of 1 inside and 0 outside the
+        features.
+
         :param raster: Reference raster to match during rasterization.
         :param crs: A pyproj or rasterio CRS object (Default to raster.crs if not None then self.crs)
         :param xres: Output raster spatial resolution in x. Only is raster is None.
@@ -1462,16 +1485,31 @@ class Vector:
         :param buffer: Size of buffer to be added around the features, in the raster's projection units.
             If a negative value is set, will erode the features.
         :param as_array: Return mask as a boolean array
+        :param multiproc_config: Multiprocessing configuration to burn features tile by tile into the output file of
+            the configuration, without loading the mask in memory.
 
         :returns: A Mask object contain a boolean array
         """
 
+        if multiproc_config is not None and as_array:
+            raise ValueError("A mask cannot be returned as an array with a multiprocessing configuration.")
+
         mask, transform, crs = _create_mask(
-            gdf=self.ds, raster=raster, crs=crs, xres=xres, yres=yres, bounds=bounds, buffer=buffer, as_array=as_array
+            gdf=self.ds,
+            raster=raster,
+            crs=crs,
+            xres=xres,
+            yres=yres,
+            bounds=bounds,
+            buffer=buffer,
+            as_array=as_array,
+            multiproc_config=multiproc_config,
         )
 
-        # Return output as mask or as array
-        if as_array:
+        # Return output as written raster, as mask or as array
+        if isinstance(mask, gu.Raster):
+            return mask
+        elif as_array:
             return mask.squeeze()
         else:
             return gu.Raster.from_array(data=mask, transform=transform, crs=crs, nodata=None)
@@ -1485,6 +1523,7 @@ class Vector:
         bounds: tuple[float, float, float, float] | None = None,
         in_value: int | float | abc.Iterable[int | float] | None = None,
         out_value: int | float = 0,
+        multiproc_config: MultiprocConfig | None = None,
     ) -> gu.Raster | gu.Mask:
         """
         Rasterize vector to a raster or mask, with input geometries burned in.
@@ -1497,6 +1536,10 @@ class Vector:
         Burn value is set by user and can be either a single number, or an iterable of same length as self.ds.
         Default is an index from 1 to len(self.ds).
 
+        The rasterization can be computed out-of-memory by passing a multiprocessing configuration: features are burned
+        tile by tile directly into the output file, each tile receiving only the features intersecting it, and the
+        output is an unloaded raster of this file (also when burning a value of 1, as a mask is always loaded).
+
         :param raster: Reference raster to match during rasterization.
         :param crs: Coordinate reference system as string or EPSG code
             (Default to raster.crs if not None then self.crs).
@@ -1508,6 +1551,8 @@ class Vector:
             Must be in same system as crs, if set. (Default to self bounds).
         :param in_value: Value(s) to be burned inside the polygons (Default is self.ds.index + 1).
         :param out_value: Value to be burned outside the polygons (Default is 0).
+        :param multiproc_config: Multiprocessing configuration to burn features tile by tile into the output file of
+            the configuration, without loading the output in memory.
 
         :returns: Raster or mask containing the burned geometries.
         """
@@ -1521,6 +1566,7 @@ class Vector:
             bounds=bounds,
             in_value=in_value,
             out_value=out_value,
+            multiproc_config=multiproc_config,
         )
 
     @classmethod
@@ -1569,6 +1615,8 @@ class Vector:
         geometry_type: str = "boundary",
         in_or_out: Literal["in"] | Literal["out"] | Literal["both"] = "both",
         distance_unit: Literal["pixel"] | Literal["georeferenced"] = "georeferenced",
+        max_distance: float | None = None,
+        multiproc_config: MultiprocConfig | None = None,
     ) -> gu.Raster:
         """
         Compute proximity distances to this vector's geometry.
@@ -1589,6 +1637,10 @@ class Vector:
         :param geometry_type: Type of geometry to use for the proximity, defaults to 'boundary'.
         :param in_or_out: Compute proximity only 'in' or 'out'-side the polygon, or 'both'.
         :param distance_unit: Distance unit, either 'georeferenced' or 'pixel'.
+        :param max_distance: Maximum distance (in distance unit), above which distances are set to nodata.
+        :param multiproc_config: Multiprocessing configuration to compute the proximity tile by tile, writing to the
+            output file of the configuration. Each tile is computed with a halo covering the maximum distance, which
+            is required.
 
         :return: Proximity raster.
         """
@@ -1608,8 +1660,23 @@ class Vector:
 
             raster = gu.Raster.from_array(data=np.zeros((1000, 1000)), transform=transform, crs=self.crs)
 
+        if multiproc_config is not None:
+            return raster.proximity(
+                vector=self,
+                geometry_type=geometry_type,
+                in_or_out=in_or_out,
+                distance_unit=distance_unit,
+                max_distance=max_distance,
+                multiproc_config=multiproc_config,
+            )
+
         proximity = _proximity_from_vector_or_raster(
-            raster=raster, vector=self, geometry_type=geometry_type, in_or_out=in_or_out, distance_unit=distance_unit
+            raster=raster,
+            vector=self,
+            geometry_type=geometry_type,
+            in_or_out=in_or_out,
+            distance_unit=distance_unit,
+            max_distance=max_distance,
         )
 
         out_nodata = gu.raster.raster._default_nodata(proximity.dtype)
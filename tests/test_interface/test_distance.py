@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import tempfile
 import warnings
+from typing import Any
 
 import numpy as np
 import pytest
@@ -205,6 +206,46 @@ class TestDistance:
         # With only inside proximity
         raster1.proximity(vector=vector, in_or_out="in")
 
+    @pytest.mark.parametrize("distance_unit, max_distance", [("georeferenced", 1500), ("pixel", 40)])  # type: ignore
+    def test_proximity__max_distance_multiproc(self, distance_unit: str, max_distance: float, tmp_path: Any) -> None:
+        """Test that the proximity computed tile by tile with a halo is the same as on the full raster."""
+
+        raster = gu.Raster(self.landsat_b4_path)
+        vector = gu.Vector(self.everest_outlines_path)
+        config = gu.raster.MultiprocConfig(chunk_size=100, outfile=str(tmp_path / "proximity.tif"))
+
+        # Distances above the maximum distance are nodata
+        prox = raster.proximity(target_values=[112], distance_unit=distance_unit)
+        prox_max = raster.proximity(target_values=[112], distance_unit=distance_unit, max_distance=max_distance)
+        assert np.array_equal(
+            np.ma.getmaskarray(prox_max.data), np.ma.getmaskarray(prox.data) | (prox.data.filled(0) > max_distance)
+        )
+        assert np.array_equal(prox_max.data.compressed(), prox.data[prox.data <= max_distance].compressed())
+
+        # Computing tile by tile gives the same output, without loading the raster
+        raster_unloaded = gu.Raster(self.landsat_b4_path)
+        prox_multiproc = raster_unloaded.proximity(
+            target_values=[112], distance_unit=distance_unit, max_distance=max_distance, multiproc_config=config
+        )
+        assert not raster_unloaded.is_loaded
+        assert not prox_multiproc.is_loaded
+        assert prox_multiproc.raster_equal(prox_max, strict_masked=False)
+
+        # Same for a vector, inside or outside
+        for in_or_out, geometry_type in [("both", "boundary"), ("in", "boundary"), ("out", "geometry")]:
+            kwargs = {
+                "in_or_out": in_or_out,
+                "geometry_type": geometry_type,
+                "distance_unit": distance_unit,
+                "max_distance": max_distance,
+            }
+            prox_max = vector.proximity(raster=raster, **kwargs)
+            prox_multiproc = vector.proximity(raster=raster, multiproc_config=config, **kwargs)
+            assert prox_multiproc.raster_equal(prox_max, strict_masked=False)
+
+        with pytest.raises(ValueError, match="A maximum distance is required.*"):
+            raster.proximity(multiproc_config=config)
+
         # Paths to example data
 
     # Mask without nodata
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import logging
 import re
+import time
 from typing import Literal
 
 import numpy as np
@@ -292,6 +294,118 @@ class TestInterpolate:
 
         assert np.array_equal(vals2, vals3, equal_nan=True)
 
+    @pytest.mark.parametrize("method", ["nearest", "linear", "cubic", "splinef2d"])  # type: ignore
+    def test_interp_points__context(self, method: Literal["nearest", "linear", "cubic", "splinef2d"]) -> None:
+        """Test that the interpolation context is re-used across calls, and re-created when data changes."""
+
+        r = gu.Raster(self.aster_dem_path)
+        r = r.crop((r.bounds.left, r.bounds.bottom, r.bounds.left + r.res[0] * 50, r.bounds.bottom + r.res[1] * 50))
+        r[20:25, 20:25] = np.nan
+
+        rng = np.random.default_rng(42)
+        x, y = r.ij2xy(rng.uniform(1, 49, size=100), rng.uniform(1, 49, size=100))
+
+        # Values with the context are the same as those without
+        vals = r.interp_points((x, y), method=method)
+        context = r._get_interpolation_context()
+        vals_nocontext = _interp_points(
+            r.get_nanarray(), transform=r.transform, area_or_point=r.area_or_point, points=(x, y), method=method
+        )
+        assert np.array_equal(vals, vals_nocontext, equal_nan=True)
+
+        # The context is re-used for a new batch of points, as well as its prepared interpolators
+        nb_interpolators = len(context._interpolators)
+        r.interp_points((x[:50], y[:50]), method=method)
+        assert r._get_interpolation_context() is context
+        assert len(context._interpolators) == nb_interpolators
+
+        # The context is re-created when data changes, and values are updated
+        r[0:50, 0:50] = r.data + 1
+        vals_new = r.interp_points((x, y), method=method)
+        assert r._get_interpolation_context() is not context
+        assert np.allclose(vals_new, vals + 1, equal_nan=True)
+
+        # Reading the array, as other methods do, keeps the context
+        context = r._get_interpolation_context()
+        r.get_stats("mean")
+        r.interp_points((x, y), method=method)
+        assert r._get_interpolation_context() is context
+
+        # Writing in place into the array also updates values
+        r.data[:] += 100
+        vals_inplace = r.interp_points((x, y), method=method)
+        assert r._get_interpolation_context() is not context
+        assert np.allclose(vals_inplace, vals_new + 100, equal_nan=True)
+
+        # A different band also re-creates the context
+        r_multi = gu.Raster(self.landsat_rgb_path)
+        context1 = r_multi._get_interpolation_context(band=1)
+        assert r_multi._get_interpolation_context(band=2) is not context1
+
+    @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path, landsat_rgb_path])  # type: ignore
+    @pytest.mark.parametrize(
+        "method", ["nearest", "linear", "cubic", "quintic", "slinear", "pchip", "splinef2d"]
+    )  # type: ignore
+    @pytest.mark.parametrize(
+        "multiproc_config",
+        [
+            None,
+            gu.raster.MultiprocConfig(chunk_size=100),
+            gu.raster.MultiprocConfig(chunk_size=150, cluster=gu.raster.ClusterGenerator("multi", nb_workers=2)),
+        ],
+    )  # type: ignore
+    def test_interp_points__windowed(
+        self,
+        example: str,
+        method: Literal["nearest", "linear", "cubic", "quintic", "slinear", "pchip", "splinef2d"],
+        multiproc_config: gu.raster.MultiprocConfig | None,
+    ) -> None:
+        """Test that interpolating an unloaded raster by reading only windows around points gives the same values."""
+
+        r = gu.Raster(example)
+        r_loaded = gu.Raster(example, load_data=True)
+
+        # Random points in unsorted order, with some outside the image
+        rng = np.random.default_rng(42)
+        i = rng.uniform(-10, r.height + 10, size=500)
+        j = rng.uniform(-10, r.width + 10, size=500)
+        x, y = r.ij2xy(i, j)
+
+        band = r.count
+        vals = r.interp_points((x, y), method=method, band=band, multiproc_config=multiproc_config)
+        vals_loaded = r_loaded.interp_points((x, y), method=method, band=band)
+
+        # Spline methods fitted on the full grid are only interpolated by windows if a configuration is passed, and
+        # then differ within the tolerance of the spline fit (solved iteratively by SciPy)
+        global_spline = method in ["cubic", "quintic", "splinef2d"]
+        windowed = multiproc_config is not None or not global_spline
+        rtol = 1e-3 if global_spline else 1e-5
+
+        # The raster was not loaded, and values are the same as with the full array
+        assert r.is_loaded != windowed
+        assert vals.shape == vals_loaded.shape
+        if method in ["nearest", "linear"] or not windowed:
+            assert np.array_equal(vals, vals_loaded, equal_nan=True)
+        else:
+            assert np.array_equal(np.isnan(vals), np.isnan(vals_loaded))
+            assert np.allclose(vals, vals_loaded, rtol=rtol, equal_nan=True)
+
+        # Same for a lazily cropped raster, and for a single point
+        r_crop = gu.Raster(example).icrop((50, 50, 250, 250))
+        r_crop_loaded = r_loaded.icrop((50, 50, 250, 250))
+        x0, y0 = r_crop.ij2xy(100.3, 120.7)
+        val = r_crop.interp_points((x0, y0), method=method, band=band, multiproc_config=multiproc_config)
+        assert r_crop.is_loaded != windowed
+        assert val.shape == (1,)
+        assert np.allclose(val, r_crop_loaded.interp_points((x0, y0), method=method, band=band), rtol=rtol)
+
+        # With many points, for which tiles of the cropped raster are aligned with the blocks of the file
+        x, y = r_crop.ij2xy(rng.uniform(0, r_crop.height, size=200), rng.uniform(0, r_crop.width, size=200))
+        vals = r_crop.interp_points((x, y), method=method, band=band, multiproc_config=multiproc_config)
+        vals_loaded = r_crop_loaded.interp_points((x, y), method=method, band=band)
+        assert np.array_equal(np.isnan(vals), np.isnan(vals_loaded))
+        assert np.allclose(vals, vals_loaded, rtol=rtol, equal_nan=True)
+
     @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path])  # type: ignore
     @pytest.mark.parametrize(
         "method", ["nearest", "linear", "cubic", "quintic", "slinear", "pchip", "splinef2d"]
@@ -599,3 +713,93 @@ class TestInterpolate:
         x, y = [r.bounds.right - 3 * r.res[0] / 2, r.bounds.bottom + r.res[1] / 2]
         lat, lon = reproject_to_latlon([x, y], r.crs)
         assert r.reduce_points((x, y)) == r.reduce_points((lon, lat), input_latlon=True) == r.data[-1, -2]
+
+    @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path])  # type: ignore
+    @pytest.mark.parametrize("load_data", [True, False])  # type: ignore
+    @pytest.mark.parametrize("masked", [True, False])  # type: ignore
+    @pytest.mark.parametrize("reducer_function", [np.ma.mean, np.ma.median, np.nanmax, lambda v: np.ma.mean(v) + 1])
+    def test_reduce_points__batched(self, example: str, load_data: bool, masked: bool, reducer_function) -> None:
+        """Test that reducing windows of many points at once is the same as reducing them one by one."""
+
+        r = gu.Raster(example, load_data=load_data)
+
+        # Random pixels, including pixels on the edges for which windows extend beyond the raster
+        rng = np.random.default_rng(42)
+        i = np.concatenate((rng.integers(10, r.height, size=200), [r.height - 1, r.height - 2, 10]))
+        j = np.concatenate((rng.integers(10, r.width, size=200), [r.width - 1, 10, r.width - 1]))
+        x, y = r.ij2xy(i, j, force_offset="center")
+
+        for window in [None, 3, 5]:
+            vals, windows = r.reduce_points(
+                (x, y), window=window, reducer_function=reducer_function, masked=masked, return_window=True
+            )
+            assert len(vals) == len(windows) == len(x)
+            for k in range(len(x)):
+                val_k, window_k = r.reduce_points(
+                    (x[k], y[k]), window=window, reducer_function=reducer_function, masked=masked, return_window=True
+                )
+                assert np.array_equal(windows[k], window_k, equal_nan=True)
+                if masked and np.ma.is_masked(val_k):
+                    assert np.ma.is_masked(vals[k])
+                else:
+                    assert np.array_equal(vals[k], val_k, equal_nan=True)
+
+        # For windows inside the raster, values are the reduction of the array
+        r = gu.Raster(example, load_data=True)
+        hw = 2
+        inside = (i >= hw) & (i < r.height - hw) & (j >= hw) & (j < r.width - hw)
+        vals = r.reduce_points((x[inside], y[inside]), window=2 * hw + 1, masked=True)
+        for k, (ik, jk) in enumerate(zip(i[inside], j[inside])):
+            expected = np.ma.mean(r.data[ik - hw : ik + hw + 1, jk - hw : jk + hw + 1])
+            if np.ma.is_masked(expected):
+                assert np.ma.is_masked(vals[k])
+            else:
+                assert vals[k] == pytest.approx(expected)
+
+    @pytest.mark.parametrize("load_data", [True, False])  # type: ignore
+    @pytest.mark.parametrize("nb_points", [10**2, 10**3])  # type: ignore
+    def test_benchmark_reduce_points(self, load_data: bool, nb_points: int) -> None:
+        """
+        Benchmark reducing windows of many points at once against the previous loop reducing points one by one.
+
+        For a loaded raster, the batched path uses a sliding window view of the array, and for an unloaded raster it
+        groups reads by blocks of the file, while the previous loop sliced the array or opened the file for each point.
+        Timings are logged as they depend on the machine, the outputs should be identical.
+        """
+        r = gu.Raster(self.landsat_b4_path, load_data=load_data)
+        rng = np.random.default_rng(42)
+        window = 3
+        hw = window // 2
+
+        # Points with windows inside the raster, on which the previous loop was valid
+        i = rng.integers(hw, r.height - hw, size=nb_points)
+        j = rng.integers(hw, r.width - hw, size=nb_points)
+        x, y = r.ij2xy(i, j, force_offset="center")
+
+        t0 = time.perf_counter()
+        vals = r.reduce_points((x, y), window=window)
+        t_batched = time.perf_counter() - t0
+
+        # Previous implementation, reading and reducing the window of each point
+        t0 = time.perf_counter()
+        rows, cols = rio.transform.rowcol(r.transform, x, y, op=np.floor)
+        vals_loop = []
+        for row, col in zip(np.int64(rows), np.int64(cols)):
+            if r.is_loaded:
+                data = r.data[row - hw : row + hw + 1, col - hw : col + hw + 1].astype(np.float32).filled(np.nan)
+            else:
+                with rio.open(r.filename) as raster:
+                    data = raster.read(
+                        window=rio.windows.Window(col - hw, row - hw, window, window),
+                        fill_value=r.nodata,
+                        boundless=True,
+                        indexes=1,
+                    )
+            vals_loop.append(np.ma.mean(data.flatten()))
+        t_loop = time.perf_counter() - t0
+
+        logging.info(
+            f"Reduce points for {nb_points} points (loaded: {load_data}): batched in {t_batched:.4f} s, "
+            f"one by one in {t_loop:.4f} s"
+        )
+        assert np.allclose(vals, vals_loop)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import warnings
+from typing import Any
 
 import geopandas as gpd
 import numpy as np
@@ -170,6 +171,77 @@ class TestRasterVectorInterface:
         with pytest.raises(ValueError, match="Only one of raster or crs can be provided."):
             vct.rasterize(raster=rst, crs=3857)
 
+    def test_rasterize_create_mask__select_features(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that rasterizing only the features selected by the spatial index, and burning them tile by tile, gives
+        the same output as rasterizing all features.
+        """
+        vct = gu.Vector(self.everest_outlines_path)
+        rst = gu.Raster(self.landsat_b4_path)
+        rst_crop = rst.icrop((100, 100, 300, 300))
+
+        # Rasterizing on a small raster is the same as rasterizing on the full raster and cropping
+        burned = vct.rasterize(raster=rst)
+        burned_crop = vct.rasterize(raster=rst_crop)
+        assert burned_crop.raster_equal(burned.icrop((100, 100, 300, 300)))
+        mask = vct.create_mask(raster=rst)
+        for buffer in [0, 200, -50]:
+            mask_crop = vct.create_mask(raster=rst_crop, buffer=buffer)
+            assert mask_crop.raster_equal(vct.create_mask(raster=rst, buffer=buffer).icrop((100, 100, 300, 300)))
+
+        # Without any feature intersecting the raster, the output is filled and has the same data type
+        rst_far = rst_crop.translate(-100000, 0)
+        burned_far = vct.rasterize(raster=rst_far)
+        assert burned_far.dtype == burned.dtype
+        assert np.all(burned_far.data == 0)
+        assert np.count_nonzero(vct.create_mask(raster=rst_far, as_array=True)) == 0
+
+        # Burning tile by tile gives the same output
+        monkeypatch.setattr(gu.interface.raster_vector, "_RASTERIZE_TILE_SIZE", 128)
+        assert vct.rasterize(raster=rst).raster_equal(burned)
+        assert vct.create_mask(raster=rst).raster_equal(mask)
+        assert vct.rasterize(raster=rst, in_value=2, out_value=1).raster_equal(
+            gu.Raster.from_array(np.where(mask.data, 2, 1), transform=rst.transform, crs=rst.crs, nodata=None)
+        )
+
+    @pytest.mark.parametrize("chunk_size", [100, "auto"])  # type: ignore
+    def test_rasterize_create_mask__multiproc(self, chunk_size: int | str, tmp_path: Any) -> None:
+        """
+        Test that rasterizing tile by tile directly into a file gives the same output as rasterizing in memory,
+        without loading the output.
+        """
+        vct = gu.Vector(self.everest_outlines_path)
+        rst = gu.Raster(self.landsat_b4_path)
+        config = gu.raster.MultiprocConfig(chunk_size, outfile=str(tmp_path / "burned.tif"))
+
+        # Burned values per feature
+        burned = vct.rasterize(raster=rst)
+        burned_multiproc = vct.rasterize(raster=rst, multiproc_config=config)
+        assert not burned_multiproc.is_loaded
+        assert burned_multiproc.filename == config.outfile
+        assert burned_multiproc.georeferenced_grid_equal(burned)
+        assert np.array_equal(burned_multiproc.data, burned.data)
+
+        # Burned value and grid from a resolution
+        grid_kwargs = {"xres": rst.res[0] * 5, "bounds": rst.bounds, "crs": rst.crs}
+        burned = vct.rasterize(**grid_kwargs, in_value=5, out_value=2)
+        burned_multiproc = vct.rasterize(**grid_kwargs, in_value=5, out_value=2, multiproc_config=config)
+        assert burned_multiproc.georeferenced_grid_equal(burned)
+        assert np.array_equal(burned_multiproc.data, burned.data)
+
+        # Masks are written as 0 and 1
+        for buffer in [0, 200]:
+            mask = vct.create_mask(raster=rst, buffer=buffer)
+            mask_multiproc = vct.create_mask(raster=rst, buffer=buffer, multiproc_config=config)
+            assert not mask_multiproc.is_loaded
+            assert mask_multiproc.dtype == "uint8"
+            assert np.array_equal(mask_multiproc.data.astype(bool), mask.data)
+        mask_multiproc = vct.rasterize(raster=rst, in_value=1, multiproc_config=config)
+        assert np.array_equal(mask_multiproc.data.astype(bool), vct.rasterize(raster=rst, in_value=1).data)
+
+        with pytest.raises(ValueError, match="A mask cannot be returned as an array.*"):
+            vct.create_mask(raster=rst, as_array=True, multiproc_config=config)
+
     @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path])  # type: ignore
     def test_polygonize(self, example: str) -> None:
         """Test that polygonize doesn't raise errors."""
@@ -219,6 +291,40 @@ class TestRasterVectorInterface:
         mask = img > value
         mask.polygonize(target_values=1)
 
+    @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path])  # type: ignore
+    @pytest.mark.parametrize("target_values", ["all", (1, 3), [2, 4]])  # type: ignore
+    def test_polygonize__multiproc(self, example: str, target_values: Any, tmp_path: Any) -> None:
+        """
+        Test that polygonizing tile by tile and stitching polygons on seams gives the same features as polygonizing
+        the full raster.
+        """
+        img = gu.Raster(example)
+        # Classify values to get polygons crossing tiles
+        img_class = img.copy(new_array=np.ma.round(img.data / np.ma.max(img.data) * 5))
+        config = gu.raster.MultiprocConfig(97, outfile=str(tmp_path / "polygons.gpkg"))
+
+        polygonized = img_class.polygonize(target_values=target_values)
+        polygonized_multiproc = img_class.polygonize(target_values=target_values, multiproc_config=config)
+        assert polygonized_multiproc.crs == img.crs
+        assert np.array_equal(polygonized_multiproc.ds["id"].values, np.arange(len(polygonized_multiproc.ds)))
+
+        # The features are the same, in a different order and with possibly more vertices on seams
+        def sort_features(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+            keys = gdf.assign(area=gdf.area, x=gdf.centroid.x, y=gdf.centroid.y)
+            return gdf.loc[keys.sort_values(["raster_value", "area", "x", "y"]).index].reset_index(drop=True)
+
+        features = sort_features(polygonized.ds)
+        features_multiproc = sort_features(polygonized_multiproc.ds)
+        assert len(features) == len(features_multiproc)
+        assert np.array_equal(features["raster_value"].values, features_multiproc["raster_value"].values)
+        assert np.all(features.geometry.geom_equals(features_multiproc.geometry))
+
+        # Same errors as when polygonizing the full raster
+        with pytest.raises(ValueError, match="no pixel with in_value 10"):
+            img_class.polygonize(target_values=10, multiproc_config=config)
+        with pytest.raises(ValueError, match="in_value must be a number, a tuple or a sequence"):
+            img_class.polygonize(target_values="not_all", multiproc_config=config)
+
 
 class TestMaskVectorInterface:
 
@@ -236,7 +342,7 @@ class TestMaskVectorInterface:
     mask_everest = gu.Vector(everest_outlines_path).create_mask(gu.Raster(landsat_b4_path))
 
     @pytest.mark.parametrize("mask", [mask_landsat_b4, mask_aster_dem, mask_everest])  # type: ignore
-    def test_polygonize(self, mask: gu.Mask) -> None:
+    def test_polygonize(self, mask: gu.Mask, tmp_path: Any) -> None:
         mask_orig = mask.copy()
         # Run default
         vect = mask.polygonize()
@@ -252,6 +358,13 @@ class TestMaskVectorInterface:
         vect = mask.polygonize(target_values=0)
         assert isinstance(vect, gu.Vector)
 
+        # Run tile by tile
+        config = gu.raster.MultiprocConfig(100, outfile=str(tmp_path / "polygons.gpkg"))
+        vect_multiproc = mask.polygonize(target_values=0, multiproc_config=config)
+        assert mask.data.dtype == bool
+        assert len(vect_multiproc.ds) == len(vect.ds)
+        assert vect_multiproc.ds.area.sum() == pytest.approx(vect.ds.area.sum())
+
         # Check a warning is raised when using a non-boolean value
         with pytest.warns(UserWarning, match="In-value converted to 1 for polygonizing boolean mask."):
             mask.polygonize(target_values=2)
@@ -8,6 +8,8 @@ import geopandas as gpd
 import numpy as np
 import pyproj.exceptions
 import pytest
+import shapely
+from rasterio.crs import CRS
 from shapely.geometry import Point, Polygon
 
 import geoutils as gu
@@ -177,6 +179,39 @@ class TestProjTools:
         assert out_bounds[2] == max(img1.bounds.right, outlines.ds.total_bounds[2])
         assert out_bounds[3] == max(img1.bounds.top, outlines.ds.total_bounds[3])
 
+    def test_merge_bounds__array(self) -> None:
+        """Check that merge_bounds and bounds2poly on arrays of bounds give the same as on lists of bounds."""
+
+        rng = np.random.default_rng(42)
+        bottom_left = rng.uniform(0, 100, size=(1000, 2))
+        bounds = np.hstack([bottom_left, bottom_left + rng.uniform(1, 10, size=(1000, 2))])
+        polys = [shapely.geometry.box(*b) for b in bounds]
+
+        # Union is the same as on polygons, for an array or a list
+        out_bounds = pt.merge_bounds(bounds)
+        assert np.allclose(out_bounds, shapely.union_all(polys).bounds)
+        assert pt.merge_bounds(list(map(tuple, bounds))) == out_bounds
+
+        # Intersection of the first bounds, and void intersection
+        out_bounds = pt.merge_bounds(bounds[:2], merging_algorithm="intersection")
+        assert np.allclose(out_bounds, polys[0].intersection(polys[1]).bounds, equal_nan=True)
+        out_bounds = pt.merge_bounds(bounds, merging_algorithm="intersection")
+        assert all(np.isnan(b) for b in out_bounds)
+
+        # Bounds touching on an edge intersect on a line
+        out_bounds = pt.merge_bounds([(0, 0, 1, 1), (1, 0, 2, 1)], merging_algorithm="intersection")
+        assert out_bounds == (1, 0, 1, 1)
+
+        # Batched polygons, in the same CRS or reprojected
+        out_polys = pt.bounds2poly(bounds)
+        assert isinstance(out_polys, np.ndarray) and out_polys.shape == (len(bounds),)
+        assert all(p1.equals(p2) for p1, p2 in zip(out_polys, polys))
+        out_polys = pt.bounds2poly(bounds, in_crs=CRS.from_epsg(32645), out_crs=CRS.from_epsg(4326))
+        for i in [0, 500, 999]:
+            poly = pt.bounds2poly(list(bounds[i]), in_crs=CRS.from_epsg(32645), out_crs=CRS.from_epsg(4326))
+            assert isinstance(poly, Polygon)
+            assert out_polys[i].equals(poly)
+
     # Try all vectors and rasters
     @pytest.mark.parametrize(
         "fn_raster_or_vector",
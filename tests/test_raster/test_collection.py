@@ -0,0 +1,173 @@
+"""
+Test collections of rasters.
+"""
+
+from __future__ import annotations
+
+import shutil
+import warnings
+
+import numpy as np
+import pytest
+import rasterio as rio
+import shapely
+
+import geoutils as gu
+from geoutils import examples
+from geoutils.raster import RasterCollection
+from geoutils.raster.multiraster import _get_collection_rasters
+
+
+class TestRasterCollection:
+
+    paths = [
+        examples.get_path("everest_landsat_b4"),
+        examples.get_path("everest_landsat_b4_cropped"),
+        examples.get_path("everest_landsat_rgb"),
+        examples.get_path("exploradores_aster_dem"),
+    ]
+
+    def test_from_paths(self) -> None:
+        """Test that the catalog of a collection has the metadata and footprints of the rasters."""
+
+        collection = RasterCollection.from_paths(self.paths, crs=4326)
+        assert len(collection) == len(self.paths)
+        assert collection.paths == self.paths
+        assert collection.crs == rio.crs.CRS.from_epsg(4326)
+
+        for i, path in enumerate(self.paths):
+            raster = gu.Raster(path, load_data=False)
+            metadata = collection.get_metadata(i)
+            assert metadata["crs"] == raster.crs
+            assert metadata["transform"] == raster.transform
+            assert metadata["shape"] == raster.shape
+            assert metadata["count"] == raster.count
+            assert metadata["dtype"] == raster.dtype
+            assert metadata["nodata"] == raster.nodata
+
+            # Bounds are the same as computed on the raster
+            assert np.allclose(collection.get_bounds()[i], raster.bounds)
+            assert np.allclose(collection.get_bounds_projected(4326)[i], raster.get_bounds_projected(4326))
+
+            # Footprints are close to those of the raster
+            footprint = raster.get_footprint_projected(4326).ds.geometry.iloc[0]
+            assert shapely.equals_exact(collection.footprints.iloc[i].envelope, footprint.envelope, tolerance=1e-4)
+
+            # Indexing returns the raster, not loaded
+            assert not collection[i].is_loaded
+            assert collection[i].area_or_point == raster.area_or_point
+            assert collection[i].raster_equal(raster)
+
+        # The default CRS is that of the first raster
+        assert RasterCollection.from_paths(self.paths).crs == gu.Raster(self.paths[0], load_data=False).crs
+
+    def test_to_rasters(self, tmp_path) -> None:  # type: ignore
+        """Test that the rasters of a collection are created from its catalog, without opening any file."""
+
+        paths = []
+        for i, path in enumerate(self.paths):
+            paths.append(str(tmp_path / f"raster{i}.tif"))
+            gu.Raster(path).save(paths[-1])
+        collection = RasterCollection.from_paths(paths)
+
+        # Once the files are moved, rasters are still created from the catalog, but cannot be loaded
+        for path in paths:
+            shutil.move(path, path + ".moved")
+        for path, raster in zip(self.paths, collection.to_rasters()):
+            raster_disk = gu.Raster(path, load_data=False)
+            assert raster.georeferenced_grid_equal(raster_disk)
+            assert (raster.count, raster.dtype, raster.nodata) == (
+                raster_disk.count,
+                raster_disk.dtype,
+                raster_disk.nodata,
+            )
+            assert not raster.is_loaded
+        with pytest.raises(rio.errors.RasterioIOError):
+            collection[0].load()
+
+    def test_query(self) -> None:
+        """Test querying rasters intersecting bounds or geometries."""
+
+        collection = RasterCollection.from_paths(self.paths)
+        raster = gu.Raster(self.paths[1], load_data=False)
+
+        # Bounds in the CRS of the collection, only intersecting the Everest rasters
+        subset = collection.query(raster.bounds)
+        assert subset.paths == self.paths[:3]
+        assert isinstance(subset, RasterCollection)
+
+        # Bounds in another CRS, and geometries
+        assert collection.query(raster.get_bounds_projected(4326), crs=4326).paths == self.paths[:3]
+        assert collection.query(shapely.box(*raster.bounds)).paths == self.paths[:3]
+        assert collection.query(raster.get_footprint_projected(4326)).paths == self.paths[:3]
+
+        # The Exploradores raster is far from the Everest
+        dem = gu.Raster(self.paths[3], load_data=False)
+        assert collection.query(dem.get_bounds_projected(4326), crs=4326).paths == self.paths[3:]
+        assert len(collection.query((0, 0, 1, 1), crs=4326)) == 0
+
+    def test_save(self, tmp_path) -> None:  # type: ignore
+        """Test that a saved collection is read back with the same catalog."""
+
+        collection = RasterCollection.from_paths(self.paths)
+        extensions = [".gpkg"]
+        try:
+            import pyarrow  # noqa
+
+            extensions.append(".parquet")
+        except ImportError:
+            pass
+
+        for extension in extensions:
+            filename = tmp_path / f"catalog{extension}"
+            collection.save(filename)
+            collection_read = RasterCollection.from_file(filename)
+
+            assert collection_read.paths == collection.paths
+            assert collection_read.crs == collection.crs
+            for i in range(len(collection)):
+                assert collection_read.get_metadata(i) == collection.get_metadata(i)
+            assert np.array_equal(collection_read.get_bounds(), collection.get_bounds())
+            assert collection_read.query(collection.bounds).paths == collection.paths
+
+    def test_multiraster(self, tmp_path) -> None:  # type: ignore
+        """Test that tools for multiple rasters give the same output with a collection."""
+
+        warnings.filterwarnings("ignore", category=UserWarning, message="For reprojection, nodata must be set.*")
+        warnings.filterwarnings(
+            "ignore", category=UserWarning, message="New nodata value cells already exist in the data array.*"
+        )
+
+        collection = RasterCollection.from_paths(self.paths[:3])
+
+        rasters = gu.raster.load_multiple_rasters(self.paths[:3], crop=True)
+        rasters_collection = gu.raster.load_multiple_rasters(collection, crop=True)
+        for raster, raster_collection in zip(rasters, rasters_collection):
+            assert raster.raster_equal(raster_collection)
+
+        merged = gu.raster.merge_rasters([gu.Raster(path) for path in self.paths[:2]], progress=False)
+        merged_collection = gu.raster.merge_rasters(RasterCollection.from_paths(self.paths[:2]), progress=False)
+        assert merged.raster_equal(merged_collection)
+
+        # On the bounds of the reference, only the rasters intersecting it are merged (not the Exploradores raster)
+        merged = gu.raster.merge_rasters(
+            [gu.Raster(path) for path in self.paths[:2]], reference=1, use_ref_bounds=True, progress=False
+        )
+        collection = RasterCollection.from_paths([self.paths[3], *self.paths[:2]])
+        merged_collection = gu.raster.merge_rasters(collection, reference=2, use_ref_bounds=True, progress=False)
+        assert merged.raster_equal(merged_collection)
+        rasters_selected, _, _ = _get_collection_rasters(collection, 2, use_ref_bounds=True, select=True)
+        assert [raster.filename for raster in rasters_selected] == self.paths[:2]
+        with pytest.raises(ValueError, match="No raster of the collection intersects the bounds.*"):
+            gu.raster.merge_rasters(
+                collection.query(collection[0].bounds), reference=collection[1], use_ref_bounds=True
+            )
+
+        # Tile by tile, with the bounds of the rasters from the catalog
+        config = gu.raster.MultiprocConfig(chunk_size=200, outfile=tmp_path / "mosaic.tif")
+        collection_everest = collection.query(collection[1].bounds, crs=collection[1].crs)
+        assert len(collection_everest) == 2
+        stacked = gu.raster.stack_rasters(collection_everest, progress=False)
+        stacked_tiled = gu.raster.stack_rasters(collection_everest, progress=False, multiproc_config=config)
+        assert stacked_tiled.georeferenced_grid_equal(stacked)
+        assert np.ma.allequal(stacked_tiled.data, stacked.data)
@@ -1,5 +1,6 @@
 """ Functions to test the clusters."""
 
+import os
 import time
 
 import pytest
@@ -7,7 +8,9 @@ import pytest
 from geoutils.raster.distributed_computing.cluster import (
     BasicCluster,
     ClusterGenerator,
+    FuturesCluster,
     MpCluster,
+    ThreadCluster,
 )
 
 
@@ -22,6 +25,11 @@ def long_running_task(x: float) -> float:
     return x * 2
 
 
+# Function to get the process ID of the worker
+def get_pid(x: float) -> int:
+    return os.getpid()
+
+
 class TestClusterGenerator:
     def test_basic_cluster(self) -> None:
         # Test that tasks are run synchronously in BasicCluster
@@ -60,3 +68,74 @@ class TestClusterGenerator:
         # Expect an error when trying to launch a task after closing
         with pytest.raises(ValueError):
             cluster.launch_task(sample_function, args=[2, 3])
+
+    def test_mp_cluster_worker_recycling(self) -> None:
+        # Test that workers are persistent by default
+        cluster = ClusterGenerator("multiprocessing", nb_workers=1)
+        pids = {cluster.get_res(cluster.launch_task(get_pid, args=[i])) for i in range(30)}
+        cluster.close()
+        assert len(pids) == 1
+
+        # And recycled if asked
+        cluster = ClusterGenerator("multiprocessing", nb_workers=1, maxtasksperchild=10)
+        pids = {cluster.get_res(cluster.launch_task(get_pid, args=[i])) for i in range(30)}
+        cluster.close()
+        assert len(pids) == 3
+
+    @pytest.mark.parametrize("context", ["spawn", "forkserver"])  # type: ignore
+    def test_futures_cluster(self, context: str) -> None:
+        # Test that tasks are launched asynchronously in FuturesCluster, with warmed-up persistent workers
+        cluster = ClusterGenerator("futures", nb_workers=2, context=context)
+        assert isinstance(cluster, FuturesCluster)
+
+        futures = [cluster.launch_task(long_running_task, args=[i]) for i in range(4)]
+        assert not cluster.is_ready(futures[-1])
+        results = [cluster.get_res(f) for f in futures]
+        assert results == [0, 2, 4, 6]
+        assert all(cluster.is_ready(f) for f in futures)
+
+        pids = {cluster.get_res(cluster.launch_task(get_pid, args=[i])) for i in range(10)}
+        assert len(pids) <= 2
+
+        # Expect an error when trying to launch a task after closing
+        cluster.close()
+        with pytest.raises(RuntimeError):
+            cluster.launch_task(sample_function, args=[2, 3])
+
+    def test_thread_cluster(self) -> None:
+        # Test that tasks are run in parallel in ThreadCluster, in the same process
+        cluster = ClusterGenerator("threads", nb_workers=2)
+        assert isinstance(cluster, ThreadCluster)
+
+        t0 = time.time()
+        futures = [cluster.launch_task(long_running_task, args=[i]) for i in range(4)]
+        results = [cluster.get_res(f) for f in futures]
+        assert results == [0, 2, 4, 6]
+        assert time.time() - t0 < 3.5
+
+        pids = {cluster.get_res(cluster.launch_task(get_pid, args=[i])) for i in range(10)}
+        assert pids == {os.getpid()}
+
+        # Expect an error when trying to launch a task after closing
+        cluster.close()
+        with pytest.raises(RuntimeError):
+            cluster.launch_task(sample_function, args=[2, 3])
+
+    @pytest.mark.parametrize("name", ["multiprocessing", "futures", "threads"])  # type: ignore
+    def test_wait_any(self, name: str) -> None:
+        # Test that waiting on tasks blocks until one is completed, and returns only completed tasks
+        cluster = ClusterGenerator(name, nb_workers=2)
+
+        futures = [cluster.launch_task(sample_function, args=[2, 3]), cluster.launch_task(long_running_task, args=[1])]
+        ready = cluster.wait_any(futures)
+        while futures[0] not in ready:
+            ready = cluster.wait_any(futures)
+        assert all(cluster.is_ready(f) for f in ready)
+        assert not cluster.is_ready(futures[1])
+
+        # Failed tasks are also completed
+        futures = [cluster.launch_task(sample_function, args=[2, "a"])]
+        assert cluster.wait_any(futures) == futures
+        with pytest.raises(TypeError):
+            cluster.get_res(futures[0])
+        cluster.close()
@@ -2,7 +2,10 @@
 Tests for multiprocessing functions
 """
 
+import logging
 import os
+import pickle
+import time
 from multiprocessing import cpu_count
 from typing import Any
 
@@ -23,6 +26,9 @@ from geoutils.raster.distributed_computing import (
 )
 from geoutils.raster.distributed_computing.multiproc import (
     _apply_func_block,
+    _get_block_size,
+    _get_raster_tile,
+    _launch_tasks_unordered,
     _load_raster_tile,
     _remove_tile_padding,
 )
@@ -53,12 +59,18 @@ def _custom_func_mask(raster: RasterType) -> gu.Mask:
     return gu.Mask.from_array(mask_array, raster.transform, raster.crs)
 
 
+# Define a simple function for tasks
+def _square(x: float) -> float:
+    return x**2
+
+
 class TestMultiproc:
     aster_dem_path = examples.get_path("exploradores_aster_dem")
     landsat_rgb_path = examples.get_path("everest_landsat_rgb")
 
     num_workers = min(2, cpu_count())  # Safer limit for CI
     cluster = ClusterGenerator("test", nb_workers=num_workers)
+    thread_cluster = ClusterGenerator("threads", nb_workers=num_workers)
 
     @pytest.mark.parametrize("example", [aster_dem_path, landsat_rgb_path])  # type: ignore
     def test_load_raster_tile(self, example) -> None:
@@ -73,6 +85,38 @@ class TestMultiproc:
         raster_tile = _load_raster_tile(raster, tile)
         assert np.array_equal(raster_tile.data, raster.data[..., tile[0] : tile[1], tile[2] : tile[3]])
 
+    @pytest.mark.parametrize("example", [aster_dem_path, landsat_rgb_path])  # type: ignore
+    def test_get_raster_tile(self, example) -> None:
+        """
+        Test the description of a tile sent to workers, which should scale with the tile size and not the raster size.
+        """
+        raster = Raster(example)
+        tile = np.array([50, 125, 100, 200])  # [rowmin, rowmax, colmin, colmax]
+        raster_tile_ref = _load_raster_tile(raster, tile)
+
+        # For an unloaded raster, only the window on disk is described
+        raster_tile = _get_raster_tile(raster, tile)
+        assert raster_tile.data is None
+        assert raster_tile.window == rio.windows.Window(100, 50, 100, 75)
+        assert len(pickle.dumps(raster_tile)) < 10000
+        assert raster_tile.load().raster_equal(raster_tile_ref)
+        assert _load_raster_tile(raster_tile, tile).raster_equal(raster_tile_ref)
+        assert not raster.is_loaded
+
+        # For a lazily cropped raster, the window is shifted accordingly
+        raster_crop = raster.icrop((10, 20, raster.width, raster.height))
+        tile_crop = tile - np.array([20, 20, 10, 10])
+        raster_tile = _get_raster_tile(raster_crop, tile_crop)
+        assert raster_tile.window == rio.windows.Window(100, 50, 100, 75)
+        assert raster_tile.load().raster_equal(raster_tile_ref)
+
+        # For a loaded raster, only the array subset of the tile is passed
+        raster.load()
+        raster_tile = _get_raster_tile(raster, tile)
+        assert raster_tile.filename is None
+        assert len(pickle.dumps(raster_tile)) < len(pickle.dumps(raster)) / 10
+        assert raster_tile.load().raster_equal(raster_tile_ref)
+
     @pytest.mark.parametrize("example", [aster_dem_path, landsat_rgb_path])  # type: ignore
     @pytest.mark.parametrize("padding", [0, 1, 10])  # type: ignore
     def test_remove_tile_padding(self, example, padding) -> None:
@@ -112,9 +156,42 @@ class TestMultiproc:
         else:
             assert not result_tile.raster_equal(original_tile_filtered)
 
+    @pytest.mark.parametrize("cluster", [None, cluster, thread_cluster])  # type: ignore
+    @pytest.mark.parametrize("max_in_flight", [1, 3])  # type: ignore
+    @pytest.mark.parametrize("batch_size", [1, 4])  # type: ignore
+    def test_launch_tasks_unordered(self, cluster, max_in_flight, batch_size) -> None:
+        """
+        Test that tasks results are all retrieved, with a bounded number of tasks in flight, possibly in batches.
+        """
+        config = MultiprocConfig(100, cluster=cluster, max_in_flight=max_in_flight, batch_size=batch_size)
+        results: dict[int, float] = {}
+        nb_launched = [0]
+
+        def list_args():  # type: ignore
+            for i in range(20):
+                nb_launched[0] += 1
+                # The number of tasks launched and not retrieved never exceeds the maximum of batches in flight
+                assert nb_launched[0] - len(results) <= max_in_flight * batch_size
+                yield [i]
+
+        for i, res in _launch_tasks_unordered(config, fun=_square, list_args=list_args()):
+            results[i] = res
+
+        assert results == {i: i**2 for i in range(20)}
+
+    def test_get_block_size(self) -> None:
+        """
+        Test that the block size of written files is aligned with the chunk size.
+        """
+        assert _get_block_size(512) == 512
+        assert _get_block_size(768) == 768
+        assert _get_block_size(2048) == 1024
+        assert _get_block_size(1000) is None
+        assert _get_block_size(8) is None
+
     @pytest.mark.parametrize("example", [aster_dem_path, landsat_rgb_path])  # type: ignore
     @pytest.mark.parametrize("tile_size", [100, 200])  # type: ignore
-    @pytest.mark.parametrize("cluster", [None, cluster])
+    @pytest.mark.parametrize("cluster", [None, cluster, thread_cluster])
     def test_map_overlap_multiproc_save(self, example, tile_size, cluster):
         """
         Test the multiprocessing map function with a simple operation returning a raster.
@@ -132,8 +209,10 @@ class TestMultiproc:
         # Ensure raster has not been loading during process
         assert not raster.is_loaded
 
-        # Ensure the output file is created and valid
+        # Ensure the output file is created and valid, and tiled
         assert os.path.exists(output_file)
+        with rio.open(output_file) as ds:
+            assert ds.profile["tiled"]
 
         # Compare with the operation on full raster
         new_raster = _custom_func(raster, addition, factor)
@@ -157,9 +236,24 @@ class TestMultiproc:
             output_mask = map_overlap_multiproc_save(_custom_func_mask, raster, config, depth=depth)
             assert np.array_equal(raster.get_mask(), output_mask.data)
 
+    @pytest.mark.parametrize("example", [aster_dem_path, landsat_rgb_path])  # type: ignore
+    def test_map_overlap_multiproc_save__auto_chunk(self, example: str, tmp_path: Any) -> None:
+        """
+        Test the multiprocessing map function with a chunk shape adapted to a memory budget.
+        """
+        raster = Raster(example)
+        depth = 10
+        config = MultiprocConfig("auto", str(tmp_path / "output.tif"), memory_budget=2**20)
+
+        output_raster = map_overlap_multiproc_save(_custom_func, raster, config, 5, 0.5, depth=depth)
+
+        # Ensure raster has not been loading during process, and the result is the same as on the full raster
+        assert not raster.is_loaded
+        assert output_raster.raster_equal(_custom_func(raster, 5, 0.5))
+
     @pytest.mark.parametrize("example", [aster_dem_path, landsat_rgb_path])  # type: ignore
     @pytest.mark.parametrize("tile_size", [100, 200])  # type: ignore
-    @pytest.mark.parametrize("cluster", [None, cluster])
+    @pytest.mark.parametrize("cluster", [None, cluster, thread_cluster])
     @pytest.mark.parametrize("return_tile", [False, True])
     def test_map_multiproc_collect(self, example, tile_size, cluster, return_tile):
         """
@@ -188,10 +282,43 @@ class TestMultiproc:
         assert abs(total_stats["mean"] - tiled_mean) < tiled_mean * 1e-5
         assert total_stats["valid_count"] == tiled_count
 
+    @pytest.mark.parametrize("example", [aster_dem_path])  # type: ignore
+    def test_benchmark_thread_cluster(self, example: str, tmp_path: Any) -> None:
+        """
+        Benchmark the thread cluster against the multiprocessing cluster on map_overlap and reproject workloads.
+
+        Timings are logged as they depend on the machine, the outputs should be identical.
+        """
+        raster = Raster(example)
+        # Projected CRS of the neighbouring UTM zone
+        dst_crs = rio.crs.CRS.from_epsg(32719)
+
+        outputs = {}
+        for name, cluster in [("multiprocessing", self.cluster), ("threads", self.thread_cluster)]:
+
+            # Map overlap with a filter
+            config = MultiprocConfig(200, outfile=str(tmp_path / f"filter_{name}.tif"), cluster=cluster)
+            t0 = time.perf_counter()
+            output_filter = map_overlap_multiproc_save(_custom_func_overlap, raster, config, 3, depth=3)
+            t_filter = time.perf_counter() - t0
+
+            # Reprojection
+            config = MultiprocConfig(200, outfile=str(tmp_path / f"reproj_{name}.tif"), cluster=cluster)
+            t0 = time.perf_counter()
+            output_reproj = raster.reproject(crs=dst_crs, multiproc_config=config)
+            t_reproj = time.perf_counter() - t0
+
+            logging.info(f"Cluster {name}: map_overlap in {t_filter:.2f} s, reproject in {t_reproj:.2f} s")
+            outputs[name] = (output_filter, output_reproj)
+
+        assert not raster.is_loaded
+        assert outputs["threads"][0].raster_equal(outputs["multiprocessing"][0])
+        assert outputs["threads"][1].raster_equal(outputs["multiprocessing"][1])
+
     @pytest.mark.skip()
     @pytest.mark.parametrize("example", [aster_dem_path])  # type: ignore
     @pytest.mark.parametrize("tile_size", [100, 200])  # type: ignore
-    @pytest.mark.parametrize("cluster", [None, cluster])  # type: ignore
+    @pytest.mark.parametrize("cluster", [None, cluster, thread_cluster])  # type: ignore
     def test_multiproc_reproject(self, example, tile_size, cluster):
         """Test for multiproc_reproject"""
 
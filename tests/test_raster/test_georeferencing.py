@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import logging
+import time
+
 import numpy as np
 import pytest
 
 import geoutils as gu
 from geoutils import examples
+from geoutils.raster.georeferencing import _outside_image
 
 
 class TestGeoreferencing:
@@ -209,3 +213,61 @@ class TestGeoreferencing:
         xxgrid, yygrid = img.coords(grid=True, force_offset="ll")
         assert np.array_equal(xxgrid, np.repeat(xx0[np.newaxis, :], img.height, axis=0))
         assert np.array_equal(yygrid, np.flipud(np.repeat(yy0[:, np.newaxis], img.width, axis=1)))
+
+    def test_outside_image(self) -> None:
+        """Test that outside_image works for scalars and arrays of indices or coordinates."""
+
+        img = gu.Raster(self.landsat_b4_path)
+
+        # Scalars return a boolean
+        assert img.outside_image(0, 0) is False
+        assert img.outside_image(-1, 0) is True
+        assert img.outside_image(0, img.height + 1) is True
+        assert img.outside_image(img.bounds.left + img.res[0], img.bounds.top - img.res[1], index=False) is False
+        assert img.outside_image(img.bounds.left - img.res[0], img.bounds.top, index=False) is True
+
+        # Arrays return a boolean array equal to the check of each point
+        rng = np.random.default_rng(42)
+        xi = rng.uniform(-100, img.width + 100, size=1000)
+        yj = rng.uniform(-100, img.height + 100, size=1000)
+        outside = img.outside_image(xi, yj)
+        assert outside.shape == xi.shape
+        assert np.array_equal(outside, [img.outside_image(x, y) for x, y in zip(xi, yj)])
+
+        # Same with coordinates
+        x, y = img.ij2xy(yj, xi, force_offset="ul")
+        outside_coords = img.outside_image(x, y, index=False)
+        assert np.array_equal(outside_coords, [img.outside_image(x0, y0, index=False) for x0, y0 in zip(x, y)])
+
+    @pytest.mark.parametrize("nb_points", [10**3, 10**5, 10**6])  # type: ignore
+    def test_benchmark_outside_image(self, nb_points: int) -> None:
+        """
+        Benchmark the vectorized out-of-image check against the previous check per point with np.vectorize.
+
+        Timings are logged as they depend on the machine, the outputs should be identical.
+        """
+        img = gu.Raster(self.landsat_b4_path)
+        rng = np.random.default_rng(42)
+        xi = rng.uniform(-100, img.width + 100, size=nb_points)
+        yj = rng.uniform(-100, img.height + 100, size=nb_points)
+
+        t0 = time.perf_counter()
+        outside = img.outside_image(xi, yj)
+        t_vectorized = time.perf_counter() - t0
+
+        # Previous implementation, calling the check for each point
+        t0 = time.perf_counter()
+        outside_loop = np.vectorize(
+            lambda k1, k2: _outside_image(
+                k1, k2, transform=img.transform, area_or_point=img.area_or_point, shape=img.shape, index=True
+            )
+        )(xi, yj)
+        t_loop = time.perf_counter() - t0
+
+        logging.info(
+            f"Outside image for {nb_points} points: vectorized in {t_vectorized:.4f} s, per point in {t_loop:.4f} s"
+        )
+        assert np.array_equal(outside, outside_loop)
+        # The gain is of several orders of magnitude, so this holds on any machine for many points
+        if nb_points >= 10**5:
+            assert t_vectorized < t_loop
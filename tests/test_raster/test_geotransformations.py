@@ -266,6 +266,45 @@ class TestRasterGeotransformations:
         r2_crop = r2.crop(bbox)
         assert r2_crop.area_or_point == "Point"
 
+    @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path, landsat_rgb_path])  # type: ignore
+    def test_crop__unloaded(self, example: str) -> None:
+        """Test that cropping an unloaded raster is lazy, and reads only the window when data is accessed."""
+
+        r = gu.Raster(example)
+        r_loaded = gu.Raster(example, load_data=True)
+
+        # Crop with pixel indices, and check the output is not loaded and has the right georeferencing
+        bbox = (10, 20, r.width - 30, r.height - 40)
+        r_crop = r.icrop(bbox)
+        r_crop_loaded = r_loaded.icrop(bbox)
+        assert not r.is_loaded
+        assert not r_crop.is_loaded
+        assert r_crop.shape == r_crop_loaded.shape
+        assert r_crop.transform == r_crop_loaded.transform
+
+        # Nested crops should compose their windows
+        bbox_nested = (5, 5, 15, 25)
+        r_nested = r_crop.icrop(bbox_nested)
+        r_nested_loaded = r_crop_loaded.icrop(bbox_nested)
+        assert not r_nested.is_loaded
+        assert r_nested.shape == r_nested_loaded.shape
+        assert r_nested.transform == r_nested_loaded.transform
+
+        # The data read from the window is the same as the data cropped in memory
+        assert r_crop.raster_equal(r_crop_loaded)
+        assert r_nested.raster_equal(r_nested_loaded)
+        assert not r_nested.is_modified
+
+        # Same with georeferenced crop, and inplace
+        bbox_geo = list(r_crop_loaded.bounds)
+        r.crop(bbox_geo, inplace=True)
+        assert not r.is_loaded
+        assert r.raster_equal(r_crop_loaded)
+
+        # The mask is also read only for the window
+        r_nested = gu.Raster(example).icrop(bbox).icrop(bbox_nested)
+        assert np.array_equal(r_nested.get_mask(), r_nested_loaded.get_mask())
+
     @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path, landsat_rgb_path])  # type: ignore
     def test_translate(self, example: str) -> None:
         """Test translation works as intended"""
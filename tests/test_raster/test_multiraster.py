@@ -16,6 +16,7 @@ import geoutils as gu
 from geoutils import examples
 from geoutils._typing import NDArrayNum
 from geoutils.raster import RasterType
+from geoutils.raster.multiraster import _MergeAccumulator
 from geoutils.raster.raster import _default_nodata
 
 
@@ -205,7 +206,11 @@ class TestMultiRaster:
         merged_bounds = gu.projtools.merge_bounds(
             [rasters.img1.bounds, rasters.img2.get_bounds_projected(rasters.img1.crs)], resolution=rasters.img1.res[0]
         )
-        assert merged_bounds == stacked_img.bounds
+        # The output grid starts at the upper-left corner of the merged bounds with the reference resolution, and
+        # covers them within a pixel
+        assert stacked_img.res == rasters.img1.res
+        assert (stacked_img.bounds.left, stacked_img.bounds.top) == (merged_bounds[0], merged_bounds[3])
+        assert np.allclose(stacked_img.bounds, merged_bounds, atol=max(rasters.img1.res))
 
         nodata_ref = rasters.img1.nodata
         # Check that reference works with input Raster
@@ -287,7 +292,11 @@ class TestMultiRaster:
         merged_bounds = gu.projtools.merge_bounds(
             [rasters.img1.bounds, rasters.img2.get_bounds_projected(rasters.img1.crs)], resolution=rasters.img1.res[0]
         )
-        assert merged_bounds == merged_img.bounds
+        # The output grid starts at the upper-left corner of the merged bounds with the reference resolution, and
+        # covers them within a pixel
+        assert merged_img.res == rasters.img1.res
+        assert (merged_img.bounds.left, merged_img.bounds.top) == (merged_bounds[0], merged_bounds[3])
+        assert np.allclose(merged_img.bounds, merged_bounds, atol=max(rasters.img1.res))
 
         assert np.count_nonzero(np.isnan(merged_img.data)) == 0  # Check no NaNs introduced
 
@@ -327,6 +336,173 @@ class TestMultiRaster:
         with pytest.raises(TypeError, match=msg):
             gu.raster.merge_rasters([rasters.img1, rasters.img2], merge_algorithm=custom_func)
 
+    @pytest.mark.parametrize(
+        "rasters",
+        [
+            pytest.lazy_fixture("images_1d"),
+            pytest.lazy_fixture("images_different_crs"),
+            pytest.lazy_fixture("images_nodata_zero"),
+        ],
+    )  # type: ignore
+    def test_merge_rasters__streaming(self, rasters) -> None:  # type: ignore
+        """Test that streaming merging algorithms give the same output as functions applied to the stack."""
+
+        warnings.filterwarnings(
+            "ignore", category=UserWarning, message="New nodata value cells already exist in the data array.*"
+        )
+        warnings.filterwarnings("ignore", category=UserWarning, message="For reprojection, nodata must be set.*")
+        warnings.filterwarnings("ignore", category=UserWarning, message="Unmasked values equal to*")
+
+        # Use a third raster and invalid values, for the median and count to differ from other algorithms
+        img3 = rasters.img3.copy()
+        if img3.nodata is None:
+            img3.set_nodata(_default_nodata(img3.dtype))
+        img3.set_mask(img3.data > np.ma.median(img3.data))
+        list_rasters = [rasters.img1, rasters.img2, img3]
+
+        def count(x: NDArrayNum, axis: int | None = None) -> NDArrayNum:
+            return np.sum(~np.ma.getmaskarray(x), axis=axis).astype(np.uint32)
+
+        for name, func in [
+            ("mean", np.nanmean),
+            ("min", np.nanmin),
+            ("max", np.nanmax),
+            ("median", np.nanmedian),
+            ("count", count),
+        ]:
+            merged_streaming = gu.raster.merge_rasters(list_rasters, merge_algorithm=name, progress=False)
+            merged_stack = gu.raster.merge_rasters(list_rasters, merge_algorithm=func, progress=False)
+            assert merged_streaming.georeferenced_grid_equal(merged_stack)
+            assert merged_streaming.dtype == merged_stack.dtype
+            assert np.array_equal(np.ma.getmaskarray(merged_streaming.data), np.ma.getmaskarray(merged_stack.data))
+            assert np.ma.allclose(merged_streaming.data, merged_stack.data)
+
+        # The first and last valid values are those of the first and last rasters where they are valid
+        merged = gu.raster.merge_rasters(list_rasters, merge_algorithm=["first", "last"], progress=False)
+        stack = gu.raster.stack_rasters(list_rasters, progress=False).data
+        first = np.ma.where(
+            np.ma.getmaskarray(stack[0]), np.ma.where(np.ma.getmaskarray(stack[1]), stack[2], stack[1]), stack[0]
+        )
+        last = np.ma.where(
+            np.ma.getmaskarray(stack[2]), np.ma.where(np.ma.getmaskarray(stack[1]), stack[0], stack[1]), stack[2]
+        )
+        assert np.ma.allequal(merged.data[0], first)
+        assert np.ma.allequal(merged.data[1], last)
+
+        # The feathered mean is a weighted mean, between the minimum and maximum
+        merged = gu.raster.merge_rasters(list_rasters, merge_algorithm=["feather", "min", "max"], progress=False)
+        assert np.ma.all(merged.data[0] >= merged.data[1] - 1e-6)
+        assert np.ma.all(merged.data[0] <= merged.data[2] + 1e-6)
+        # And is equal to the value of a single valid raster at a pixel
+        single = count(stack, axis=0) == 1
+        assert np.ma.allclose(merged.data[0][single], merged.data[1][single])
+
+        # Names of streaming algorithms must exist, and cannot be mixed with functions
+        with pytest.raises(ValueError, match="merge_algorithm name must be one of*"):
+            gu.raster.merge_rasters(list_rasters, merge_algorithm="sum")
+        with pytest.raises(ValueError, match="merge_algorithm cannot mix names of streaming algorithms and functions."):
+            gu.raster.merge_rasters(list_rasters, merge_algorithm=["mean", np.nanmax])
+
+    @pytest.mark.parametrize(
+        "rasters",
+        [
+            pytest.lazy_fixture("images_1d"),
+            pytest.lazy_fixture("images_different_crs"),
+            pytest.lazy_fixture("images_nodata_zero"),
+        ],
+    )  # type: ignore
+    @pytest.mark.parametrize(
+        "merge_algorithm", [None, np.nanmean, [np.nanmax, np.nanmin], ["median", "first", "feather"]]
+    )  # type: ignore
+    def test_stack_merge_rasters__multiproc(self, rasters, merge_algorithm, tmp_path) -> None:  # type: ignore
+        """Test that stacking and merging rasters tile by tile gives the same output as in memory."""
+
+        warnings.filterwarnings("ignore", category=UserWarning, message="For reprojection, nodata must be set.*")
+        warnings.filterwarnings("ignore", category=UserWarning, message="Unmasked values equal to*")
+
+        config = gu.raster.MultiprocConfig(chunk_size=max(rasters.img.width // 7, 2), outfile=tmp_path / "mosaic.tif")
+        rasters.img1.save(tmp_path / "img1.tif")
+        rasters.img2.save(tmp_path / "img2.tif")
+        # Use both loaded rasters and rasters only read by windows on disk
+        for rasters_input in [
+            [rasters.img1, rasters.img2],
+            [gu.Raster(tmp_path / "img1.tif"), gu.Raster(tmp_path / "img2.tif")],
+        ]:
+            if merge_algorithm is None:
+                mosaic = gu.raster.stack_rasters([rasters.img1, rasters.img2], progress=False)
+                mosaic_tiled = gu.raster.stack_rasters(rasters_input, progress=False, multiproc_config=config)
+            else:
+                mosaic = gu.raster.merge_rasters(
+                    [rasters.img1, rasters.img2], merge_algorithm=merge_algorithm, progress=False
+                )
+                mosaic_tiled = gu.raster.merge_rasters(
+                    rasters_input, merge_algorithm=merge_algorithm, progress=False, multiproc_config=config
+                )
+
+            # The output is written to file, and not loaded
+            assert not mosaic_tiled.is_loaded
+            assert mosaic_tiled.georeferenced_grid_equal(mosaic)
+            assert mosaic_tiled.count == mosaic.count
+            assert mosaic_tiled.dtype == mosaic.dtype
+            assert mosaic_tiled.nodata == mosaic.nodata
+            assert np.array_equal(np.ma.getmaskarray(mosaic_tiled.data), np.ma.getmaskarray(mosaic.data))
+
+            # Outputs are exactly the same on the same CRS, and reprojected values differ only slightly otherwise
+            # (due to the approximate transformer of GDAL that depends on the extent reprojected)
+            if rasters.img2.crs == rasters.img.crs:
+                assert np.ma.allequal(mosaic_tiled.data, mosaic.data)
+            else:
+                diff = np.abs(mosaic_tiled.data.astype(np.float64) - mosaic.data.astype(np.float64))
+                assert np.ma.max(diff) <= 1
+                assert np.ma.mean(diff) < 0.1
+
+        # The difference to the reference is not supported
+        with pytest.raises(ValueError, match="The difference to the reference raster is not supported*"):
+            gu.raster.stack_rasters([rasters.img1, rasters.img2], diff=True, multiproc_config=config)
+
+    def test_merge_accumulator__median(self) -> None:
+        """Test that the streaming median keeps a buffer of at most twice the maximum number of valid values."""
+
+        rng = np.random.default_rng(42)
+        layers = np.ma.masked_array(
+            rng.integers(0, 100, size=(37, 5, 6)).astype(np.uint8), mask=rng.uniform(size=(37, 5, 6)) < 0.3
+        )
+        layers[:, 0, 0] = np.ma.masked
+
+        accumulator = _MergeAccumulator("median", shape=(5, 6), dtype=np.uint8)
+        for layer in layers:
+            accumulator.update(layer)
+        merged = accumulator.result()
+
+        assert accumulator.count.dtype == np.uint32
+        assert accumulator.depth == np.max(np.sum(~np.ma.getmaskarray(layers), axis=0))
+        assert accumulator.depth <= accumulator.values.shape[0] < 2 * accumulator.depth
+        assert np.array_equal(np.ma.getmaskarray(merged), np.ma.getmaskarray(np.ma.median(layers, axis=0)))
+        assert np.ma.allclose(merged, np.ma.median(layers, axis=0))
+
+    def test_stack_merge_rasters__nonsquare(self, tmp_path) -> None:  # type: ignore
+        """Test that the mosaic of rasters with non-square pixels keeps the grid its values were reprojected on."""
+
+        warnings.filterwarnings("ignore", category=UserWarning, message="For reprojection, nodata must be set.*")
+
+        # Rasters with a Y resolution that is not a divider of the mosaic bounds (rounded to the X resolution)
+        rst = gu.Raster(gu.examples.get_path("everest_landsat_b4")).reproject(res=(30, 20))
+        rasters = [rst.icrop((0, 0, 500, rst.height)), rst.icrop((300, 0, rst.width, rst.height))]
+        config = gu.raster.MultiprocConfig(chunk_size=100, outfile=tmp_path / "mosaic.tif")
+
+        mosaic = gu.raster.merge_rasters(rasters, resampling_method="nearest", progress=False)
+        mosaic_tiled = gu.raster.merge_rasters(
+            rasters, resampling_method="nearest", progress=False, multiproc_config=config
+        )
+        stack = gu.raster.stack_rasters(rasters, resampling_method="nearest", progress=False)
+
+        # All outputs are on the grid of the reference resolution, and equal to the raster reprojected on it
+        assert mosaic.res == rst.res
+        assert mosaic_tiled.georeferenced_grid_equal(mosaic)
+        assert stack.georeferenced_grid_equal(mosaic)
+        for out in [mosaic, mosaic_tiled]:
+            assert np.ma.allequal(rst.reproject(ref=out, resampling="nearest").data, out.data)
+
     # Group rasters for for testing `load_multiple_rasters`
     # two overlapping, single band rasters
     # two overlapping, 1 and 3 band rasters
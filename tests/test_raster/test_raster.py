@@ -15,8 +15,10 @@ from io import StringIO
 from tempfile import TemporaryFile
 from typing import Any
 
+import dask.array as da
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import pytest
 import rasterio as rio
 import xarray as xr
@@ -303,6 +305,36 @@ class TestRaster:
             r.filename = None
             r.load()
 
+    @pytest.mark.parametrize("workers", [None, 1, 4])  # type: ignore
+    def test_open_many(self, workers: int | None) -> None:
+        """Test that opening many rasters in a thread pool gives the same rasters and metadata as one by one."""
+
+        paths = [self.landsat_b4_path, self.aster_dem_path, self.landsat_rgb_path, self.landsat_b4_crop_path] * 3
+
+        # Rasters are not loaded, and in the order of paths
+        rasters = gu.Raster.open_many(paths, workers=workers)
+        assert len(rasters) == len(paths)
+        for path, raster in zip(paths, rasters):
+            assert not raster.is_loaded
+            assert raster.raster_equal(gu.Raster(path))
+
+        # Keyword arguments are passed to each raster
+        rasters = gu.Raster.open_many([self.landsat_rgb_path] * 2, workers=workers, bands=1)
+        assert all(raster.bands == (1,) for raster in rasters)
+
+        # The metadata table has the same metadata
+        table = gu.Raster.open_many(paths, workers=workers, metadata_only=True)
+        assert isinstance(table, pd.DataFrame)
+        assert list(table["path"]) == paths
+        for path, (_, row) in zip(paths, table.iterrows()):
+            raster = gu.Raster(path)
+            assert rio.crs.CRS.from_wkt(row["crs"]) == raster.crs
+            assert (row["height"], row["width"]) == raster.shape
+            assert row["count"] == raster.count
+            assert row["dtype"] == raster.dtype
+            assert rio.Affine(*(row[f"transform_{c}"] for c in "abcdef")) == raster.transform
+            assert (row["nodata"] if row["has_nodata"] else None) == raster.nodata
+
     @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path, landsat_rgb_path])  # type: ignore
     def test_load_only_mask(self, example: str) -> None:
         """
@@ -613,6 +645,47 @@ class TestRaster:
             new_raster = raster + 1
         assert new_raster.data.mask[0, 0]
 
+    @pytest.mark.parametrize("dtype", ["uint8", "int32", "float32", "float64"])  # type: ignore
+    @pytest.mark.parametrize("masked", [False, True])  # type: ignore
+    def test_data_setter__number_passes(self, dtype: str, masked: bool, monkeypatch) -> None:  # type: ignore
+        """
+        Benchmark the number of passes over the data array in the data setter, by counting calls to np.isfinite.
+
+        Previously, a float array with non-finite values required three calls to np.isfinite and an integer array two.
+        """
+
+        # Wrap np.isfinite to count the number of calls
+        nb_calls = [0]
+        isfinite = np.isfinite
+
+        def isfinite_counted(*args, **kwargs):  # type: ignore
+            nb_calls[0] += 1
+            return isfinite(*args, **kwargs)
+
+        # Create an array with invalid values
+        transform = rio.transform.from_bounds(0, 0, 1, 1, 100, 100)
+        arr = np.random.default_rng(42).integers(1, 100, size=(100, 100)).astype(dtype)
+        if np.dtype(dtype).kind == "f":
+            arr[0, 0] = np.nan
+            arr[1, 1] = np.inf
+        if masked:
+            arr = np.ma.masked_array(arr, mask=np.zeros(arr.shape, dtype=bool))
+            arr.mask[2, 2] = True
+
+        monkeypatch.setattr(np, "isfinite", isfinite_counted)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Setting default nodata.*")
+            rst = gu.Raster.from_array(data=arr, transform=transform, crs=None, nodata=None)
+
+        # The array is scanned only once for floating types, and not at all for integer types
+        if np.dtype(dtype).kind == "f":
+            assert nb_calls[0] == 1
+            assert np.count_nonzero(rst.data.mask) == 2 + masked
+            assert rst.nodata is not None
+        else:
+            assert nb_calls[0] == 0
+            assert np.count_nonzero(np.ma.getmaskarray(rst.data)) == masked
+
     def test_area_or_point(self) -> None:
         """Check area or point attribute getter, setter and related warnings"""
 
@@ -869,6 +942,135 @@ class TestRaster:
         with pytest.raises(TypeError, match="downsample must be of type int or float."):
             gu.Raster(example, downsample=[1, 1])  # type: ignore
 
+    @pytest.mark.parametrize("example", [aster_dem_path, landsat_rgb_path])  # type: ignore
+    def test_lazy(self, example: str) -> None:
+        """Test that a raster opened with chunks is lazy, and equal to a loaded raster once computed."""
+
+        rst = gu.Raster(example)
+        rst_lazy = gu.Raster(example, chunks=(100, 150))
+
+        # The data is a lazy dask array, and metadata is the same as the raster on disk
+        assert rst_lazy.is_lazy
+        assert isinstance(rst_lazy.data, da.Array)
+        assert rst_lazy.data.chunksize[-2:] == (100, 150)
+        assert rst_lazy.shape == rst.shape
+        assert rst_lazy.count == rst.count
+        assert rst_lazy.dtype == rst.dtype
+        assert not rst_lazy.is_modified
+
+        # Once loaded, the raster is in memory and equal to the raster loaded directly
+        rst_lazy.load()
+        assert not rst_lazy.is_lazy
+        assert rst_lazy.raster_equal(rst)
+
+        # Chunks cannot be combined with a downsampling
+        with pytest.raises(ValueError, match="Chunks cannot be used with downsampling.*"):
+            gu.Raster(example, chunks=100, downsample=2)
+
+    def test_lazy_operations(self) -> None:
+        """Test that arithmetic, reprojection, subsampling, interpolation and saving are computed lazily."""
+
+        rst = gu.Raster(self.aster_dem_path)
+        rst_lazy = gu.Raster(self.aster_dem_path, chunks=200)
+
+        # Arithmetic
+        out_lazy = (rst_lazy + 1) * 2
+        assert out_lazy.is_lazy
+        out_lazy.load()
+        assert out_lazy.raster_equal((rst + 1) * 2)
+
+        # Reprojection
+        reproj_lazy = rst_lazy.reproject(crs=32719, resampling="nearest")
+        reproj = rst.reproject(crs=32719, resampling="nearest")
+        assert reproj_lazy.is_lazy
+        assert reproj_lazy.georeferenced_grid_equal(reproj)
+        reproj_lazy.load()
+        diff = np.ma.getmaskarray(reproj_lazy.data) != np.ma.getmaskarray(reproj.data)
+        diff |= ~np.ma.getmaskarray(reproj.data) & (reproj_lazy.data.data != reproj.data.data)
+        assert np.count_nonzero(diff) / diff.size < 0.01
+
+        # Subsampling
+        sub = rst_lazy.subsample(1000, random_state=42)
+        assert len(sub) == 1000
+        assert np.all(np.isfinite(sub))
+        indices = rst_lazy.subsample(1000, return_indices=True, random_state=42)
+        assert np.array_equal(rst.data.data[indices], sub)
+
+        # Interpolation at points, including one outside the image
+        rng = np.random.default_rng(42)
+        xs = rng.uniform(rst.bounds.left, rst.bounds.right, 100)
+        ys = rng.uniform(rst.bounds.bottom, rst.bounds.top, 100)
+        xs[0] = rst.bounds.left - 10 * rst.res[0]
+        interp_lazy = rst_lazy.interp_points((xs, ys), method="linear")
+        interp = rst.interp_points((xs, ys), method="linear")
+        assert np.isnan(interp_lazy[0])
+        valid = np.logical_and(np.isfinite(interp), np.isfinite(interp_lazy))
+        assert np.count_nonzero(valid) > 50
+        assert np.allclose(interp_lazy[valid], interp[valid], rtol=1e-5)
+
+        # Saving computes the raster chunk by chunk
+        temp_dir = tempfile.TemporaryDirectory()
+        temp_file = os.path.join(temp_dir.name, "test_lazy.tif")
+        ((rst_lazy + 1) * 2).save(temp_file)
+        assert gu.Raster(temp_file).raster_equal((rst + 1) * 2)
+
+    def test_lazy_methods(self) -> None:
+        """Test that other methods either compute a lazy raster or raise an error for unsupported arguments."""
+
+        rst = gu.Raster(self.landsat_b4_path)
+        rst.load()
+        rst_lazy = gu.Raster(self.landsat_b4_path, chunks=200)
+
+        # Equality is checked on the computed array, without loading the raster
+        assert rst_lazy.raster_equal(rst)
+        assert rst_lazy.is_lazy
+
+        # Nodata and masks are updated lazily, in the same way as for a loaded raster
+        for new_nodata, update_array in [(255, True), (0, False), (None, True)]:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", message="New nodata value cells already exist.*")
+                rst.set_nodata(new_nodata, update_array=update_array)
+            rst_lazy.set_nodata(new_nodata, update_array=update_array)
+            assert rst_lazy.is_lazy
+            assert rst_lazy.raster_equal(rst)
+        rst.set_mask(rst > 200)
+        rst_lazy.set_mask(rst_lazy > 200)
+        assert rst_lazy.is_lazy
+        assert rst_lazy.raster_equal(rst)
+
+        # Reducing and interpolating at points, including one outside the image
+        rng = np.random.default_rng(42)
+        xs = rng.uniform(rst.bounds.left, rst.bounds.right, 100)
+        ys = rng.uniform(rst.bounds.bottom, rst.bounds.top, 100)
+        xs[0] = rst.bounds.left - 10 * rst.res[0]
+        reduced_lazy = rst_lazy.reduce_points((xs, ys), window=3)
+        assert np.array_equal(reduced_lazy, rst.reduce_points((xs, ys), window=3), equal_nan=True)
+        interp_lazy = rst_lazy.interp_points((xs, ys))
+        assert interp_lazy.dtype == np.float32
+        assert np.isnan(interp_lazy[0])
+
+        # Arguments that are not supported lazily raise an error instead of being ignored
+        with pytest.raises(ValueError, match=".*'dist_nodata_spread'.*not supported for a lazy raster.*"):
+            rst_lazy.interp_points((xs, ys), dist_nodata_spread=0)
+        with pytest.raises(ValueError, match=".*'force_scipy_function'.*not supported for a lazy raster.*"):
+            rst_lazy.interp_points((xs, ys), force_scipy_function="interpn")
+
+        # Point clouds are sampled from the computed array
+        pc_lazy = rst_lazy.to_pointcloud(subsample=100, as_array=True, random_state=42)
+        assert np.array_equal(pc_lazy, rst.to_pointcloud(subsample=100, as_array=True, random_state=42))
+
+        # Loading a subset of bands, or subsampling a multi-band lazy raster
+        for bands in [2, [1, 3]]:
+            rst_rgb_lazy = gu.Raster(self.landsat_rgb_path, chunks=200)
+            rst_rgb_lazy.load(bands=bands)
+            rst_rgb = gu.Raster(self.landsat_rgb_path)
+            rst_rgb.load(bands=bands)
+            assert rst_rgb_lazy.raster_equal(rst_rgb)
+        with pytest.raises(ValueError, match="Bands .* must be among the bands of the lazy raster.*"):
+            gu.Raster(self.landsat_rgb_path, chunks=200).load(bands=4)
+        sub_lazy = gu.Raster(self.landsat_rgb_path, chunks=200).subsample(100, random_state=42)
+        assert np.array_equal(sub_lazy, gu.Raster(self.landsat_rgb_path).subsample(100, random_state=42))
+
     def test_add_sub(self) -> None:
         """
         Test addition, subtraction and negation on a Raster object.
@@ -1050,19 +1252,45 @@ class TestRaster:
         r = gu.Raster(example)
         assert not r.is_modified
 
-        # This should not trigger the hash
+        # Loading should not modify
         r.load()
         assert not r.is_modified
 
-        # This should not trigger the hash either
-        r.data = r.data + np.array([0], dtype=r.dtype)
+        # Neither should reading the data or metadata
+        _ = r.data
+        _ = r.transform
         assert not r.is_modified
 
+        # Setting the data always counts as a modification, even if the values are the same
+        r.data = r.data + np.array([0], dtype=r.dtype)
+        assert r.is_modified
+
         # This will
         r = gu.Raster(example)
         r = r + 5
         assert r.is_modified
 
+        # As will index assignment, masking, changing nodata, in-place cropping or changing the metadata
+        r = gu.Raster(example, load_data=True)
+        r[0, 0] = 1
+        assert r.is_modified
+
+        r = gu.Raster(example, load_data=True)
+        r.set_mask(np.ones(r.shape, dtype=bool))
+        assert r.is_modified
+
+        r = gu.Raster(example, load_data=True)
+        r.set_nodata(1, update_array=False, update_mask=False)
+        assert r.is_modified
+
+        r = gu.Raster(example, load_data=True)
+        r.icrop((0, 0, 10, 10), inplace=True)
+        assert r.is_modified
+
+        r = gu.Raster(example, load_data=True)
+        r.translate(1, 1, inplace=True)
+        assert r.is_modified
+
     @pytest.mark.parametrize("example", [landsat_b4_path, landsat_rgb_path, aster_dem_path])  # type: ignore
     def test_masking(self, example: str) -> None:
         """
@@ -2027,6 +2255,80 @@ class TestRaster:
             assert isnan(stat)
         assert "Statistic name '80 percentile' is not recognized" in caplog.text
 
+    @pytest.mark.parametrize("example", [landsat_b4_path, aster_dem_path])  # type: ignore
+    @pytest.mark.parametrize("chunk_size", [100, 333])  # type: ignore
+    def test_stats__multiproc(self, example: str, chunk_size: int) -> None:
+        """Check that statistics computed tile by tile are equal to those computed in memory."""
+
+        raster = gu.Raster(example)
+        config = gu.raster.MultiprocConfig(chunk_size=chunk_size)
+
+        # All statistics, computed without loading the raster
+        stats_multiproc = raster.get_stats(multiproc_config=config)
+        assert not raster.is_loaded
+        # Statistics are accumulated in double precision tile by tile, so we compare to a double precision raster
+        raster_float = raster.astype(np.float64)
+        stats = raster_float.get_stats()
+        assert stats_multiproc.keys() == stats.keys()
+        for name in stats:
+            assert np.isclose(stats_multiproc[name], stats[name], rtol=1e-10), name
+
+        # With an inlier mask
+        rng = np.random.default_rng(42)
+        inlier_mask = rng.integers(0, 2, size=raster.shape, dtype=bool)
+        stats_multiproc = raster.get_stats(inlier_mask=inlier_mask, multiproc_config=config)
+        stats = raster_float.get_stats(inlier_mask=inlier_mask)
+        assert stats_multiproc.keys() == stats.keys()
+        for name in stats:
+            assert np.isclose(stats_multiproc[name], stats[name], rtol=1e-10), name
+
+        # Selected statistics only
+        stats_multiproc = raster.get_stats(stats_name=["median", "nmad"], multiproc_config=config)
+        assert list(stats_multiproc.keys()) == ["median", "nmad"]
+        assert np.isclose(stats_multiproc["median"], raster_float.get_stats("median"))
+        assert np.isclose(stats_multiproc["nmad"], raster_float.get_stats("nmad"))
+        assert np.isclose(raster.get_stats("le90", multiproc_config=config), raster_float.get_stats("le90"))
+
+        # For a single band of a multi-band raster
+        raster_rgb = gu.Raster(self.landsat_rgb_path)
+        stats_multiproc = raster_rgb.get_stats(stats_name=["mean", "median", "std"], band=2, multiproc_config=config)
+        stats = raster_rgb.astype(np.float64).get_stats(stats_name=["mean", "median", "std"], band=2)
+        for name in stats:
+            assert np.isclose(stats_multiproc[name], stats[name], rtol=1e-10), name
+
+        # Callables are not supported
+        with pytest.raises(ValueError, match="Custom callables are not supported"):
+            raster.get_stats(stats_name=np.nanmean, multiproc_config=config)
+
+    @pytest.mark.parametrize("multiproc_config", [None, gu.raster.MultiprocConfig(chunk_size=200)])  # type: ignore
+    def test_zonal_stats(self, multiproc_config: gu.raster.MultiprocConfig | None) -> None:
+        """Check that zonal statistics are equal to statistics computed with a mask for each feature."""
+
+        raster = gu.Raster(self.landsat_b4_path)
+        vector = gu.Vector(self.everest_outlines_path)
+
+        stats = raster.zonal_stats(vector, multiproc_config=multiproc_config)
+        assert len(stats) == len(vector.ds)
+        assert (stats.index == vector.ds.index).all()
+
+        # Compare to statistics with a mask for each feature
+        for i in range(len(vector.ds)):
+            mask = gu.Vector(vector.ds.iloc[[i]]).create_mask(raster)
+            stats_feature = raster.get_stats(inlier_mask=~mask)
+            if stats_feature["Valid inlier count"] == 0:
+                assert np.isnan(stats.iloc[i]["Mean"])
+                continue
+            assert stats.iloc[i]["Valid count"] == stats_feature["Valid inlier count"]
+            assert stats.iloc[i]["Total count"] == np.count_nonzero(mask.data)
+            for name in ["Mean", "Median", "Max", "Min", "Sum", "90th percentile", "LE90", "NMAD", "RMSE"]:
+                assert np.isclose(stats.iloc[i][name], stats_feature[name]), name
+
+        # Selected statistics only, with aliases
+        stats = raster.zonal_stats(vector, stats_name=["mean", "nmad"], multiproc_config=multiproc_config)
+        assert list(stats.columns) == ["mean", "nmad"]
+        stats = raster.zonal_stats(vector, stats_name="median", multiproc_config=multiproc_config)
+        assert list(stats.columns) == ["median"]
+
 
 class TestMask:
     # Paths to example data
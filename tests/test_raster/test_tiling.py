@@ -2,15 +2,24 @@
 
 import numpy as np
 import pytest
+import rasterio as rio
 
 import geoutils as gu
 from geoutils import examples
-from geoutils.raster.tiling import _generate_tiling_grid
+from geoutils.raster.tiling import (
+    _generate_tiling_grid,
+    _get_block_offset,
+    _get_block_shape,
+    compute_tile_shape,
+    compute_tiling,
+    compute_tiling_adaptive,
+)
 
 
 class TestTiling:
 
     landsat_b4_path = examples.get_path("everest_landsat_b4")
+    aster_dem_path = examples.get_path("exploradores_aster_dem")
 
     def test_subdivide_array(self) -> None:
         test_shape = (6, 4)
@@ -105,3 +114,98 @@ class TestTiling:
 
         for col in range(nb_col_tiles - 1):
             assert tiling_grid[0, col + 1, 2] == tiling_grid[0, col, 3] - 2 * overlap
+
+    @pytest.mark.parametrize("overlap", [0, 5, 20])  # type: ignore
+    @pytest.mark.parametrize("bounds", [(0, 0, 100, 100), (0, 0, 101, 73), (10, 20, 95, 64)])  # type: ignore
+    @pytest.mark.parametrize("splits", [(50, 50), (30, 17), (200, 200)])  # type: ignore
+    def test_tiling__loop_reference(
+        self, overlap: int, bounds: tuple[int, int, int, int], splits: tuple[int, int]
+    ) -> None:
+        """Check that the tiling grid is the same as with a loop over all tiles."""
+
+        row_min, col_min, row_max, col_max = bounds
+        row_split, col_split = splits
+        tiling_grid = _generate_tiling_grid(row_min, col_min, row_max, col_max, row_split, col_split, overlap)
+
+        for row in range(tiling_grid.shape[0]):
+            for col in range(tiling_grid.shape[1]):
+                expected_tile = [
+                    max(row_min + row * row_split - overlap, 0),
+                    min(row_max, (row + 1) * row_split + overlap),
+                    max(col_min + col * col_split - overlap, 0),
+                    min(col_max, (col + 1) * col_split + overlap),
+                ]
+                assert np.array_equal(tiling_grid[row, col], expected_tile)
+
+        # Rectangular tiles can also be passed to compute the tiling
+        if bounds[:2] == (0, 0):
+            assert np.array_equal(compute_tiling(splits, (row_max, col_max), (row_max, col_max), overlap), tiling_grid)
+
+    def test_compute_tile_shape(self) -> None:
+        """Check that the adaptive tile shape fits the memory budget and is aligned with the block shape."""
+
+        memory_budget = 2**22
+        for dtype, count, overlap in [("uint8", 1, 0), ("float32", 1, 10), ("float64", 3, 50)]:
+            for block_shape in [None, (256, 256), (16, 512), (1, 3000)]:
+                tile_rows, tile_cols = compute_tile_shape(memory_budget, dtype, count, overlap, block_shape)
+
+                # The tile with its overlap fits in the memory budget
+                memory = (tile_rows + 2 * overlap) * (tile_cols + 2 * overlap) * count * (np.dtype(dtype).itemsize + 1)
+                assert memory <= memory_budget
+
+                # The tile is aligned with the blocks, unless a single block does not fit in the budget
+                if block_shape is not None:
+                    assert tile_rows % block_shape[0] == 0 or tile_rows < block_shape[0]
+                    assert tile_cols % block_shape[1] == 0 or tile_cols < block_shape[1]
+
+        # The tile does not exceed the raster shape
+        assert compute_tile_shape(memory_budget, "float32", raster_shape=(100, 50)) == (100, 50)
+
+        # A larger memory budget gives a larger tile
+        assert np.prod(compute_tile_shape(2**24, "float32")) > np.prod(compute_tile_shape(2**22, "float32"))
+
+        with pytest.raises(ValueError, match="Memory budget.*too small.*"):
+            compute_tile_shape(1000, "float32", overlap=20)
+
+    def test_compute_tiling_adaptive(self) -> None:
+        """Check the adaptive tiling on a raster file."""
+
+        rst = gu.Raster(self.aster_dem_path)
+        block_shape = _get_block_shape(rst)
+        with rio.open(self.aster_dem_path) as ds:
+            assert block_shape == ds.block_shapes[0]
+
+        tiling_grid = compute_tiling_adaptive(rst, memory_budget=2**20, overlap=5)
+
+        # Tiles cover the full raster, and tile boundaries without overlap are aligned with the blocks
+        assert tiling_grid[0, 0, 0] == 0 and tiling_grid[0, 0, 2] == 0
+        assert tiling_grid[-1, -1, 1] == rst.height and tiling_grid[-1, -1, 3] == rst.width
+        assert all((tiling_grid[1:, 0, 0] + 5) % block_shape[0] == 0)
+        assert all((tiling_grid[0, 1:, 2] + 5) % block_shape[1] == 0)
+
+        # Once loaded, there is no block layout to align with
+        rst.load()
+        assert _get_block_shape(rst) is None
+
+    def test_compute_tiling_adaptive__cropped(self, tmp_path) -> None:  # type: ignore
+        """Check that the adaptive tiling of a raster cropped lazily is aligned with the blocks of its file."""
+
+        filename = str(tmp_path / "tiled.tif")
+        gu.Raster(self.aster_dem_path).save(filename, co_opts={"TILED": "YES", "BLOCKXSIZE": "64", "BLOCKYSIZE": "64"})
+        rst = gu.Raster(filename)
+        rst_crop = rst.icrop((37, 21, 500, 600))
+        assert not rst_crop.is_loaded
+        assert _get_block_offset(rst_crop) == (21, 37)
+        assert _get_block_offset(rst) == (0, 0)
+
+        tiling_grid = compute_tiling_adaptive(rst_crop, memory_budget=2**16, overlap=5)
+
+        # Tiles cover the full raster, and tile boundaries without overlap are aligned with the blocks on disk
+        assert tiling_grid[0, 0, 0] == 0 and tiling_grid[0, 0, 2] == 0
+        assert tiling_grid[-1, -1, 1] == rst_crop.height and tiling_grid[-1, -1, 3] == rst_crop.width
+        assert all((tiling_grid[1:, 0, 0] + 5 + 21) % 64 == 0)
+        assert all((tiling_grid[0, 1:, 2] + 5 + 37) % 64 == 0)
+
+        # Tiles are contiguous
+        assert np.array_equal(tiling_grid[1:, 0, 0] + 5, tiling_grid[:-1, 0, 1] - 5)
+        assert np.array_equal(tiling_grid[0, 1:, 2] + 5, tiling_grid[0, :-1, 3] - 5)
@@ -6,7 +6,18 @@ import numpy as np
 import scipy
 
 from geoutils import Raster, examples
-from geoutils.stats import linear_error, nmad
+from geoutils.stats import (
+    _get_histogram,
+    _get_order_statistics,
+    _get_values_in_bins,
+    _locate_ranks,
+    _merge_values_in_bins,
+    _percentile_ranks,
+    _select_ranks,
+    _StatsAccumulator,
+    linear_error,
+    nmad,
+)
 
 
 class TestStats:
@@ -62,3 +73,86 @@ class TestStats:
 
         assert le90_masked == 4.5
         assert le50_masked == 2.5
+
+    def test_stats_accumulator(self) -> None:
+        """Test that merging accumulators of blocks gives the same statistics as on all values"""
+
+        rng = np.random.default_rng(42)
+        values = rng.normal(loc=1000, scale=2, size=10000)
+        blocks = np.array_split(values, [10, 500, 500, 7000])
+
+        acc = _StatsAccumulator()
+        for block in blocks:
+            acc = acc.merge(_StatsAccumulator.from_values(block))
+
+        assert acc.count == values.size
+        assert np.isclose(acc.mean, np.mean(values), rtol=1e-12)
+        assert np.isclose(acc.std, np.std(values), rtol=1e-10)
+        assert np.isclose(acc.sum, np.sum(values), rtol=1e-12)
+        assert np.isclose(acc.sum_squares, np.sum(values**2), rtol=1e-12)
+        assert np.isclose(acc.rmse, np.sqrt(np.mean(values**2)), rtol=1e-12)
+        assert acc.min == np.min(values)
+        assert acc.max == np.max(values)
+
+        # An empty accumulator returns NaNs
+        assert np.isnan(_StatsAccumulator.from_values(np.array([])).std)
+
+    def test_select_ranks(self) -> None:
+        """Test that percentiles selected exactly from histograms of blocks are equal to those of NumPy"""
+
+        rng = np.random.default_rng(42)
+        # Use repeated values to check distinct values are counted properly
+        values = np.round(rng.normal(size=9999), 2)
+        blocks = np.array_split(values, 7)
+        vmin, vmax, nb_bins = np.min(values), np.max(values), 100
+
+        percentiles = [0, 5, 50, 90, 95, 100]
+        ranks = np.unique([r for p in percentiles for r in _percentile_ranks(values.size, p)[:2]])
+
+        histogram = sum(_get_histogram(block, vmin, vmax, nb_bins) for block in blocks)
+        bins, ranks_in_bins = _locate_ranks(histogram, ranks)
+        values_in_bins: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for block in blocks:
+            values_in_bins_block = _get_values_in_bins(block, vmin, vmax, nb_bins, bins)
+            values_in_bins = _merge_values_in_bins(values_in_bins, values_in_bins_block)
+        values_at_ranks = dict(zip(ranks, _select_ranks(values_in_bins, bins, ranks_in_bins)))
+
+        for p in percentiles:
+            lower, upper, weight = _percentile_ranks(values.size, p)
+            percentile = values_at_ranks[lower] + (values_at_ranks[upper] - values_at_ranks[lower]) * weight
+            assert np.isclose(percentile, np.percentile(values, p), rtol=1e-12)
+
+    def test_get_order_statistics(self) -> None:
+        """Test that order statistics from a single partition are equal to those of the reference functions"""
+
+        values = self.landsat_raster.data.compressed().astype(np.float64)
+        order_stats = _get_order_statistics(values.copy())
+
+        assert np.isclose(order_stats["Median"], np.median(values), rtol=1e-12)
+        assert np.isclose(order_stats["90th percentile"], np.percentile(values, 90), rtol=1e-12)
+        assert np.isclose(order_stats["LE90"], linear_error(values), rtol=1e-12)
+        assert np.isclose(order_stats["NMAD"], nmad(values), rtol=1e-12)
+
+        # Only the requested statistics are computed
+        assert _get_order_statistics(values.copy(), stats_names=["NMAD", "Mean"]).keys() == {"NMAD"}
+        assert _get_order_statistics(np.array([])) == {}
+
+    def test_get_stats__inlier_mask(self) -> None:
+        """Test that statistics with an inlier mask do not modify the raster and match those of the masked data"""
+
+        raster = self.landsat_raster.copy()
+        rng = np.random.default_rng(42)
+        inlier_mask = rng.integers(0, 2, size=raster.shape, dtype=bool)
+        stats = raster.get_stats(inlier_mask=inlier_mask)
+
+        # The raster is not modified
+        assert raster.raster_equal(self.landsat_raster)
+
+        masked_data = np.ma.masked_array(raster.data, mask=np.logical_or(raster.data.mask, inlier_mask))
+        values = masked_data.compressed().astype(np.float64)
+        assert stats["Valid inlier count"] == values.size
+        assert stats["Total inlier count"] == np.count_nonzero(~inlier_mask)
+        assert np.isclose(stats["Mean"], np.mean(values), rtol=1e-12)
+        assert np.isclose(stats["Standard deviation"], np.std(values), rtol=1e-12)
+        assert np.isclose(stats["Median"], np.median(values), rtol=1e-12)
+        assert np.isclose(stats["NMAD"], nmad(values), rtol=1e-12)